@@ -577,7 +577,7 @@ class BasePlot(QwtPlot):
             items = self.items[:]
         items = [item for item in items if ISerializableType in item.types()]
         import pickle
-        pickle.dump(items, iofile)
+        pickle.dump(items, iofile, protocol=io.PICKLE_PROTOCOL)
 
     def restore_items(self, iofile):
         """
@@ -606,14 +606,16 @@ class BasePlot(QwtPlot):
         items = [item for item in items if ISerializableType in item.types()]
         io.save_items(writer, items)
         
-    def deserialize(self, reader):
+    def deserialize(self, reader, lazy=False):
         """
         Restore items from HDF5 file:
             * reader: :py:class:`guidata.hdf5io.HDF5Reader` object
+            * lazy: if True, image data is read from file only when needed
+              (see :py:func:`guiqwt.io.load_items`)
             
         See also :py:meth:`guiqwt.baseplot.BasePlot.save_items_to_hdf5`
         """
-        for item in io.load_items(reader):
+        for item in io.load_items(reader, lazy=lazy):
             self.add_item(item)
 
     def set_items(self, *args):
@@ -339,7 +339,7 @@ class PlotItemBuilder(object):
     def curve(self, x, y, title="", color=None, linestyle=None, linewidth=None,
               marker=None, markersize=None, markerfacecolor=None,
               markeredgecolor=None, shade=None, curvestyle=None, baseline=None,
-              xaxis="bottom", yaxis="left"):
+              xaxis="bottom", yaxis="left", lod=False):
         """
         Make a curve `plot item` from x, y, data
         (:py:class:`guiqwt.curve.CurveItem` object)
@@ -361,6 +361,8 @@ class PlotItemBuilder(object):
             * baseline (float: default=0.0): the baseline is needed for filling 
               the curve with a brush or the Sticks drawing style. 
             * xaxis, yaxis: X/Y axes bound to curve
+            * lod: if True, enable the level-of-detail drawing mode
+              (see :py:meth:`guiqwt.curve.CurveItem.set_lod_enabled`)
         
         Example::
             
@@ -379,7 +381,10 @@ class PlotItemBuilder(object):
         self.__set_param(param, title, color, linestyle, linewidth, marker,
                          markersize, markerfacecolor, markeredgecolor, shade,
                          curvestyle, baseline)
-        return self.pcurve(x, y, param, xaxis, yaxis)
+        curve = self.pcurve(x, y, param, xaxis, yaxis)
+        if lod:
+            curve.set_lod_enabled(True)
+        return curve
 
     def merror(self, *args, **kwargs):
         """
@@ -565,7 +570,8 @@ class PlotItemBuilder(object):
         if data is None:
             assert filename is not None
             from guiqwt import io
-            data = io.imread(filename, to_grayscale=to_grayscale)
+            # Lazy reading: memory-mapped data when file format allows it
+            data = io.imread(filename, to_grayscale=to_grayscale, lazy=True)
         if title is None and filename is not None:
             title = osp.basename(filename)
         return data, filename, title
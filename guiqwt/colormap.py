@@ -13,47 +13,30 @@ guiqwt.colormap
 
 The `colormap` module contains definition of common colormaps and tools
 to manipulate and create them
+
+Colormaps are sampled once and for all in `LUT_SIZE` ARGB colors: all 
+colormaps are stored in a single NumPy file (generated on first use in user's 
+cache directory, then memory-mapped), so that colormaps are looked up by name 
+without being rebuilt from matplotlib's data 
+(see :py:func:`get_colormap_table`)
 """
 
-from guidata.qt.QtGui import QColor, QIcon, QPixmap
+import os
+import os.path as osp
+import tempfile
+import hashlib
 
-from numpy import array, uint8, linspace, zeros, newaxis
+import numpy as np
+
+from guidata.qt.QtGui import QColor, QIcon, QPixmap
+from guidata.py3compat import is_text_string
 
 # Local imports
 from guiqwt.transitional import QwtLinearColorMap, QwtInterval, toQImage
-from guiqwt import _cm # Reuse matplotlib data
+from guiqwt import __version__
 
 
-def _interpolate(val, vmin, vmax):
-    """Interpolate a color component between to values as provided
-    by matplotlib colormaps
-    """
-    interp = (val-vmin[0])/(vmax[0]-vmin[0])
-    return (1-interp)*vmin[1] + interp*vmax[2]
-
-def _setup_colormap(cmap, cmdata):
-    """Setup a QwtLinearColorMap according to
-    matplotlib's data
-    """
-    red = array(cmdata["red"])
-    green = array(cmdata["green"])
-    blue = array(cmdata["blue"])
-    qmin = QColor()
-    qmin.setRgbF(red[ 0, 2], green[ 0, 2], blue[ 0, 2])
-    qmax = QColor()
-    qmax.setRgbF(red[-1, 2], green[-1, 2], blue[-1, 2])
-    cmap.setColorInterval( qmin, qmax )
-    indices = sorted(set(red[:, 0]) | set(green[:, 0]) | set(blue[:, 0]))
-    for i in indices[1:-1]:
-        idxr = red[:, 0].searchsorted(i)
-        idxg = green[:, 0].searchsorted(i)
-        idxb = blue[:, 0].searchsorted(i)
-        compr = _interpolate(i, red[idxr-1], red[idxr])
-        compg = _interpolate(i, green[idxg-1], green[idxg])
-        compb = _interpolate(i, blue[idxb-1], blue[idxb] )
-        col = QColor()
-        col.setRgbF(compr, compg, compb)
-        cmap.addColorStop(i, col)
+LUT_SIZE = 1024 # Number of colors of colormap tables (and image LUT)
 
 # usefull to obtain a full color map
 FULLRANGE = QwtInterval(0.0, 1.0)
@@ -61,6 +44,175 @@ FULLRANGE = QwtInterval(0.0, 1.0)
 COLORMAPS = {}
 EXTRA_COLORMAPS = [] # custom build colormaps
 
+
+#==============================================================================
+# Colormap table store
+#==============================================================================
+STORE_DTYPE = np.dtype([('name', 'S32'), ('table', '<u4', (LUT_SIZE,))])
+STORE_DIRNAME = osp.join(osp.expanduser("~"), ".guiqwt")
+
+_STORE = None # (names: indexes dictionary, memory-mapped colormap tables)
+
+def _sample_segmentdata(cmdata, size=LUT_SIZE):
+    """Return colormap table (NumPy array of `size` ARGB colors, uint32) 
+    sampled from matplotlib's segment data `cmdata`: colors are linearly 
+    interpolated between color stops (union of red, green and blue segment 
+    positions), as in a `QwtLinearColorMap` object"""
+    channels = [np.array(cmdata[color], float)
+                for color in ("red", "green", "blue")]
+    stops = np.unique(np.concatenate([channel[:, 0]
+                                      for channel in channels]))
+    positions = np.linspace(0., 1., size)
+    table = np.zeros(size, np.uint32)+np.uint32(0xff000000)
+    for shift, channel in zip((16, 8, 0), channels):
+        idx = channel[:, 0].searchsorted(stops[1:-1])
+        vmin, vmax = channel[idx-1], channel[idx]
+        interp = (stops[1:-1]-vmin[:, 0])/(vmax[:, 0]-vmin[:, 0])
+        values = np.concatenate(([channel[0, 2]],
+                                 (1-interp)*vmin[:, 1]+interp*vmax[:, 2],
+                                 [channel[-1, 2]]))
+        # Color stops have 8-bit components (QColor):
+        components = np.round(np.clip(values, 0., 1.)*255)
+        table |= (np.interp(positions, stops, components)+.5
+                  ).astype(np.uint32) << np.uint32(shift)
+    return table
+
+def _build_store():
+    """Return colormap tables of all colormaps defined in matplotlib's data 
+    (NumPy structured array, see `STORE_DTYPE`)"""
+    from guiqwt import _cm # Reuse matplotlib data
+    names = [name[1:-5] for name in dir(_cm) if name.endswith("_data")
+             and isinstance(getattr(_cm, name), dict)]
+    store = np.zeros(len(names), dtype=STORE_DTYPE)
+    for index, name in enumerate(names):
+        store['name'][index] = name.encode('ascii')
+        store['table'][index] = _sample_segmentdata(getattr(_cm,
+                                                            "_"+name+"_data"))
+    return store
+
+def _get_store_filename():
+    """Return colormap store filename (in user's cache directory): filename 
+    is keyed on a hash of colormap data module source (and guiqwt version), 
+    so that the store is regenerated when colormap data changes"""
+    md5 = hashlib.md5(("%s-%d" % (__version__, LUT_SIZE)).encode('ascii'))
+    for ext in (".py", ".pyc"):
+        # Without importing the (large) colormap data module:
+        fname = osp.join(osp.dirname(__file__), "_cm"+ext)
+        if osp.isfile(fname):
+            with open(fname, 'rb') as fobj:
+                md5.update(fobj.read())
+            break
+    return osp.join(STORE_DIRNAME, "colormaps-%s.npy" % md5.hexdigest())
+
+def _save_store(store, fname):
+    """Save colormap store to `fname`: return True if succeeded"""
+    dirname = osp.dirname(fname)
+    try:
+        if not osp.isdir(dirname):
+            os.makedirs(dirname)
+        # Writing to a temporary file first (the store may be generated
+        # by several processes at the same time):
+        fd, tmpname = tempfile.mkstemp(suffix=".npy", dir=dirname)
+        with os.fdopen(fd, 'wb') as fobj:
+            np.save(fobj, store)
+        try:
+            os.rename(tmpname, fname)
+        except OSError:
+            # Windows: another process has already saved the store
+            os.remove(tmpname)
+        return True
+    except (IOError, OSError):
+        return False
+
+def _get_store():
+    """Return colormap store: tuple (names, tables) where `names` is a 
+    dictionary (name: index) and `tables` is a memory-mapped array of 
+    colormap tables"""
+    global _STORE
+    if _STORE is None:
+        fname = _get_store_filename()
+        tables = None
+        if osp.isfile(fname):
+            try:
+                tables = np.load(fname, mmap_mode='r')
+            except (IOError, OSError, ValueError):
+                pass
+            if tables is not None and tables.dtype != STORE_DTYPE:
+                tables = None
+        if tables is None:
+            store = _build_store()
+            if _save_store(store, fname):
+                tables = np.load(fname, mmap_mode='r')
+            else:
+                # User's cache directory is not writable
+                tables = store
+        names = dict([(name.decode('ascii'), index)
+                      for index, name in enumerate(tables['name'])])
+        _STORE = names, tables
+    return _STORE
+
+def get_colormap_table(cmap):
+    """
+    Return colormap table: NumPy array of `LUT_SIZE` ARGB colors (uint32)
+    *cmap* is a colormap name or a QwtColorMap object
+    """
+    if is_text_string(cmap):
+        if cmap in EXTRA_COLORMAPS:
+            cmap = COLORMAPS[cmap]
+        else:
+            names, tables = _get_store()
+            try:
+                return tables['table'][names[cmap]]
+            except KeyError:
+                raise KeyError("Unknown colormap: %s" % cmap)
+    if isinstance(cmap, TableColorMap):
+        return cmap.table
+    return np.array([cmap.rgb(FULLRANGE, index/float(LUT_SIZE-1))
+                     for index in range(LUT_SIZE)], np.uint32)
+
+
+#==============================================================================
+# Colormaps
+#==============================================================================
+class TableColorMap(QwtLinearColorMap):
+    """
+    QwtColorMap object defined by a colormap table
+    *table* is a NumPy array of ARGB colors (uint32)
+    """
+    def __init__(self, table):
+        super(TableColorMap, self).__init__(QColor.fromRgba(int(table[0])),
+                                            QColor.fromRgba(int(table[-1])))
+        self.table = table
+    
+    def _get_index(self, interval, value):
+        """Return table index of `value` in `interval` (None if undefined)"""
+        width = interval.width()
+        if width <= 0. or value != value: # NaN
+            return
+        ratio = min(max((value-interval.minValue())/width, 0.), 1.)
+        return int(ratio*(len(self.table)-1)+.5)
+    
+    def rgb(self, interval, value):
+        """Return color (ARGB) of `value` in `interval`"""
+        index = self._get_index(interval, value)
+        if index is None:
+            return 0
+        return int(self.table[index])
+    
+    def colorIndex(self, interval, value):
+        """Return color index (in 256-color table) of `value` in `interval`"""
+        index = self._get_index(interval, value)
+        if index is None:
+            return 0
+        return int(index*255./(len(self.table)-1)+.5)
+    
+    def colorTable(self, interval):
+        """Return 256-color table (list of ARGB colors)"""
+        if not interval.isValid():
+            return [0]*256
+        indexes = np.linspace(0, len(self.table)-1, 256).round().astype(int)
+        return self.table[indexes].tolist()
+
 def get_cmap(name):
     """
     Return a QwtColormap based on matplotlib's colormap of the same name
@@ -68,12 +220,9 @@ def get_cmap(name):
     """
     if name in COLORMAPS:
         return COLORMAPS[name]
-    
-    colormap = QwtLinearColorMap()
+    colormap = TableColorMap(get_colormap_table(name))
     COLORMAPS[name] = colormap
     COLORMAPS[colormap] = name
-    data = getattr(_cm, "_"+name+"_data")
-    _setup_colormap(colormap, data)
     return colormap
 
 def get_cmap_name(cmap):
@@ -81,43 +230,39 @@ def get_cmap_name(cmap):
     return COLORMAPS.get(cmap, None)
 
 def get_colormap_list():
-    """Builds a list of available colormaps
-    by introspection of the _cm module"""
-    cmlist = []
-    cmlist += EXTRA_COLORMAPS
-    for name in dir(_cm):
-        if name.endswith("_data"):
-            obj = getattr(_cm, name)
-            if isinstance(obj, dict):
-                cmlist.append(name[1:-5])
-    return cmlist
+    """Builds a list of available colormaps"""
+    names, _tables = _get_store()
+    return EXTRA_COLORMAPS+sorted(names, key=names.get)
+
+def _build_icon_from_table(table, width=32, height=32):
+    """Builds an icon representing colormap table *table*"""
+    data = np.zeros((width, height), np.uint8)
+    line = np.linspace(0, 255, width)
+    data[:,:] = line[:, np.newaxis]
+    img = toQImage(data)
+    indexes = np.linspace(0, len(table)-1, 256).round().astype(int)
+    img.setColorTable(table[indexes].tolist())
+    return QIcon(QPixmap.fromImage(img))
 
 def build_icon_from_cmap(cmap, width=32, height=32):
     """
     Builds an icon representing the colormap
     """
-    data = zeros((width, height), uint8)
-    line = linspace(0, 255, width)
-    data[:,:] = line[:, newaxis]
-    img = toQImage(data)
-    img.setColorTable(cmap.colorTable(FULLRANGE))
-    return QIcon(QPixmap.fromImage(img))
+    return _build_icon_from_table(get_colormap_table(cmap), width, height)
     
 ICON_CACHE = {}
 def build_icon_from_cmap_name(cmap_name):
     if cmap_name in ICON_CACHE:
         return ICON_CACHE[cmap_name]
-    icon = build_icon_from_cmap(get_cmap(cmap_name))
+    icon = _build_icon_from_table(get_colormap_table(cmap_name))
     ICON_CACHE[cmap_name] = icon
     return icon
 
 def register_extra_colormap(name, colormap):
     """Add a custom colormap to the list of known colormaps
-    must be done early in the import process because
-    datasets will use get_color_map list at import time
 
     colormap is a QwtColorMap object
     """
     COLORMAPS[name] = colormap
     COLORMAPS[colormap] = name
-    EXTRA_COLORMAPS.append(name)
\ No newline at end of file
+    EXTRA_COLORMAPS.append(name)
@@ -674,6 +674,12 @@ DEFAULTS = {
              {
               "antialiasing": False,
               
+              # Cross section updates triggered by marker/shape moves are 
+              # coalesced: at most one update per interval (ms), computed in
+              # a worker thread if background mode is enabled
+              "update_interval": 20,
+              "background_update": True,
+              
               "title/font/size": 11,
               "title/font/bold": False,
               "label/font/size": 9,
@@ -40,10 +40,13 @@ Reference
 from __future__ import print_function
 
 import weakref
+import time
+import threading
+import traceback
 
 from guidata.qt.QtGui import (QVBoxLayout, QSizePolicy, QHBoxLayout, QToolBar,
                               QSpacerItem)
-from guidata.qt.QtCore import QSize, QPointF, Qt
+from guidata.qt.QtCore import QSize, QPointF, Qt, QTimer, Signal
 
 import numpy as np
 
@@ -53,14 +56,18 @@ from guidata.qthelpers import create_action, add_actions
 
 # Local imports
 from guiqwt.config import CONF, _
-from guiqwt.interfaces import ICSImageItemType, IPanel, IBasePlotItem
+from guiqwt.interfaces import (ICSImageItemType, IPanel, IBasePlotItem,
+                               IExportROIImageItemType)
 from guiqwt.panels import PanelWidget, ID_XCS, ID_YCS, ID_OCS
 from guiqwt.curve import CurvePlot, ErrorBarCurveItem
-from guiqwt.image import ImagePlot, LUT_MAX, get_image_from_qrect
+from guiqwt.image import (ImagePlot, LUT_MAX, get_image_from_qrect,
+                          get_items_in_rectangle, get_plot_qrect,
+                          compute_trimageitems_original_size)
 from guiqwt.styles import CurveParam
 from guiqwt.tools import ExportItemDataTool
 from guiqwt.geometry import translate, rotate, vector_norm, vector_angle
 from guiqwt.image import _scale_tr, INTERP_LINEAR
+from guiqwt._scaler import _average_section
 from guiqwt.plot import PlotManager
 from guiqwt.builder import make
 from guiqwt.baseplot import canvas_to_axes, axes_to_canvas
@@ -92,7 +99,20 @@ class CrossSectionItem(ErrorBarCurveItem):
             return self.source()
 
     def get_cross_section(self, obj):
-        """Get cross section data from source image"""
+        """Get cross section data from source image (None if there is 
+        nothing to compute)"""
+        func = self.prepare_cross_section(obj)
+        return None if func is None else func()
+
+    def prepare_cross_section(self, obj):
+        """
+        Return a function computing cross section data from source image
+        (the function takes no argument and returns the (x, y) tuple), or 
+        None if there is nothing to compute
+        
+        Object and plot states are read here, i.e. in the GUI thread, so that
+        the returned function may be called from a worker thread
+        """
         raise NotImplementedError
         
     def clear_data(self):
@@ -100,7 +120,12 @@ class CrossSectionItem(ErrorBarCurveItem):
         self.plot().SIG_CS_CURVE_CHANGED.emit(self)
 
     def update_curve_data(self, obj):
-        sectx, secty = self.get_cross_section(obj)
+        func = self.prepare_cross_section(obj)
+        if func is not None:
+            self.set_cross_section_data(*func())
+            
+    def set_cross_section_data(self, sectx, secty):
+        """Set curve data from cross section data"""
         if secty.size == 0 or np.all(np.isnan(secty)):
             sectx, secty = np.array([]), np.array([])
         if self.orientation() == Qt.Vertical:
@@ -115,14 +140,20 @@ class CrossSectionItem(ErrorBarCurveItem):
         """
         self.set_data(x, y, dx, dy)
 
-    def update_item(self, obj):
+    def is_updatable(self):
+        """Return True if cross section curve may be updated"""
         plot = self.plot()
-        if not plot:
-            return
-        source = self.get_source_image()
-        if source is None or not plot.isVisible():
+        return bool(plot) and self.get_source_image() is not None\
+               and plot.isVisible()
+
+    def update_item(self, obj):
+        if not self.is_updatable():
             return
         self.update_curve_data(obj)
+        self.curve_data_changed()
+            
+    def curve_data_changed(self):
+        """Cross section curve data has just been updated"""
         self.plot().SIG_CS_CURVE_CHANGED.emit(self)
         if not self.autoscale_mode:
             self.update_scale()
@@ -156,7 +187,37 @@ def get_object_coordinates(obj):
     else:
         return obj.xValue(), obj.yValue()
 
-def get_plot_x_section(obj, apply_lut=False):
+def get_plot_line_values(plot, x, y, apply_lut=False,
+                         apply_interpolation=False):
+    """
+    Return image levels sampled at plot coordinates `x`, `y` (arrays) by 
+    reading image items data directly: levels of superimposed images are 
+    added, as with the `add_images` option of 
+    :py:func:`guiqwt.image.get_image_from_plot`
+    
+    Return None if there is no supported image item along the line
+    """
+    if x.size == 0:
+        return
+    xmin, xmax, ymin, ymax = x.min(), x.max(), y.min(), y.max()
+    items = [item for item in plot.get_items(item_type=IExportROIImageItemType)
+             if item.isVisible() and item.data is not None]
+    values = None
+    for item in items:
+        xl, yt, xr, yb = item.boundingRect().normalized().getCoords()
+        if xmax < xl or xmin > xr or ymax < yt or ymin > yb:
+            continue
+        item_values = item.get_plot_values(x, y, apply_lut=apply_lut,
+                                    apply_interpolation=apply_interpolation)
+        if values is None:
+            values = np.zeros_like(item_values)
+        # Outside image and NaN levels do not contribute
+        # (same as `export_roi` behavior)
+        valid = np.isfinite(item_values)
+        values[valid] += item_values[valid]
+    return values
+
+def get_plot_x_section(obj, apply_lut=False, apply_interpolation=False):
     """
     Return plot cross section along x-axis,
     at the y value defined by 'obj', a Marker/AnnotatedPoint object
@@ -170,20 +231,27 @@ def get_plot_x_section(obj, apply_lut=False):
         yc1 = yc0+1
     else:
         yc1 = yc0-3
+    p0, p1 = QPointF(xc0, yc0), QPointF(xc1, yc1)
+    items = get_items_in_rectangle(plot, p0, p1)
+    if not items:
+        return np.array([]), np.array([])
+    src_w, _src_h = get_plot_qrect(plot, p0, p1).getRect()[2:]
+    destw, _desth = compute_trimageitems_original_size(items, src_w, 1.)
+    x0, _y0 = canvas_to_axes(obj, p0)
+    x1, _y1 = canvas_to_axes(obj, p1)
     try:
-        #TODO: eventually add an option to apply interpolation algorithm
-        data = get_image_from_qrect(plot, QPointF(xc0, yc0), QPointF(xc1, yc1),
-                                    apply_lut=apply_lut, add_images=True,
-                                    apply_interpolation=False)
-    except (ValueError, ZeroDivisionError, TypeError):
+        x = np.linspace(x0, x1, int(abs(destw)))
+    except (ValueError, ZeroDivisionError, OverflowError):
+        return np.array([]), np.array([])
+    # Sampling images data directly along the line: this is much faster than
+    # assembling an image of the whole canvas width and averaging its rows
+    y = get_plot_line_values(plot, x, np.ones_like(x)*y0, apply_lut=apply_lut,
+                             apply_interpolation=apply_interpolation)
+    if y is None:
         return np.array([]), np.array([])
-    y = data.mean(axis=0)
-    x0, _y0 = canvas_to_axes(obj, QPointF(xc0, yc0))
-    x1, _y1 = canvas_to_axes(obj, QPointF(xc1, yc1))
-    x = np.linspace(x0, x1, len(y))
     return x, y
 
-def get_plot_y_section(obj, apply_lut=False):
+def get_plot_y_section(obj, apply_lut=False, apply_interpolation=False):
     """
     Return plot cross section along y-axis,
     at the x value defined by 'obj', a Marker/AnnotatedPoint object
@@ -196,16 +264,22 @@ def get_plot_y_section(obj, apply_lut=False):
         yc1, yc0 = yc0, yc1
     xc0, _yc0 = axes_to_canvas(obj, x0, 0)
     xc1 = xc0+1
+    p0, p1 = QPointF(xc0, yc0), QPointF(xc1, yc1)
+    items = get_items_in_rectangle(plot, p0, p1)
+    if not items:
+        return np.array([]), np.array([])
+    _src_w, src_h = get_plot_qrect(plot, p0, p1).getRect()[2:]
+    _destw, desth = compute_trimageitems_original_size(items, 1., src_h)
+    _x0, y0 = canvas_to_axes(obj, p0)
+    _x1, y1 = canvas_to_axes(obj, p1)
     try:
-        data = get_image_from_qrect(plot, QPointF(xc0, yc0), QPointF(xc1, yc1),
-                                    apply_lut=apply_lut, add_images=True,
-                                    apply_interpolation=False)
-    except (ValueError, ZeroDivisionError, TypeError):
+        x = np.linspace(y0, y1, int(abs(desth)))
+    except (ValueError, ZeroDivisionError, OverflowError):
+        return np.array([]), np.array([])
+    y = get_plot_line_values(plot, np.ones_like(x)*x0, x, apply_lut=apply_lut,
+                             apply_interpolation=apply_interpolation)
+    if y is None:
         return np.array([]), np.array([])
-    y = data.mean(axis=1)
-    _x0, y0 = canvas_to_axes(obj, QPointF(xc0, yc0))
-    _x1, y1 = canvas_to_axes(obj, QPointF(xc1, yc1))
-    x = np.linspace(y0, y1, len(y))
     return x, y
 
 
@@ -272,47 +346,63 @@ class XCrossSectionItem(CrossSectionItem):
     """A Qwt item representing x-axis cross section data"""
     ORIENTATION = Qt.Horizontal
 
-    def get_cross_section(self, obj):
-        """Get x-cross section data from source image"""
+    def prepare_cross_section(self, obj):
+        """Return a function computing x-cross section data from source 
+        image (see :py:meth:`CrossSectionItem.prepare_cross_section`)"""
         source = self.get_source_image()
+        apply_lut = self.apply_lut
+        if not self.perimage_mode:
+            # Plot cross sections depend on plot canvas state:
+            # they are computed right away, in the GUI thread
+            data = self.compute_plot_cross_section(obj)
+            return lambda: data
         rect = get_rectangular_area(obj)
         if rect is None:
             # Object is a marker or an annotated point
             _x0, y0 = get_object_coordinates(obj)
-            if self.perimage_mode:
-                return source.get_xsection(y0, apply_lut=self.apply_lut)
-            else:
-                return get_plot_x_section(obj, apply_lut=self.apply_lut)
+            return lambda: source.get_xsection(y0, apply_lut=apply_lut)
         else:
-            if self.perimage_mode:
-                x0, y0, x1, y1 = rect
-                return source.get_average_xsection(x0, y0, x1, y1,
-                                                   apply_lut=self.apply_lut)
-            else:
-                return get_plot_average_x_section(obj, apply_lut=self.apply_lut)
+            x0, y0, x1, y1 = rect
+            return lambda: source.get_average_xsection(x0, y0, x1, y1,
+                                                       apply_lut=apply_lut)
+
+    def compute_plot_cross_section(self, obj):
+        """Return x-cross section data computed from all plot images"""
+        if get_rectangular_area(obj) is None:
+            return get_plot_x_section(obj, apply_lut=self.apply_lut)
+        else:
+            return get_plot_average_x_section(obj, apply_lut=self.apply_lut)
 
 class YCrossSectionItem(CrossSectionItem):
     """A Qwt item representing y-axis cross section data"""
     ORIENTATION = Qt.Vertical
 
-    def get_cross_section(self, obj):
-        """Get y-cross section data from source image"""
+    def prepare_cross_section(self, obj):
+        """Return a function computing y-cross section data from source 
+        image (see :py:meth:`CrossSectionItem.prepare_cross_section`)"""
         source = self.get_source_image()
+        apply_lut = self.apply_lut
+        if not self.perimage_mode:
+            # Plot cross sections depend on plot canvas state:
+            # they are computed right away, in the GUI thread
+            data = self.compute_plot_cross_section(obj)
+            return lambda: data
         rect = get_rectangular_area(obj)
         if rect is None:
             # Object is a marker or an annotated point
             x0, _y0 = get_object_coordinates(obj)
-            if self.perimage_mode:
-                return source.get_ysection(x0, apply_lut=self.apply_lut)
-            else:
-                return get_plot_y_section(obj, apply_lut=self.apply_lut)
+            return lambda: source.get_ysection(x0, apply_lut=apply_lut)
         else:
-            if self.perimage_mode:
-                x0, y0, x1, y1 = rect
-                return source.get_average_ysection(x0, y0, x1, y1,
-                                                   apply_lut=self.apply_lut)
-            else:
-                return get_plot_average_y_section(obj, apply_lut=self.apply_lut)
+            x0, y0, x1, y1 = rect
+            return lambda: source.get_average_ysection(x0, y0, x1, y1,
+                                                       apply_lut=apply_lut)
+
+    def compute_plot_cross_section(self, obj):
+        """Return y-cross section data computed from all plot images"""
+        if get_rectangular_area(obj) is None:
+            return get_plot_y_section(obj, apply_lut=self.apply_lut)
+        else:
+            return get_plot_average_y_section(obj, apply_lut=self.apply_lut)
 
 
 LUT_AXIS_TITLE = _("LUT scale")+(" (0-%d)" % LUT_MAX)
@@ -327,6 +417,11 @@ class CrossSectionPlot(CurvePlot):
     Z_AXIS = None
     Z_MAX_MAJOR = 5
     SHADE = .2
+    
+    # Signal emitted by the worker thread when cross section data is ready
+    # (arg: (update_id, request_time, results) tuple)
+    _SIG_CS_DATA_READY = Signal("PyQt_PyObject")
+    
     def __init__(self, parent=None):
         super(CrossSectionPlot, self).__init__(parent=parent, title="",
                                                section="cross_section")
@@ -341,6 +436,19 @@ class CrossSectionPlot(CurvePlot):
         self.known_items = {}
         self._shapes = {}
         
+        # Coalesced updates (see `request_update`)
+        self.update_interval = CONF.get("cross_section", "update_interval")
+        self.background_mode = CONF.get("cross_section", "background_update")
+        self.last_update_latency = None
+        self._pending_obj = None
+        self._request_time = None
+        self._update_id = 0
+        self._worker = None
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.timeout.connect(self._process_update_request)
+        self._SIG_CS_DATA_READY.connect(self._finish_update)
+        
         self.curveparam = CurveParam(_("Curve"), icon="curve.png")
         self.set_curve_style("cross_section", "curve")
         
@@ -457,7 +565,7 @@ class CrossSectionPlot(CurvePlot):
             self.set_axis_limits(self.CS_AXIS, vmin, vmax)
         
     def marker_changed(self, marker):
-        self.update_plot(marker)
+        self.request_update(marker)
 
     def is_shape_known(self, shape):
         for shapes in list(self._shapes.values()):
@@ -469,22 +577,16 @@ class CrossSectionPlot(CurvePlot):
     def shape_changed(self, shape):
         if self.autorefresh_mode:
             if self.is_shape_known(shape):
-                self.update_plot(shape)
+                self.request_update(shape)
             
     def get_last_obj(self):
         if self.last_obj is not None:
             return self.last_obj()
         
-    def update_plot(self, obj=None, refresh=True):
-        """
-        Update cross section curve(s) associated to object *obj*
-        
-        *obj* may be a marker or a rectangular shape
-        (see :py:class:`guiqwt.tools.CrossSectionTool` 
-        and :py:class:`guiqwt.tools.AverageCrossSectionTool`)
-        
-        If obj is None, update the cross sections of the last active object
-        """
+    def __prepare_update(self, obj):
+        """Prepare cross section curves update: return (obj, curves) tuple,
+        curves being the visible curves to be updated (return None if 
+        there is nothing to update)"""
         if obj is None:
             obj = self.get_last_obj()
             if obj is None:
@@ -496,6 +598,7 @@ class CrossSectionPlot(CurvePlot):
             return
         if self.label.isVisible():
             self.label.hide()
+        curves = []
         items = list(self.known_items.items())
         for index, (item, curve) in enumerate(iter(items)):
             if (not self.perimage_mode and index > 0) or not item.isVisible():
@@ -505,13 +608,133 @@ class CrossSectionPlot(CurvePlot):
                 curve.perimage_mode = self.perimage_mode
                 curve.autoscale_mode = self.autoscale_mode
                 curve.apply_lut = self.apply_lut
-                if refresh:
-                    curve.update_item(obj)
+                curves.append(curve)
+        return obj, curves
+        
+    def __autoscale(self):
         if self.autoscale_mode:
             self.do_autoscale(replot=True)
         elif self.lockscales:
             self.do_autoscale(replot=True, axis_id=self.Z_AXIS)
         
+    def update_plot(self, obj=None, refresh=True):
+        """
+        Update cross section curve(s) associated to object *obj*
+        
+        *obj* may be a marker or a rectangular shape
+        (see :py:class:`guiqwt.tools.CrossSectionTool` 
+        and :py:class:`guiqwt.tools.AverageCrossSectionTool`)
+        
+        If obj is None, update the cross sections of the last active object
+        """
+        # Any background update in progress is now obsolete:
+        self._update_id += 1
+        update = self.__prepare_update(obj)
+        if update is None:
+            return
+        obj, curves = update
+        if refresh:
+            for curve in curves:
+                curve.update_item(obj)
+        self.__autoscale()
+        
+    def set_update_interval(self, interval):
+        """Set minimum interval (ms) between two coalesced updates
+        (see :py:meth:`CrossSectionPlot.request_update`)"""
+        self.update_interval = interval
+        
+    def set_background_mode(self, state):
+        """Enable/disable cross section computations in a worker thread
+        (see :py:meth:`CrossSectionPlot.request_update`)"""
+        self.background_mode = state
+        
+    def get_update_latency(self):
+        """Return the latency of the last coalesced update, i.e. the time 
+        (in seconds) between the first update request and the cross section 
+        curves update (None if no update has been processed yet)"""
+        return self.last_update_latency
+        
+    def request_update(self, obj):
+        """
+        Request an update of cross section curve(s) associated to object *obj*
+        
+        Contrary to :py:meth:`CrossSectionPlot.update_plot`, this method 
+        returns immediately: requests are coalesced so that at most one update
+        is processed per update interval (`update_interval` attribute, in ms),
+        the latest request winning. In background mode (`background_mode` 
+        attribute), cross section data is computed in a worker thread.
+        """
+        self._pending_obj = weakref.ref(obj)
+        if self._request_time is None:
+            self._request_time = time.time()
+        if self._worker is None and not self._update_timer.isActive():
+            self._update_timer.start(self.update_interval)
+            
+    def _process_update_request(self):
+        """Process pending update request"""
+        obj = None
+        if self._pending_obj is not None:
+            obj = self._pending_obj()
+        self._pending_obj = None
+        request_time, self._request_time = self._request_time, None
+        if obj is None:
+            return
+        self._update_id += 1
+        update = self.__prepare_update(obj)
+        if update is None:
+            return
+        obj, curves = update
+        jobs = []
+        for curve in curves:
+            if curve.is_updatable():
+                func = curve.prepare_cross_section(obj)
+                if func is not None:
+                    jobs.append((curve, func))
+        args = (self._update_id, request_time, jobs)
+        if self.background_mode:
+            self._worker = threading.Thread(target=self._compute_jobs,
+                                            args=args)
+            self._worker.daemon = True
+            self._worker.start()
+        else:
+            self._finish_update(self._run_jobs(*args))
+
+    @staticmethod
+    def _run_jobs(update_id, request_time, jobs):
+        """Compute cross section data: may be called from a worker thread"""
+        results = []
+        for curve, func in jobs:
+            try:
+                results.append((curve, func()))
+            except Exception:
+                traceback.print_exc()
+        return update_id, request_time, results
+
+    def _compute_jobs(self, update_id, request_time, jobs):
+        """Worker thread target"""
+        data = self._run_jobs(update_id, request_time, jobs)
+        try:
+            self._SIG_CS_DATA_READY.emit(data)
+        except RuntimeError:
+            # Plot widget has been deleted in the meantime
+            pass
+            
+    def _finish_update(self, data):
+        """Update cross section curves from computed data (GUI thread)"""
+        update_id, request_time, results = data
+        self._worker = None
+        if update_id == self._update_id:
+            curves = self.get_cross_section_curves()
+            for curve, (sectx, secty) in results:
+                if curve in curves and curve.is_updatable():
+                    curve.set_cross_section_data(sectx, secty)
+                    curve.curve_data_changed()
+            self.__autoscale()
+            if request_time is not None:
+                self.last_update_latency = time.time()-request_time
+        if self._pending_obj is not None and not self._update_timer.isActive():
+            self._update_timer.start(self.update_interval)
+        
     def toggle_perimage_mode(self, state):
         self.perimage_mode = state
         self.update_plot()
@@ -835,6 +1058,13 @@ TEMP_ITEM = None
 
 def compute_oblique_section(item, obj):
     """Return oblique averaged cross section"""
+    return prepare_oblique_section(item, obj)()
+
+def prepare_oblique_section(item, obj):
+    """Return a function computing the oblique averaged cross section 
+    (function without argument, returning the (x, y) tuple): object and plot
+    states are read here so that this function may be called from a worker 
+    thread"""
     global TEMP_ITEM
     
     xa, ya, xb, yb = obj.get_bounding_rect_coords()
@@ -852,25 +1082,42 @@ def compute_oblique_section(item, obj):
     ysign = -1 if obj.plot().get_axis_direction('left') else 1
     angle = vector_angle(ix1-ix0, (iy1-iy0)*ysign)
     
-    dst_rect = (0, 0, int(destw), int(desth))
-    dst_image = np.empty((desth, destw), dtype=np.float64)
-    
-    if isinstance(item.data, np.ma.MaskedArray):
-        if item.data.dtype in (np.float32, np.float64):
-            item_data = item.data
-        else:
-            item_data = np.ma.array(item.data, dtype=np.float32, copy=True)
-        data = np.ma.filled(item_data, np.nan)
-    else:
-        data = item.data
-    
     ixr = .5*(ixb+ixa)
     iyr = .5*(iyb+iya)
     mat = translate(ixr, iyr)*rotate(-angle)*translate(-.5*destw, -.5*desth)
-    _scale_tr(data, mat, dst_image, dst_rect,
-              (1., 0., np.nan), (INTERP_LINEAR,))
 
-    if DEBUG:
+    data, mask = item.data, None
+    if isinstance(data, np.ma.MaskedArray):
+        if data.mask is not np.ma.nomask:
+            mask = np.asarray(data.mask, dtype=bool)
+        data = data.data
+
+    def compute():
+        # The averaged section is computed by walking the oblique rectangle 
+        # sample lines: the resampled image is never allocated
+        ydata = np.empty((int(desth),), dtype=np.float64)
+        _average_section(data, mat, ydata, int(destw), INTERP_LINEAR, mask)
+        return get_xydata(ydata)
+
+    def get_xydata(ydata):
+        xdata = item.get_x_values(0, ydata.size)[:ydata.size]
+        try:
+            xdata -= xdata[0]
+        except IndexError:
+            # Empty cross section
+            return np.array([]), np.array([])
+        return xdata, ydata
+
+    if not DEBUG:
+        return compute
+    else:
+        dst_rect = (0, 0, int(destw), int(desth))
+        dst_image = np.empty((int(desth), int(destw)), dtype=np.float64)
+        if mask is not None:
+            data = np.array(data, dtype=np.float64)
+            data[mask] = np.nan
+        _scale_tr(data, mat, dst_image, dst_rect,
+                  (1., 0., np.nan), (INTERP_LINEAR,))
         plot = obj.plot()
         if TEMP_ITEM is None:
             from guiqwt.builder import make
@@ -878,24 +1125,10 @@ def compute_oblique_section(item, obj):
             plot.add_item(TEMP_ITEM)
         else:
             TEMP_ITEM.set_data(dst_image)
-        if False:
-            TEMP_ITEM.imageparam.alpha_mask = True
-            xmin, ymin = ixa, iya
-            xmax, ymax = xmin+destw, ymin+desth
-            TEMP_ITEM.imageparam.xmin = xmin
-            TEMP_ITEM.imageparam.xmax = xmax
-            TEMP_ITEM.imageparam.ymin = ymin
-            TEMP_ITEM.imageparam.ymax = ymax
-            TEMP_ITEM.imageparam.update_image(TEMP_ITEM)
         plot.replot()
-    
-    ydata = np.ma.fix_invalid(dst_image, copy=DEBUG).mean(axis=1)
-    xdata = item.get_x_values(0, ydata.size)[:ydata.size]
-    try:
-        xdata -= xdata[0]
-    except IndexError:
-        print(xdata, ydata)
-    return xdata, ydata
+        ydata = np.ma.fix_invalid(dst_image, copy=True).mean(axis=1)
+        xydata = get_xydata(ydata.filled(np.nan))
+        return lambda: xydata
 
 # Oblique cross section item
 class ObliqueCrossSectionItem(CrossSectionItem):
@@ -903,16 +1136,13 @@ class ObliqueCrossSectionItem(CrossSectionItem):
     def __init__(self, curveparam=None, errorbarparam=None):
         CrossSectionItem.__init__(self, curveparam, errorbarparam)
         
-    def update_curve_data(self, obj):
+    def prepare_cross_section(self, obj):
+        """Return a function computing oblique cross section data from source 
+        image (see :py:meth:`CrossSectionItem.prepare_cross_section`)"""
         source = self.get_source_image()
         rect = obj.get_bounding_rect_coords()
         if rect is not None and source.data is not None:
-#            x0, y0, x1, y1 = rect
-#            angle = obj.get_tr_angle()
-            sectx, secty = compute_oblique_section(source, obj)
-            if secty.size == 0 or np.all(np.isnan(secty)):
-                sectx, secty = np.array([]), np.array([])
-            self.process_curve_data(sectx, secty, None, None)
+            return prepare_oblique_section(source, obj)
             
     def update_scale(self):
         pass
@@ -16,6 +16,10 @@ The `curve` module provides curve-related objects:
     * :py:class:`guiqwt.curve.CurveItem`: a curve plot item
     * :py:class:`guiqwt.curve.ErrorBarCurveItem`: a curve plot item with 
       error bars
+    * :py:class:`guiqwt.curve.StreamingCurveItem`: a curve plot item with 
+      fixed-capacity circular buffers, for streaming data
+    * :py:class:`guiqwt.curve.CurveCollectionItem`: a plot item displaying 
+      many curves (traces) sharing the same X data
     * :py:class:`guiqwt.curve.GridItem`
     * :py:class:`guiqwt.curve.ItemListWidget`: base widget implementing the 
       `plot item list panel`
@@ -96,6 +100,16 @@ Reference
 .. autoclass:: ErrorBarCurveItem
    :members:
    :inherited-members:
+.. autoclass:: StreamingCurveItem
+   :members:
+   :inherited-members:
+.. autoclass:: CurveCollectionItem
+   :members:
+   :inherited-members:
+.. autoclass:: CurveHitTestIndex
+   :members:
+.. autoclass:: CurveRangeStats
+   :members:
 .. autoclass:: PlotItemList
    :members:
 """
@@ -103,11 +117,11 @@ Reference
 from __future__ import with_statement, print_function
 
 import warnings
+import collections
 import numpy as np
 
 from guidata.qt.QtGui import (QMenu, QListWidget, QListWidgetItem, QVBoxLayout,
-                              QToolBar, QMessageBox, QBrush, QColor, QPen,
-                              QPolygonF)
+                              QToolBar, QMessageBox, QBrush, QColor, QPen)
 from guidata.qt.QtCore import Qt, QPointF, QLineF, QRectF, Signal
 
 from guidata.utils import assert_interfaces_valid, update_dataset
@@ -117,32 +131,65 @@ from guidata.py3compat import is_text_string, maxsize
 
 # Local imports
 from guiqwt.transitional import (QwtPlotCurve, QwtPlotGrid, QwtPlotItem,
-                                 QwtScaleMap)
+                                 QwtSymbol)
 from guiqwt.config import CONF, _
 from guiqwt.interfaces import (IBasePlotItem, IDecoratorItemType,
                                ISerializableType, ICurveItemType,
-                               ITrackableItemType, IPanel)
+                               ICurveCollectionItemType, ITrackableItemType,
+                               IPanel)
 from guiqwt.panels import PanelWidget, ID_ITEMLIST
 from guiqwt.baseplot import BasePlot, canvas_to_axes
+from guiqwt.geometry import array_to_polygon, array_to_point_pairs
 from guiqwt.styles import GridParam, CurveParam, ErrorBarParam, SymbolParam
 from guiqwt.shapes import Marker
 
-def _simplify_poly(pts, off, scale, bounds):
+def _get_polygon_ranges(off, npts):
+    """Return start and end indexes of polygons from offsets array *off*"""
+    starts = np.asarray(off[:, 1], dtype=int)
+    ends = np.concatenate((starts[1:], [npts]))
+    return starts, ends
+
+def _get_simplified_polygons(pts, off, ax, ay, tolerance=1.):
+    """
+    Return polygons simplified for scale factors (ax, ay): consecutive 
+    vertices falling into the same cell of a grid of *tolerance* pixels 
+    are merged (polygon first and last vertices are always kept)
+    
+    Return (points, starts, ends) where points are the remaining vertices
+    (in plot coordinates) and polygon i vertices are points[starts[i]:ends[i]]
+    """
+    npts = pts.shape[0]
+    starts, ends = _get_polygon_ranges(off, npts)
+    nonempty = ends > starts
+    cells = np.floor(pts*np.array([[ax, ay]])/tolerance)
+    keep = np.ones(npts, dtype=bool)
+    keep[1:] = np.any(cells[1:] != cells[:-1], axis=1)
+    keep[starts[nonempty]] = True
+    keep[ends[nonempty]-1] = True
+    cumkeep = np.concatenate(([0], np.cumsum(keep)))
+    return pts[keep], cumkeep[starts], cumkeep[ends]
+
+def _cull_polygons(pts, starts, ends, scale, bounds):
+    """Return list of (polygon points, polygon index) in canvas coordinates
+    for polygons which bounding box intersects canvas *bounds*"""
     ax, bx, ay, by = scale
     xm, ym, xM, yM = bounds
-    a = np.array( [[ax, ay]] )
-    b = np.array( [[bx, by]] )
-    _pts = a*pts+b
-    poly = []
-    NP = off.shape[0]
-    for i in range(off.shape[0]):
-        i0 = off[i, 1]
-        if i+1<NP:
-            i1 = off[i+1, 1]
-        else:
-            i1 = pts.shape[0]
-        poly.append( (_pts[i0:i1], i) )
-    return poly
+    _pts = np.array([[ax, ay]])*pts+np.array([[bx, by]])
+    nonempty = np.flatnonzero(ends > starts)
+    if nonempty.size == 0:
+        return []
+    pstarts = starts[nonempty]
+    x, y = _pts[:, 0], _pts[:, 1]
+    visible = np.logical_and.reduce((np.maximum.reduceat(x, pstarts) >= xm,
+                                     np.minimum.reduceat(x, pstarts) <= xM,
+                                     np.maximum.reduceat(y, pstarts) >= ym,
+                                     np.minimum.reduceat(y, pstarts) <= yM))
+    return [(_pts[starts[i]:ends[i]], i) for i in nonempty[visible]]
+
+def _simplify_poly(pts, off, scale, bounds):
+    ax, bx, ay, by = scale
+    spts, starts, ends = _get_simplified_polygons(pts, off, ax, ay)
+    return _cull_polygons(spts, starts, ends, scale, bounds)
 
 try:
     from gshhs import simplify_poly
@@ -193,6 +240,362 @@ def seg_dist_v(P, X0, Y0, X1, Y1):
     ix = distances.argmin()
     return ix, distances[ix]
 
+def _get_minmax_indexes(cols, y):
+    """
+    Return indexes of the first, last, minimum and maximum samples of each
+    pixel column (min/max level-of-detail decimation)
+    cols: pixel column of each sample (monotonic NumPy array)
+    y: sample values (NumPy array)
+    """
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(cols))+1))
+    ends = np.concatenate((starts[1:], [cols.size]))-1
+    groups = np.repeat(np.arange(starts.size), ends-starts+1)
+    def first_index(mask):
+        idx = np.flatnonzero(mask)
+        grp = groups[idx]
+        return idx[np.concatenate(([True], grp[1:] != grp[:-1]))]
+    imin = first_index(y == np.minimum.reduceat(y, starts)[groups])
+    imax = first_index(y == np.maximum.reduceat(y, starts)[groups])
+    ind = np.sort(np.column_stack((starts, imin, imax, ends)), axis=1).ravel()
+    return ind[np.concatenate(([True], np.diff(ind) != 0))]
+
+def _get_minmax_indexes_2d(cols, y):
+    """
+    Return indexes of the first, last, minimum and maximum samples of each
+    pixel column, for each row of 2D array *y* (min/max level-of-detail
+    decimation of traces sharing the same X data)
+    cols: pixel column of each sample (monotonic NumPy array)
+    y: sample values (2D NumPy array, one trace per row)
+    Returns an array of shape (rows, 4*columns), sorted along each row
+    """
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(cols))+1))
+    ends = np.concatenate((starts[1:], [cols.size]))-1
+    counts = ends-starts+1
+    samples = np.arange(cols.size)
+    def first_index(extrema):
+        mask = y == np.repeat(extrema, counts, axis=1)
+        ind = np.minimum.reduceat(np.where(mask, samples, cols.size),
+                                  starts, axis=1)
+        return np.minimum(ind, ends) # NaN-only pixel columns
+    ind = np.empty((y.shape[0], starts.size, 4), dtype=int)
+    ind[..., 0] = starts
+    ind[..., 1] = first_index(np.minimum.reduceat(y, starts, axis=1))
+    ind[..., 2] = first_index(np.maximum.reduceat(y, starts, axis=1))
+    ind[..., 3] = ends
+    return np.sort(ind, axis=2).reshape(y.shape[0], -1)
+
+def _get_finite_bounds(vmin, vmax):
+    """
+    Return (minimum, maximum, minimum positive value) of finite values of 
+    arrays *vmin* and *vmax* (minimum positive value is None if there is none)
+    """
+    vmin = vmin[np.isfinite(vmin)]
+    vmax = vmax[np.isfinite(vmax)]
+    vpos = vmin[vmin > 0]
+    return vmin.min(), vmax.max(), vpos.min() if vpos.size else None
+
+def _get_scale_map_coefs(scale_map):
+    """Return coefficients (a, b) such that canvas coordinates are obtained
+    from scale coordinates (i.e. transformed data) with a*value+b"""
+    tr = scale_map.transformation()
+    s1, s2 = scale_map.s1(), scale_map.s2()
+    if tr is not None:
+        s1, s2 = tr.transform(s1), tr.transform(s2)
+    a = 1.
+    if s1 != s2:
+        a = (scale_map.p2()-scale_map.p1())/(s2-s1)
+    return a, scale_map.p1()-a*s1
+
+def seg_dist_array(px, py, X0, Y0, X1, Y1):
+    """Return distances between point (px, py) and segments (X0, Y0, X1, Y1)
+    (NumPy arrays)"""
+    dx, dy = X1-X0, Y1-Y0
+    l2 = dx**2+dy**2
+    t = np.zeros_like(l2)
+    nz = l2 > 0
+    t[nz] = (((px-X0)*dx+(py-Y0)*dy)[nz]/l2[nz]).clip(0, 1)
+    return np.hypot(X0+t*dx-px, Y0+t*dy-py)
+
+class CurveHitTestIndex(object):
+    """
+    Spatial index of curve segments for nearest segment queries
+    
+    Segments are indexed in scale coordinates (i.e. after axis scale 
+    transformation: identity or logarithm), so that the index remains valid 
+    when zooming or panning: queries rely on a binary search when X data 
+    is monotonic, and on a uniform grid of segment middles otherwise.
+    
+    x, y: curve data (NumPy arrays)
+    xtr, ytr: X/Y axis scale transformations (None for linear scales)
+    """
+    BLOCK_SIZE = 256
+    
+    def __init__(self, x, y, xtr=None, ytr=None):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            u = np.asarray(x if xtr is None else xtr.transform(x), float)
+            v = np.asarray(y if ytr is None else ytr.transform(y), float)
+        valid = np.logical_and(np.isfinite(u), np.isfinite(v))
+        self.indexes = np.flatnonzero(valid)
+        self.u, self.v = u[valid], v[valid]
+        self.monotonic = bool(np.all(np.diff(self.u) >= 0))
+        self.grid = self.blocks = None
+        if self.monotonic:
+            self.__build_blocks()
+        else:
+            self.__build_grid()
+
+    def __build_blocks(self):
+        u, v = self.u, self.v
+        nseg = u.size-1
+        if nseg <= 0:
+            return
+        starts = np.arange(0, nseg, self.BLOCK_SIZE)
+        ends = np.minimum(starts+self.BLOCK_SIZE, nseg)
+        vmin = np.minimum(np.minimum.reduceat(v[:-1], starts), v[ends])
+        vmax = np.maximum(np.maximum.reduceat(v[:-1], starts), v[ends])
+        self.blocks = (u[starts], u[ends], vmin, vmax)
+
+    def __build_grid(self):
+        u, v = self.u, self.v
+        du, dv = np.fabs(np.diff(u)), np.fabs(np.diff(v))
+        nseg = du.size
+        cell_sizes = []
+        for data, delta in ((u, du), (v, dv)):
+            size = max((data.max()-data.min())/np.sqrt(nseg),
+                       np.percentile(delta, 90))
+            cell_sizes.append(size if size > 0 else 1.)
+        cw, ch = cell_sizes
+        umin, vmin = u.min(), v.min()
+        nu = int((u.max()-umin)/cw)+1
+        nv = int((v.max()-vmin)/ch)+1
+        # Segments larger than a cell are always tested
+        large = np.logical_or(du > cw, dv > ch)
+        self.overflow = np.flatnonzero(large)
+        segs = np.flatnonzero(~large)
+        ci = ((.5*(u[segs]+u[segs+1])-umin)/cw).astype(int).clip(0, nu-1)
+        cj = ((.5*(v[segs]+v[segs+1])-vmin)/ch).astype(int).clip(0, nv-1)
+        cells = ci*nv+cj
+        order = cells.argsort(kind='mergesort')
+        self.order = segs[order]
+        self.starts = cells[order].searchsorted(np.arange(nu*nv+1))
+        self.grid = (umin, vmin, cw, ch, nu, nv)
+
+    def __nearest_segment(self, segs, px, py, coefs):
+        """Return nearest segment to canvas point (px, py) among *segs*"""
+        ax, bx, ay, by = coefs
+        u, v = self.u, self.v
+        dist = seg_dist_array(px, py, ax*u[segs]+bx, ay*v[segs]+by,
+                          ax*u[segs+1]+bx, ay*v[segs+1]+by)
+        i = dist.argmin()
+        return dist[i], segs[i]
+
+    def __nearest_block_segment(self, i0, i1, px, py, coefs, dist, iseg):
+        """Return nearest segment to canvas point (px, py) among segments
+        [i0, i1[, visiting blocks by increasing bounding box distance"""
+        ax, bx, ay, by = coefs
+        size = self.BLOCK_SIZE
+        k0, k1 = i0//size, (i1-1)//size+1
+        bounds = [a*data[k0:k1]+b for data, a, b in
+                  zip(self.blocks, (ax, ax, ay, ay), (bx, bx, by, by))]
+        x0, x1 = np.minimum(*bounds[:2]), np.maximum(*bounds[:2])
+        y0, y1 = np.minimum(*bounds[2:]), np.maximum(*bounds[2:])
+        gaps = np.hypot(np.maximum(np.maximum(x0-px, px-x1), 0),
+                        np.maximum(np.maximum(y0-py, py-y1), 0))
+        for k in gaps.argsort():
+            if gaps[k] >= dist:
+                break
+            start = (k0+k)*size
+            segs = np.arange(max(start, i0), min(start+size, i1))
+            d, i = self.__nearest_segment(segs, px, py, coefs)
+            if d < dist:
+                dist, iseg = d, i
+        return dist, iseg
+
+    def __get_cells_segments(self, ci, cj, r0, r1):
+        """Return segments of grid cells (ci+i, cj+j) such that
+        r0 <= max(|i|, |j|) <= r1"""
+        _umin, _vmin, _cw, _ch, nu, nv = self.grid
+        ii, jj = np.meshgrid(np.arange(max(ci-r1, 0), min(ci+r1+1, nu)),
+                             np.arange(max(cj-r1, 0), min(cj+r1+1, nv)),
+                             indexing='ij')
+        ring = np.maximum(np.abs(ii-ci), np.abs(jj-cj)) >= r0
+        cells = (ii*nv+jj)[ring]
+        starts = self.starts[cells]
+        counts = self.starts[cells+1]-starts
+        total = counts.sum()
+        if total == 0:
+            return None
+        offsets = np.repeat(starts-np.cumsum(counts)+counts, counts)
+        return self.order[offsets+np.arange(total)]
+
+    def query(self, px, py, coefs):
+        """
+        Return (distance, index) of the nearest segment to canvas point 
+        (px, py), index being the curve data index of segment first point
+        coefs: (ax, bx, ay, by) canvas coordinates are ax*u+bx, ay*v+by
+        """
+        ax, bx, ay, by = coefs
+        npts = self.u.size
+        if npts == 0 or ax == 0 or ay == 0:
+            return maxsize, 0
+        if npts == 1:
+            dist = np.hypot(ax*self.u[0]+bx-px, ay*self.v[0]+by-py)
+            return dist, self.indexes[0]
+        pu = (px-bx)/ax
+        if self.monotonic:
+            i = self.u.searchsorted(pu)
+            segs = np.arange(max(i-2, 0), min(i+1, npts-1))
+            dist, iseg = self.__nearest_segment(segs, px, py, coefs)
+            # Closer segments are within [pu-du, pu+du] X range:
+            du = dist/abs(ax)
+            i0 = max(self.u.searchsorted(pu-du, side='left')-1, 0)
+            i1 = min(self.u.searchsorted(pu+du, side='right'), npts-1)
+            if i1-i0 > 4*self.BLOCK_SIZE:
+                dist, iseg = self.__nearest_block_segment(i0, i1, px, py,
+                                                          coefs, dist, iseg)
+            elif i1-i0 > segs.size:
+                dist, iseg = self.__nearest_segment(np.arange(i0, i1),
+                                                    px, py, coefs)
+        else:
+            pv = (py-by)/ay
+            umin, vmin, cw, ch, nu, nv = self.grid
+            ci, cj = int(np.floor((pu-umin)/cw)), int(np.floor((pv-vmin)/ch))
+            dist, iseg = maxsize, 0
+            if self.overflow.size:
+                dist, iseg = self.__nearest_segment(self.overflow,
+                                                    px, py, coefs)
+            # Radius from which grid cells are not empty:
+            r0 = max(ci-nu+1, -ci, cj-nv+1, -cj, 0)
+            r1 = max(r0, 1)
+            rmax = max(ci, nu-1-ci, cj, nv-1-cj)
+            step = min(abs(ax)*cw, abs(ay)*ch)
+            while True:
+                segs = self.__get_cells_segments(ci, cj, r0, r1)
+                if segs is not None:
+                    d, i = self.__nearest_segment(segs, px, py, coefs)
+                    if d < dist:
+                        dist, iseg = d, i
+                # Segments of other cells are at least that far:
+                if r1 >= rmax or step*(r1-.5) >= dist:
+                    break
+                r0, r1 = r1+1, 2*r1
+        return dist, self.indexes[iseg]
+
+class CurveRangeStats(object):
+    """
+    Statistics of curve data over any index range [i0, i1[, computed in 
+    (almost) constant time from cumulative sums (y, trapezoidal integrals) 
+    and from per-block values (minimum/maximum, mean and sum of squared 
+    deviations): results are the same as the NumPy functions applied to 
+    data slices (NaN values included)
+    
+    x, y: curve data (NumPy arrays)
+    """
+    BLOCK_SIZE = 256
+    STATISTICS = ('xrange', 'yrange', 'mean', 'std', 'trapz', 'integral')
+    
+    def __init__(self, x, y):
+        self.x = x = np.asarray(x, dtype=float)
+        self.y = y = np.asarray(y, dtype=float)
+        starts = np.arange(0, y.size, self.BLOCK_SIZE)
+        self._blocks = {}
+        for name, values in (('x', x), ('y', y)):
+            if values.size:
+                self._blocks[name] = (np.minimum.reduceat(values, starts),
+                                      np.maximum.reduceat(values, starts))
+        # NaN values are counted (and replaced by zeros) in order to keep 
+        # cumulative sums valid after the first NaN:
+        ynan = np.isnan(y)
+        xynan = np.logical_or(ynan, np.isnan(x))
+        self._ynan = np.concatenate(([0], np.cumsum(ynan)))
+        self._xynan = np.concatenate(([0], np.cumsum(xynan)))
+        yf = np.where(ynan, 0., y)
+        # Centering data limits the loss of precision of variance:
+        self._offset = yf.mean() if yf.size else 0.
+        yc = yf-self._offset
+        self._sum = np.concatenate(([0.], np.cumsum(yc)))
+        # Per-block means and sums of squared deviations: variance is not 
+        # computed from cumulative sums of y² (cancellation on drifting data)
+        if y.size:
+            counts = np.diff(np.append(starts, y.size))
+            self._bmean = np.add.reduceat(yf, starts)/counts
+            self._bm2 = np.add.reduceat((yf-np.repeat(self._bmean,
+                                                      counts))**2, starts)
+        self._trapz = np.concatenate(([0.], np.cumsum(.5*(yf[1:]+yf[:-1]))))
+        xf = np.where(xynan, 0., x)
+        yf = np.where(xynan, 0., y)
+        self._integral = np.concatenate(([0.], np.cumsum(
+                                    .5*(yf[1:]+yf[:-1])*np.diff(xf))))
+    
+    def _get_extremum(self, name, func, i0, i1):
+        """Return minimum (func=np.min) or maximum (func=np.max) of 
+        x (name='x') or y (name='y') values within range [i0, i1["""
+        values = getattr(self, name)
+        blocks = self._blocks[name][func is np.max]
+        bsize = self.BLOCK_SIZE
+        b0, b1 = -(-i0//bsize), i1//bsize # Blocks fully included in range
+        if b0 >= b1:
+            return func(values[i0:i1])
+        return func(np.concatenate((values[i0:b0*bsize], blocks[b0:b1],
+                                    values[b1*bsize:i1])))
+    
+    def xrange(self, i0, i1):
+        """Return minimum and maximum x values within range [i0, i1["""
+        return (self._get_extremum('x', np.min, i0, i1),
+                self._get_extremum('x', np.max, i0, i1))
+    
+    def yrange(self, i0, i1):
+        """Return minimum and maximum y values within range [i0, i1["""
+        return (self._get_extremum('y', np.min, i0, i1),
+                self._get_extremum('y', np.max, i0, i1))
+    
+    def mean(self, i0, i1):
+        """Return mean of y values within range [i0, i1["""
+        if self._ynan[i1] > self._ynan[i0]:
+            return np.nan
+        return (self._sum[i1]-self._sum[i0])/(i1-i0)+self._offset
+    
+    def std(self, i0, i1):
+        """Return standard deviation of y values within range [i0, i1["""
+        if self._ynan[i1] > self._ynan[i0]:
+            return np.nan
+        bsize = self.BLOCK_SIZE
+        b0, b1 = -(-i0//bsize), i1//bsize # Blocks fully included in range
+        if b0 >= b1:
+            return np.std(self.y[i0:i1])
+        # Combining partial and full blocks statistics (parallel algorithm):
+        head, tail = self.y[i0:b0*bsize], self.y[b1*bsize:i1]
+        counts = np.concatenate(([head.size], [bsize]*(b1-b0), [tail.size]))
+        means = np.concatenate(([head.mean() if head.size else 0.],
+                                self._bmean[b0:b1],
+                                [tail.mean() if tail.size else 0.]))
+        m2 = (((head-means[0])**2).sum()+self._bm2[b0:b1].sum()
+              +((tail-means[-1])**2).sum())
+        mean = np.dot(counts, means)/(i1-i0)
+        return np.sqrt((m2+np.dot(counts, (means-mean)**2))/(i1-i0))
+    
+    def trapz(self, i0, i1):
+        """Return trapezoidal integral of y values (unit spacing)
+        within range [i0, i1["""
+        if self._ynan[i1] > self._ynan[i0]:
+            return np.nan
+        return self._trapz[i1-1]-self._trapz[i0]
+    
+    def integral(self, i0, i1):
+        """Return trapezoidal integral of y values along x 
+        within range [i0, i1["""
+        if self._xynan[i1] > self._xynan[i0]:
+            return np.nan
+        return self._integral[i1-1]-self._integral[i0]
+    
+    def compute(self, statistic, i0, i1):
+        """Return *statistic* (one of the names listed in `STATISTICS`)
+        of curve data within (non-empty) range [i0, i1["""
+        assert statistic in self.STATISTICS, \
+               "Unknown statistic %r" % statistic
+        return getattr(self, statistic)(i0, i1)
+
 def test_seg_dist_v():
     """Test de seg_dist_v"""
     a=(np.arange(10.)**2).reshape(5, 2)
@@ -201,14 +604,36 @@ def test_seg_dist_v():
     print(ix, dist)
     assert ix == 0
 
+def test_range_stats():
+    """Test CurveRangeStats (comparing with NumPy functions)"""
+    x = np.linspace(0., 1e4, 100000)
+    for y in (np.random.normal(size=x.size),
+              x+np.random.normal(size=x.size)): # drifting data
+        stats = CurveRangeStats(x, y)
+        for i0, i1 in ((0, x.size), (10, 20), (100, 90000), (777, 5000)):
+            yi = y[i0:i1]
+            for value, expected in ((stats.mean(i0, i1), yi.mean()),
+                                    (stats.std(i0, i1), yi.std())):
+                assert abs(value-expected) <= 1e-9*abs(expected), \
+                       (i0, i1, value, expected)
+
 if __name__ == "__main__":
     test_seg_dist_v()
     test_seg_dist()
+    test_range_stats()
 
 
-SELECTED_SYMBOL_PARAM = SymbolParam()
-SELECTED_SYMBOL_PARAM.read_config(CONF, "plot", "selected_curve_symbol")
-SELECTED_SYMBOL = SELECTED_SYMBOL_PARAM.build_symbol()
+SELECTED_SYMBOL = None # Built on first use (see `_get_selected_symbol`)
+
+def _get_selected_symbol():
+    """Return the symbol of selected curves (built from configuration on first
+    call, not when importing this module)"""
+    global SELECTED_SYMBOL
+    if SELECTED_SYMBOL is None:
+        param = SymbolParam()
+        param.read_config(CONF, "plot", "selected_curve_symbol")
+        SELECTED_SYMBOL = param.build_symbol()
+    return SELECTED_SYMBOL
 
 
 class GridItem(QwtPlotGrid):
@@ -338,28 +763,69 @@ class CurveItem(QwtPlotCurve):
         self.immutable = True # set to false to allow moving points around
         self._x = None
         self._y = None
+        self._data_version = 0
+        self._lod_enabled = False
+        self._lod_cache = None
+        self._x_monotonic = None
+        self._hit_index = None
+        self._bounds = None
+        self._range_stats = None
         self.update_params()
         
-    def _get_visible_axis_min(self, axis_id, axis_data):
-        """Return axis minimum excluding zero and negative values when
-        corresponding plot axis scale is logarithmic"""
-        if self.plot().get_axis_scale(axis_id) == 'log':
-            return axis_data[axis_data > 0].min()
-        else:
-            return axis_data.min()
-        
+    def get_bounds(self):
+        """
+        Return finite data bounds and minimum positive values (i.e. visible 
+        with a logarithmic scale) as a tuple: 
+        (xmin, xmax, xposmin, ymin, ymax, yposmin), or None if there is no 
+        finite data (result is cached until curve data changes)
+        """
+        if self._bounds is None or self._bounds[0] != self._data_version:
+            self._bounds = self._data_version, self._compute_bounds()
+        return self._bounds[1]
+
+    def get_data_version(self):
+        """Return curve data version number (incremented each time 
+        curve data changes)"""
+        return self._data_version
+
+    def get_range_stats(self):
+        """
+        Return range statistics of curve data
+        (:py:class:`guiqwt.curve.CurveRangeStats` object, built on first 
+        call and kept until curve data changes)
+        """
+        if self._range_stats is None or\
+           self._range_stats[0] != self._data_version:
+            x, y = self.get_data()[:2]
+            self._range_stats = self._data_version, CurveRangeStats(x, y)
+        return self._range_stats[1]
+
+    def _compute_bounds(self):
+        """Compute bounds returned by `get_bounds` (None if there is no 
+        finite data)"""
+        if self._x is None or self._y is None or self._x.size == 0:
+            return
+        finite = np.logical_and(np.isfinite(self._x), np.isfinite(self._y))
+        if not finite.any():
+            return
+        xf, yf = self._x[finite], self._y[finite]
+        return _get_finite_bounds(xf, xf)+_get_finite_bounds(yf, yf)
+
     def boundingRect(self):
         """Return the bounding rectangle of the data"""
+        bounds = self.get_bounds()
+        if bounds is None:
+            return QRectF(1., 1., -2., -2.)
+        xmin, xmax, xposmin, ymin, ymax, yposmin = bounds
         plot = self.plot()
-        if plot is not None and 'log' in (plot.get_axis_scale(self.xAxis()),
-                                          plot.get_axis_scale(self.yAxis())):
-            x, y = self._x, self._y
-            xf, yf = x[np.isfinite(x)], y[np.isfinite(y)]
-            xmin = self._get_visible_axis_min(self.xAxis(), xf)
-            ymin = self._get_visible_axis_min(self.yAxis(), yf)
-            return QRectF(xmin, ymin, xf.max()-xmin, yf.max()-ymin)
-        else:
-            return QwtPlotCurve.boundingRect(self)
+        if plot is not None:
+            if xposmin is not None and\
+               plot.get_axis_scale(self.xAxis()) == 'log':
+                xmin = xposmin
+            if yposmin is not None and\
+               plot.get_axis_scale(self.yAxis()) == 'log':
+                ymin = yposmin
+        return QRectF(xmin, ymin, xmax-xmin, ymax-ymin)
         
     def types(self):
         return (ICurveItemType, ITrackableItemType, ISerializableType)
@@ -447,7 +913,7 @@ class CurveItem(QwtPlotCurve):
         plot = self.plot()
         if plot is not None:
             plot.blockSignals(True)
-        self.setSymbol(SELECTED_SYMBOL)
+        self.setSymbol(_get_selected_symbol())
         if plot is not None:
             plot.blockSignals(False)
         self.invalidate_plot()
@@ -471,51 +937,118 @@ class CurveItem(QwtPlotCurve):
         """
         self._x = np.array(x, copy=False)
         self._y = np.array(y, copy=False)
-        self.setData(self._x, self._y)
+        self._update_data()
         
+    def _update_data(self):
+        """Update curve series from x, y arrays and invalidate data caches"""
+        self._data_version += 1
+        self._lod_cache = None
+        self._x_monotonic = None
+        self._hit_index = None
+        self.setData(self._x, self._y)
+
     def is_empty(self):
         """Return True if item data is empty"""
         return self._x is None or self._y is None or self._y.size == 0
 
+    def set_lod_enabled(self, state):
+        """
+        Enable or disable the level-of-detail (LOD) mode: when enabled, the
+        curve is drawn from the first, last, minimum and maximum samples of
+        each visible pixel column instead of the whole data set
+        (only applies to solid lines without symbols, nor shade, and to
+        monotonic X data)
+        """
+        self._lod_enabled = state
+        self._lod_cache = None
+        self.invalidate_plot()
+
+    def is_lod_enabled(self):
+        """Return True if the level-of-detail (LOD) mode is enabled"""
+        return self._lod_enabled
+
+    def _is_lod_applicable(self):
+        """Return True if the LOD mode may be used to draw the curve without
+        changing the rendered image"""
+        symbol = self.symbol()
+        return self._lod_enabled and self.style() == QwtPlotCurve.Lines\
+               and self.pen().style() == Qt.SolidLine\
+               and self.brush().style() == Qt.NoBrush\
+               and (symbol is None or symbol.style() == QwtSymbol.NoSymbol)
+
+    def get_lod_data(self, xMap):
+        """
+        Return decimated curve data (x, y) for scale map *xMap*,
+        or None if curve has to be drawn from the whole data set
+        (result is cached until X scale, canvas width or data change)
+        """
+        plot = self.plot()
+        xscale = None if plot is None else plot.get_axis_scale(self.xAxis())
+        key = (xMap.s1(), xMap.s2(), xMap.p1(), xMap.p2(), xscale,
+               self._data_version)
+        if self._lod_cache is not None and self._lod_cache[0] == key:
+            return self._lod_cache[1]
+        series = self.data()
+        x, y = series.xData(), series.yData()
+        if self._x_monotonic is None:
+            self._x_monotonic = bool(np.all(np.diff(x) >= 0))
+        lod_data = None
+        if self._x_monotonic and x.size:
+            smin, smax = sorted((xMap.s1(), xMap.s2()))
+            i0 = max(x.searchsorted(smin, side='left')-1, 0)
+            i1 = min(x.searchsorted(smax, side='right')+1, x.size)
+            ncols = abs(xMap.p2()-xMap.p1())+1
+            if i1-i0 > 4*ncols:
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore", category=RuntimeWarning)
+                    cols = np.floor(xMap.transform(x[i0:i1]))
+                if np.all(np.isfinite(cols)):
+                    ind = _get_minmax_indexes(cols, y[i0:i1])+i0
+                    lod_data = x[ind], y[ind]
+        self._lod_cache = key, lod_data
+        return lod_data
+
+    def draw(self, painter, xMap, yMap, canvasRect):
+        """Reimplemented to support the level-of-detail (LOD) mode"""
+        lod_data = None
+        if self._is_lod_applicable() and self.dataSize() > 0:
+            lod_data = self.get_lod_data(xMap)
+        if lod_data is None:
+            QwtPlotCurve.draw(self, painter, xMap, yMap, canvasRect)
+            return
+        x, y = lod_data
+        tx = xMap.transform(x)
+        ty = yMap.transform(y)
+        polyline = array_to_polygon(np.column_stack((tx, ty)))
+        painter.save()
+        painter.setPen(self.pen())
+        painter.drawPolyline(polyline)
+        painter.restore()
+
+    def get_hit_test_index(self):
+        """
+        Return spatial index used for hit testing
+        (:py:class:`guiqwt.curve.CurveHitTestIndex` object, built on first 
+        call and kept until curve data or axis scale types change)
+        """
+        plot = self.plot()
+        xtr = plot.canvasMap(self.xAxis()).transformation()
+        ytr = plot.canvasMap(self.yAxis()).transformation()
+        key = (self._data_version, type(xtr), type(ytr))
+        if self._hit_index is None or self._hit_index[0] != key:
+            index = CurveHitTestIndex(self._x, self._y, xtr, ytr)
+            self._hit_index = key, index
+        return self._hit_index[1]
+
     def hit_test(self, pos):
         """Calcul de la distance d'un point à une courbe
         renvoie (dist, handle, inside)"""
         if self.is_empty():
             return maxsize, 0, False, None
         plot = self.plot()
-        ax = self.xAxis()
-        ay = self.yAxis()
-        px = plot.invTransform(ax, pos.x())
-        py = plot.invTransform(ay, pos.y())
-        # On cherche les 4 points qui sont les plus proches en X et en Y
-        # avant et après ie tels que p1x < x < p2x et p3y < y < p4y
-        tmpx = self._x - px
-        tmpy = self._y - py
-        if np.count_nonzero(tmpx) != len(tmpx) or\
-           np.count_nonzero(tmpy) != len(tmpy):
-            # Avoid dividing by zero warning when computing dx or dy
-            return maxsize, 0, False, None
-        dx = 1/tmpx
-        dy = 1/tmpy
-        i0 = dx.argmin()
-        i1 = dx.argmax()
-        i2 = dy.argmin()
-        i3 = dy.argmax()
-        t = np.array((i0, i1, i2, i3))
-        t2 = (t+1).clip(0, self._x.shape[0]-1)
-        i, _d = seg_dist_v((px, py), self._x[t], self._y[t],
-                           self._x[t2], self._y[t2])
-        i = t[i]
-        # Recalcule la distance dans le répère du widget
-        p0x = plot.transform(ax, self._x[i])
-        p0y = plot.transform(ay, self._y[i])
-        if i+1 >= self._x.shape[0]:
-            p1x = p0x
-            p1y = p0y
-        else:
-            p1x = plot.transform(ax, self._x[i+1])
-            p1y = plot.transform(ay, self._y[i+1])
-        distance = seg_dist(QPointF(pos), QPointF(p0x, p0y), QPointF(p1x, p1y))
+        coefs = _get_scale_map_coefs(plot.canvasMap(self.xAxis()))+\
+                _get_scale_map_coefs(plot.canvasMap(self.yAxis()))
+        distance, i = self.get_hit_test_index().query(pos.x(), pos.y(), coefs)
         return distance, i, False, None
     
     def get_closest_coordinates(self, x, y):
@@ -552,7 +1085,7 @@ class CurveItem(QwtPlotCurve):
         x, y = canvas_to_axes(self, pos)
         self._x[handle] = x
         self._y[handle] = y
-        self.setData(self._x, self._y)
+        self._update_data()
         self.plot().replot()
 
     def move_local_shape(self, old_pos, new_pos):
@@ -562,7 +1095,7 @@ class CurveItem(QwtPlotCurve):
         ox, oy = canvas_to_axes(self, old_pos)
         self._x += (nx-ox)
         self._y += (ny-oy)
-        self.setData(self._x, self._y)
+        self._update_data()
         
     def move_with_selection(self, delta_x, delta_y):
         """
@@ -571,7 +1104,7 @@ class CurveItem(QwtPlotCurve):
         """
         self._x += delta_x
         self._y += delta_y
-        self.setData(self._x, self._y)
+        self._update_data()
 
     def update_params(self):        
         self.curveparam.update_curve(self)
@@ -605,6 +1138,7 @@ class PolygonMapItem(QwtPlotItem):
     _can_resize = False
     _can_move = False
     _can_rotate = False
+    SIMPLIFY_CACHE_SIZE = 8 # Number of zoom levels kept in cache
 
     def __init__(self, curveparam=None):
         super(PolygonMapItem, self).__init__()
@@ -617,6 +1151,8 @@ class PolygonMapItem(QwtPlotItem):
         self._pts = None # Array of points Mx2
         self._n = None   # Array of polygon offsets/ends Nx1 (polygon k points are _pts[_n[k-1]:_n[k]])
         self._c = None   # Color of polygon Nx2 [border,background] as RGBA uint32
+        # Simplified polygons LRU cache (key: zoom level):
+        self._simplified = collections.OrderedDict()
         self.update_params()
         
     def types(self):
@@ -715,7 +1251,7 @@ class PolygonMapItem(QwtPlotItem):
     def select(self):
         """Select item"""
         self.selected = True
-        self.setSymbol(SELECTED_SYMBOL)
+        self.setSymbol(_get_selected_symbol())
         self.invalidate_plot()
     
     def unselect(self):
@@ -738,6 +1274,7 @@ class PolygonMapItem(QwtPlotItem):
         self._pts = np.array(pts, copy=False)
         self._n = np.array(n, copy=False)
         self._c = np.array(c, copy=False)
+        self._simplified.clear()
         xmin, ymin = self._pts.min(axis=0)
         xmax, ymax = self._pts.max(axis=0)
         self.bounds = QRectF(xmin, ymin, xmax-xmin, ymax-ymin)
@@ -791,6 +1328,22 @@ class PolygonMapItem(QwtPlotItem):
                        visible_only=True)
         self.update_params()
 
+    def get_simplified_polygons(self, ax, ay):
+        """
+        Return polygons simplified for scale factors (ax, ay), i.e. for a 
+        given zoom level: (points, starts, ends), polygon i vertices being 
+        points[starts[i]:ends[i]] (result is cached for the last zoom levels)
+        """
+        key = (ax, ay)
+        result = self._simplified.pop(key, None)
+        if result is None:
+            if len(self._simplified) >= self.SIMPLIFY_CACHE_SIZE:
+                # Removing least recently used zoom level
+                self._simplified.popitem(last=False)
+            result = _get_simplified_polygons(self._pts, self._n, ax, ay)
+        self._simplified[key] = result # Most recently used
+        return result
+
     def draw(self, painter, xMap, yMap, canvasRect):
         #from time import time
         p1x = xMap.p1()
@@ -805,16 +1358,19 @@ class PolygonMapItem(QwtPlotItem):
         fgcol = QColor()
         bgcol = QColor()
         #t0 = time()
-        polygons = simplify_poly(self._pts, _n, (ax, bx, ay, by),
-                                 canvasRect.getCoords() )
+        if simplify_poly is _simplify_poly:
+            # Built-in simplification: cached for the current zoom level
+            polygons = _cull_polygons(*self.get_simplified_polygons(ax, ay),
+                                      scale=(ax, bx, ay, by),
+                                      bounds=canvasRect.getCoords())
+        else:
+            polygons = simplify_poly(self._pts, _n, (ax, bx, ay, by),
+                                     canvasRect.getCoords() )
         #t1 = time()
         #print len(polygons), t1-t0
         #t2 = time()
         for poly, num in polygons:
-            points = []
-            for i in range(poly.shape[0]):
-                points.append(QPointF(poly[i, 0], poly[i, 1]))
-            pg = QPolygonF(points)
+            pg = array_to_polygon(poly)
             fgcol.setRgba(int(_c[num, 0]))
             bgcol.setRgba(int(_c[num, 1]))
             painter.setPen(QPen(fgcol))
@@ -828,17 +1384,29 @@ class PolygonMapItem(QwtPlotItem):
 assert_interfaces_valid(PolygonMapItem)
 
 
-def _transform(map, v):
-    return QwtScaleMap.transform(map, v)
 def vmap(map, v):
     """Transform coordinates while handling RuntimeWarning 
     that could be raised by NumPy when trying to transform 
-    a zero in logarithmic scale for example"""
+    a zero in logarithmic scale for example
+    (vectorized equivalent of `QwtScaleMap.transform` for NumPy arrays)"""
+    a, b = _get_scale_map_coefs(map)
+    tr = map.transformation()
     with warnings.catch_warnings():
         warnings.simplefilter("ignore", category=RuntimeWarning)
-        output = np.vectorize(_transform)(map, v)
+        if tr is not None:
+            v = tr.transform(v)
+        output = a*np.asarray(v, dtype=float)+b
     return output
 
+def _build_lines(segments):
+    """Return line segments corresponding to *segments*, a list of 
+    (x0, y0, x1, y1) tuples of NumPy arrays (canvas coordinates), to be drawn 
+    at once with `QPainter.drawLines` (see `geometry.array_to_point_pairs`)"""
+    coords = np.concatenate([np.column_stack(np.broadcast_arrays(*seg))
+                             for seg in segments])
+    # Interleaving segment endpoints: (N, 4) --> (2N, 2)
+    return array_to_point_pairs(coords.reshape(-1, 2))
+
 class ErrorBarCurveItem(CurveItem):
     """
     Construct an error-bar curve `plot item` 
@@ -916,6 +1484,7 @@ class ErrorBarCurveItem(CurveItem):
         self._dx = dx
         self._dy = dy
         self._minmaxarrays = {}
+        self._bounds = None
 
     def get_minmax_arrays(self, all_values=True):
         if self._minmaxarrays.get(all_values) is None:
@@ -975,22 +1544,12 @@ class ErrorBarCurveItem(CurveItem):
             x = xmax[i]
         return x, y
 
-    def boundingRect(self):
-        """Return the bounding rectangle of the data, error bars included"""
+    def _compute_bounds(self):
+        """Compute bounds returned by `get_bounds`, error bars included"""
         xmin, xmax, ymin, ymax = self.get_minmax_arrays()
         if xmin is None or xmin.size == 0:
-            return CurveItem.boundingRect(self)
-        plot = self.plot()
-        xminf, yminf = xmin[np.isfinite(xmin)], ymin[np.isfinite(ymin)]
-        xmaxf, ymaxf = xmax[np.isfinite(xmax)], ymax[np.isfinite(ymax)]
-        if plot is not None and 'log' in (plot.get_axis_scale(self.xAxis()),
-                                          plot.get_axis_scale(self.yAxis())):
-            xmin = self._get_visible_axis_min(self.xAxis(), xminf)
-            ymin = self._get_visible_axis_min(self.yAxis(), yminf)
-        else:
-            xmin = xminf.min()
-            ymin = yminf.min()
-        return QRectF(xmin, ymin, xmaxf.max()-xmin, ymaxf.max()-ymin)
+            return CurveItem._compute_bounds(self)
+        return _get_finite_bounds(xmin, xmax)+_get_finite_bounds(ymin, ymax)
         
     def draw(self, painter, xMap, yMap, canvasRect):
         if self._x is None or self._x.size == 0:
@@ -998,65 +1557,48 @@ class ErrorBarCurveItem(CurveItem):
         x, y, xmin, xmax, ymin, ymax = self.get_minmax_arrays(all_values=False)
         tx = vmap(xMap, x)
         ty = vmap(yMap, y)
-        RN = list(range(len(tx)))
         if self.errorOnTop:
-            QwtPlotCurve.draw(self, painter, xMap, yMap, canvasRect)
+            CurveItem.draw(self, painter, xMap, yMap, canvasRect)
         
         painter.save()
         painter.setPen(self.errorPen)
         cap = self.errorCap/2.
 
+        # Error bars and caps are drawn at once from NumPy arrays
+        segments = []
         if self._dx is not None and self.errorbarparam.mode == 0:
             txmin = vmap(xMap, xmin)
             txmax = vmap(xMap, xmax)
             # Classic error bars
-            lines = []
-            for i in RN:
-                yi = ty[i]
-                lines.append(QLineF(txmin[i], yi, txmax[i], yi))
-            painter.drawLines(lines)
+            segments.append((txmin, ty, txmax, ty))
             if cap > 0:
-                lines = []
-                for i in RN:
-                    yi = ty[i]
-                    lines.append(QLineF(txmin[i], yi-cap, txmin[i], yi+cap))
-                    lines.append(QLineF(txmax[i], yi-cap, txmax[i], yi+cap))
-            painter.drawLines(lines)
+                segments.append((txmin, ty-cap, txmin, ty+cap))
+                segments.append((txmax, ty-cap, txmax, ty+cap))
             
         if self._dy is not None:
             tymin = vmap(yMap, ymin)
             tymax = vmap(yMap, ymax)
             if self.errorbarparam.mode == 0:
                 # Classic error bars
-                lines = []
-                for i in RN:
-                    xi = tx[i]
-                    lines.append(QLineF(xi, tymin[i], xi, tymax[i]))
-                painter.drawLines(lines)
+                segments.append((tx, tymin, tx, tymax))
                 if cap > 0:
                     # Cap
-                    lines = []
-                    for i in RN:
-                        xi = tx[i]
-                        lines.append(QLineF(xi-cap, tymin[i], xi+cap, tymin[i]))
-                        lines.append(QLineF(xi-cap, tymax[i], xi+cap, tymax[i]))
-                painter.drawLines(lines)
+                    segments.append((tx-cap, tymin, tx+cap, tymin))
+                    segments.append((tx-cap, tymax, tx+cap, tymax))
             else:
                 # Error area
-                points = []
-                rpoints = []
-                for i in RN:
-                    xi = tx[i]
-                    points.append(QPointF(xi, tymin[i]))
-                    rpoints.append(QPointF(xi, tymax[i]))
-                points += reversed(rpoints)
+                points = np.concatenate((np.column_stack((tx, tymin)),
+                                         np.column_stack((tx, tymax))[::-1]))
                 painter.setBrush(QBrush(self.errorBrush))
-                painter.drawPolygon(*points)
+                painter.drawPolygon(array_to_polygon(points))
+
+        if segments and tx.size:
+            painter.drawLines(_build_lines(segments))
 
         painter.restore()
 
         if not self.errorOnTop:
-            QwtPlotCurve.draw(self, painter, xMap, yMap, canvasRect)
+            CurveItem.draw(self, painter, xMap, yMap, canvasRect)
         
     def update_params(self):
         self.errorbarparam.update_curve(self)
@@ -1078,6 +1620,634 @@ class ErrorBarCurveItem(CurveItem):
 assert_interfaces_valid( ErrorBarCurveItem )
 
 
+def _get_block_bounds(x, y):
+    """Return bounds of finite data (see `CurveItem.get_bounds`), infinite 
+    values replacing missing bounds"""
+    finite = np.logical_and(np.isfinite(x), np.isfinite(y))
+    if not finite.any():
+        return (np.inf, -np.inf, np.inf)*2
+    xf, yf = x[finite], y[finite]
+    bounds = _get_finite_bounds(xf, xf)+_get_finite_bounds(yf, yf)
+    return tuple(np.inf if value is None else value for value in bounds)
+
+class StreamingCurveItem(CurveItem):
+    """
+    Construct a streaming curve `plot item` with the parameters *curveparam*
+    (see :py:class:`guiqwt.styles.CurveParam`)
+    
+    Data is appended (see :py:meth:`append`) to preallocated circular 
+    buffers of fixed *capacity*: when buffers are full, oldest samples 
+    are dropped. Data bounds are updated incrementally and buffers are drawn 
+    as is (i.e. from their two contiguous segments).
+    """
+    BOUNDS_BLOCK_SIZE = 1024
+    
+    def __init__(self, capacity=10000, curveparam=None):
+        self._setup_buffers(capacity)
+        self._synced = True
+        self._autoscroll = False
+        self._scroll_width = None
+        super(StreamingCurveItem, self).__init__(curveparam)
+
+    def _setup_buffers(self, capacity):
+        """Allocate (empty) circular buffers of *capacity* samples"""
+        self._capacity = capacity = int(capacity)
+        self._xbuf = np.zeros(capacity)
+        self._ybuf = np.zeros(capacity)
+        self._start = 0
+        self._size = 0
+        nblocks = (capacity-1)//self.BOUNDS_BLOCK_SIZE+1
+        self._block_bounds = np.empty((nblocks, 6))
+        self._block_bounds[:] = (np.inf, -np.inf, np.inf)*2
+
+    def __reduce__(self):
+        x, y = self.get_data()
+        state = (self.curveparam, x, y, self.z())
+        res = ( StreamingCurveItem, (self._capacity, ), state )
+        return res
+
+    def serialize(self, writer):
+        """Serialize object to HDF5 writer"""
+        self._sync_data()
+        super(StreamingCurveItem, self).serialize(writer)
+        writer.write(self._capacity, group_name='capacity')
+
+    def deserialize(self, reader):
+        """Deserialize object from HDF5 reader"""
+        self._setup_buffers(reader.read('capacity'))
+        super(StreamingCurveItem, self).deserialize(reader)
+
+    def get_capacity(self):
+        """Return buffer capacity (maximum number of samples)"""
+        return self._capacity
+
+    def get_segments(self):
+        """
+        Return buffer contiguous segments, oldest samples first: 
+        list of (x, y) tuples of NumPy arrays (views on buffers)
+        """
+        start, end = self._start, self._start+self._size
+        xbuf, ybuf = self._xbuf, self._ybuf
+        if end <= self._capacity:
+            return [(xbuf[start:end], ybuf[start:end])]
+        end -= self._capacity
+        return [(xbuf[start:], ybuf[start:]), (xbuf[:end], ybuf[:end])]
+
+    def get_data(self):
+        """Return curve data x, y (NumPy arrays, copied from buffers)"""
+        segments = self.get_segments()
+        return (np.concatenate([x for x, _y in segments]),
+                np.concatenate([y for _x, y in segments]))
+
+    def set_data(self, x, y):
+        """
+        Set curve data (only the last samples are kept if data size 
+        exceeds buffer capacity):
+            * x: NumPy array
+            * y: NumPy array
+        """
+        self.clear()
+        self.append(x, y)
+
+    def clear(self):
+        """Remove all samples"""
+        self._start = self._size = 0
+        self._block_bounds[:] = (np.inf, -np.inf, np.inf)*2
+        self._data_changed()
+
+    def append(self, x, y):
+        """
+        Append samples to curve:
+            * x: float or NumPy array
+            * y: float or NumPy array
+        """
+        x = np.array(x, dtype=float, ndmin=1).ravel()
+        y = np.array(y, dtype=float, ndmin=1).ravel()
+        assert x.size == y.size
+        capacity = self._capacity
+        if x.size > capacity:
+            x, y = x[-capacity:], y[-capacity:]
+        size = x.size
+        pos = (self._start+self._size) % capacity
+        n0 = min(size, capacity-pos)
+        self._xbuf[pos:pos+n0] = x[:n0]
+        self._ybuf[pos:pos+n0] = y[:n0]
+        self._xbuf[:size-n0] = x[n0:]
+        self._ybuf[:size-n0] = y[n0:]
+        dropped = self._size+size-capacity
+        if dropped > 0:
+            self._start = (self._start+dropped) % capacity
+            self._size = capacity
+        else:
+            self._size += size
+        self._update_block_bounds(pos, pos+n0)
+        self._update_block_bounds(0, size-n0)
+        self._data_changed()
+        if self._autoscroll:
+            self.scroll()
+
+    def _update_block_bounds(self, i0, i1):
+        """Update bounds of blocks containing buffer indexes [i0, i1["""
+        if i1 <= i0:
+            return
+        bsize = self.BOUNDS_BLOCK_SIZE
+        # Before buffers are full, valid samples are [0, size[:
+        valid_end = self._capacity if self._size == self._capacity\
+                    else self._size
+        for block in range(i0//bsize, (i1-1)//bsize+1):
+            b0, b1 = block*bsize, min((block+1)*bsize, valid_end)
+            self._block_bounds[block] = _get_block_bounds(self._xbuf[b0:b1],
+                                                          self._ybuf[b0:b1])
+
+    def _data_changed(self):
+        """Invalidate data caches after buffers update"""
+        self._data_version += 1
+        self._lod_cache = None
+        self._x_monotonic = None
+        self._hit_index = None
+        self._synced = False
+
+    def _sync_data(self):
+        """Update curve series (and x, y arrays) from buffers, if necessary:
+        this is only required by features working on linear data (e.g. hit 
+        testing or drawing styles other than lines and dots)"""
+        if not self._synced:
+            self._x, self._y = self.get_data()
+            self.setData(self._x, self._y)
+            self._synced = True
+
+    def is_empty(self):
+        """Return True if item data is empty"""
+        return self._size == 0
+
+    def get_bounds(self):
+        """Reimplemented to return bounds updated incrementally from buffers
+        (see :py:meth:`guiqwt.curve.CurveItem.get_bounds`)"""
+        bounds = self._block_bounds
+        xmin, ymin = bounds[:, 0].min(), bounds[:, 3].min()
+        if self._size == 0 or not np.isfinite(xmin):
+            return
+        xposmin, yposmin = bounds[:, 2].min(), bounds[:, 5].min()
+        return (xmin, bounds[:, 1].max(),
+                xposmin if np.isfinite(xposmin) else None,
+                ymin, bounds[:, 4].max(),
+                yposmin if np.isfinite(yposmin) else None)
+
+    def set_autoscroll(self, state, width=None):
+        """
+        Enable or disable X-axis auto-scrolling: after each call to 
+        :py:meth:`append`, X-axis limits are set to show the last *width* 
+        X-axis range (or the whole buffer X-axis range if *width* is None)
+        """
+        self._autoscroll = state
+        self._scroll_width = width
+
+    def scroll(self):
+        """Set X-axis limits according to auto-scrolling parameters
+        (see :py:meth:`set_autoscroll`)"""
+        plot = self.plot()
+        bounds = self.get_bounds()
+        if plot is None or bounds is None:
+            return
+        xmin, xmax = bounds[:2]
+        if self._scroll_width is not None:
+            xmin = xmax-self._scroll_width
+        if xmin < xmax:
+            plot.set_axis_limits(self.xAxis(), xmin, xmax)
+
+    def hit_test(self, pos):
+        """Reimplemented to update curve data from buffers"""
+        self._sync_data()
+        return CurveItem.hit_test(self, pos)
+
+    def get_closest_coordinates(self, x, y):
+        """Reimplemented to update curve data from buffers"""
+        self._sync_data()
+        return CurveItem.get_closest_coordinates(self, x, y)
+
+    def get_closest_x(self, xc):
+        """Reimplemented to update curve data from buffers"""
+        self._sync_data()
+        return CurveItem.get_closest_x(self, xc)
+
+    def move_local_point_to(self, handle, pos, ctrl=None):
+        pass
+
+    def move_local_shape(self, old_pos, new_pos):
+        pass
+        
+    def move_with_selection(self, delta_x, delta_y):
+        pass
+
+    def draw(self, painter, xMap, yMap, canvasRect):
+        """Reimplemented to draw buffers segments without linearizing them
+        (for lines and dots curve styles)"""
+        style = self.style()
+        if style not in (QwtPlotCurve.Lines, QwtPlotCurve.Dots,
+                         QwtPlotCurve.NoCurve)\
+           or self.brush().style() != Qt.NoBrush:
+            self._sync_data()
+            QwtPlotCurve.draw(self, painter, xMap, yMap, canvasRect)
+            return
+        points = []
+        for x, y in self.get_segments():
+            finite = np.logical_and(np.isfinite(x), np.isfinite(y))
+            if finite.any():
+                points.append(np.column_stack((vmap(xMap, x[finite]),
+                                               vmap(yMap, y[finite]))))
+        if not points:
+            return
+        polygons = [array_to_polygon(pts) for pts in points]
+        if style != QwtPlotCurve.NoCurve:
+            painter.save()
+            painter.setPen(self.pen())
+            for polygon in polygons:
+                if style == QwtPlotCurve.Lines:
+                    painter.drawPolyline(polygon)
+                else:
+                    painter.drawPoints(polygon)
+            if style == QwtPlotCurve.Lines and len(points) == 2:
+                # Joining buffers segments:
+                x0, y0 = points[0][-1]
+                x1, y1 = points[1][0]
+                painter.drawLine(QLineF(x0, y0, x1, y1))
+            painter.restore()
+        symbol = self.symbol()
+        if symbol is not None and symbol.style() != QwtSymbol.NoSymbol:
+            painter.save()
+            for polygon in polygons:
+                symbol.drawSymbols(painter, polygon)
+            painter.restore()
+
+assert_interfaces_valid(StreamingCurveItem)
+
+
+class CurveCollectionItem(QwtPlotItem):
+    """
+    Construct a curve collection `plot item` with the parameters *curveparam*
+    (see :py:class:`guiqwt.styles.CurveParam`): a set of traces sharing the
+    same X data, each trace being drawn as a line with its own color, taken
+    from colormap *cmap_name* (see :py:func:`guiqwt.colormap.get_cmap`)
+    
+    All traces are rendered in a single paint pass: when X data is monotonic,
+    traces are decimated to (at most) four points per pixel column 
+    (see :py:meth:`guiqwt.curve.CurveItem.set_lod_enabled`).
+    """
+    __implements__ = (IBasePlotItem, ISerializableType)
+    
+    _readonly = False
+    _private = False
+    _can_select = True
+    _can_resize = False
+    _can_move = False
+    _can_rotate = False
+    HIT_TEST_CHUNK_SIZE = 1000000 # Max. number of segments processed at once
+
+    def __init__(self, curveparam=None, cmap_name="jet"):
+        super(CurveCollectionItem, self).__init__()
+        if curveparam is None:
+            self.curveparam = CurveParam(_("Curves"), icon='curve.png')
+        else:
+            self.curveparam = curveparam
+        self.selected = False
+        self.immutable = True
+        self.cmap_name = cmap_name
+        self._x = None # X data (N samples)
+        self._y = None # Y data (M traces x N samples)
+        self._pen = QPen()
+        self._symbol = QwtSymbol()
+        self._style = QwtPlotCurve.Lines
+        self._baseline = 0.
+        self._colors = None
+        self._data_version = 0
+        self._lod_cache = None
+        self._x_monotonic = None
+        self._closest_trace = None
+        self.bounds = QRectF()
+        self.update_params()
+
+    def types(self):
+        return (ICurveCollectionItemType, ITrackableItemType,
+                ISerializableType)
+
+    def can_select(self):
+        return self._can_select
+    def can_resize(self):
+        return self._can_resize
+    def can_rotate(self):
+        return self._can_rotate
+    def can_move(self):
+        return self._can_move
+    def set_selectable(self, state):
+        """Set item selectable state"""
+        self._can_select = state
+    def set_resizable(self, state):
+        """Set item resizable state
+        (or any action triggered when moving an handle, e.g. rotation)"""
+        self._can_resize = state
+    def set_movable(self, state):
+        """Set item movable state"""
+        self._can_move = state
+    def set_rotatable(self, state):
+        """Set item rotatable state"""
+        self._can_rotate = state
+
+    # Curve style parameters (see CurveParam.update_curve/update_param):
+    # traces are always drawn as lines, without symbols
+    def setPen(self, pen):
+        self._pen = QPen(pen)
+    def pen(self):
+        return self._pen
+    def setBrush(self, x):
+        pass
+    def setSymbol(self, symbol):
+        self._symbol = symbol
+    def symbol(self):
+        return self._symbol
+    def setCurveAttribute(self, x, y):
+        pass
+    def setStyle(self, style):
+        self._style = style
+    def style(self):
+        return self._style
+    def setCurveType(self, x):
+        pass
+    def setBaseline(self, baseline):
+        self._baseline = baseline
+    def baseline(self):
+        return self._baseline
+
+    def __reduce__(self):
+        state = (self.curveparam, self._x, self._y, self.z())
+        res = ( CurveCollectionItem, (None, self.cmap_name), state )
+        return res
+
+    def __setstate__(self, state):
+        param, x, y, z = state
+        self.curveparam = param
+        if x is not None:
+            self.set_data(x, y)
+        self.setZ(z)
+        self.update_params()
+
+    def serialize(self, writer):
+        """Serialize object to HDF5 writer"""
+        writer.write(self._x, group_name='Xdata')
+        writer.write(self._y, group_name='Ydata')
+        writer.write(self.cmap_name, group_name='cmap_name')
+        writer.write(self.z(), group_name='z')
+        self.curveparam.update_param(self)
+        writer.write(self.curveparam, group_name='curveparam')
+    
+    def deserialize(self, reader):
+        """Deserialize object from HDF5 reader"""
+        x = reader.read(group_name='Xdata', func=reader.read_array)
+        y = reader.read(group_name='Ydata', func=reader.read_array)
+        self.set_colormap(reader.read('cmap_name'))
+        self.set_data(x, y)
+        self.setZ(reader.read('z'))
+        self.curveparam = CurveParam(_("Curves"), icon='curve.png')
+        reader.read('curveparam', instance=self.curveparam)
+        self.update_params()
+
+    def set_readonly(self, state):
+        """Set object readonly state"""
+        self._readonly = state
+        
+    def is_readonly(self):
+        """Return object readonly state"""
+        return self._readonly
+        
+    def set_private(self, state):
+        """Set object as private"""
+        self._private = state
+        
+    def is_private(self):
+        """Return True if object is private"""
+        return self._private
+
+    def invalidate_plot(self):
+        plot = self.plot()
+        if plot is not None:
+            plot.invalidate()
+
+    def select(self):
+        """Select item"""
+        self.selected = True
+        self.invalidate_plot()
+    
+    def unselect(self):
+        """Unselect item"""
+        self.selected = False
+        self.invalidate_plot()
+
+    def get_data(self):
+        """Return curve collection data x, y (NumPy arrays: y is a 2D array,
+        one trace per row)"""
+        return self._x, self._y
+
+    def set_data(self, x, y):
+        """
+        Set curve collection data:
+            * x: NumPy array (N samples)
+            * y: 2D NumPy array (M traces x N samples)
+        """
+        x = np.array(x, copy=False).ravel()
+        y = np.array(y, copy=False)
+        if y.ndim == 1:
+            y = y.reshape(1, -1)
+        assert y.ndim == 2 and y.shape[1] == x.size, \
+               "y must be a 2D array with as many columns as x elements"
+        self._x, self._y = x, y
+        self._data_version += 1
+        self._lod_cache = None
+        self._x_monotonic = None
+        self._colors = None
+        self._closest_trace = None
+        if self.is_empty():
+            self.bounds = QRectF()
+        else:
+            xmin, xmax, _p = _get_finite_bounds(x, x)
+            ymin, ymax, _p = _get_finite_bounds(y.min(axis=1), 
+                                                y.max(axis=1))
+            self.bounds = QRectF(xmin, ymin, xmax-xmin, ymax-ymin)
+        self.invalidate_plot()
+        
+    def is_empty(self):
+        """Return True if item data is empty"""
+        return self._y is None or self._y.size == 0
+
+    def get_trace_count(self):
+        """Return number of traces"""
+        return 0 if self._y is None else self._y.shape[0]
+
+    def set_colormap(self, name):
+        """Set colormap used to color traces (from first to last trace)"""
+        self.cmap_name = name
+        self._colors = None
+        self.invalidate_plot()
+
+    def get_colormap(self):
+        """Return colormap name"""
+        return self.cmap_name
+
+    def get_trace_colors(self):
+        """Return trace colors (list of QColor objects, cached)"""
+        if self._colors is None:
+            from guiqwt.colormap import get_cmap, FULLRANGE
+            table = get_cmap(self.cmap_name).colorTable(FULLRANGE)
+            ntraces = self.get_trace_count()
+            indexes = np.linspace(0, len(table)-1, ntraces).round()
+            self._colors = [QColor.fromRgb(int(table[int(index)]))
+                            for index in indexes]
+        return self._colors
+
+    def is_x_monotonic(self):
+        """Return True if X data is monotonic (i.e. increasing)"""
+        if self._x_monotonic is None:
+            self._x_monotonic = bool(np.all(np.diff(self._x) >= 0))
+        return self._x_monotonic
+
+    def get_lod_data(self, xMap):
+        """
+        Return data (x, y) to be drawn for scale map *xMap*: if X data is
+        monotonic, traces are restricted to the visible X range and 
+        decimated when there are more than four samples per pixel column
+        (x is then a 2D array, like y); result is cached until X scale, 
+        canvas width or data change
+        """
+        plot = self.plot()
+        xscale = None if plot is None else plot.get_axis_scale(self.xAxis())
+        key = (xMap.s1(), xMap.s2(), xMap.p1(), xMap.p2(), xscale,
+               self._data_version)
+        if self._lod_cache is not None and self._lod_cache[0] == key:
+            return self._lod_cache[1]
+        x, y = self._x, self._y
+        if self.is_x_monotonic():
+            smin, smax = sorted((xMap.s1(), xMap.s2()))
+            i0 = max(x.searchsorted(smin, side='left')-1, 0)
+            i1 = min(x.searchsorted(smax, side='right')+1, x.size)
+            x, y = x[i0:i1], y[:, i0:i1]
+            ncols = abs(xMap.p2()-xMap.p1())+1
+            if x.size > 4*ncols:
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore", category=RuntimeWarning)
+                    cols = np.floor(xMap.transform(x))
+                if np.all(np.isfinite(cols)):
+                    ind = _get_minmax_indexes_2d(cols, y)
+                    x, y = x[ind], y[np.arange(y.shape[0])[:, None], ind]
+        self._lod_cache = key, (x, y)
+        return x, y
+
+    def draw(self, painter, xMap, yMap, canvasRect):
+        if self.is_empty():
+            return
+        x, y = self.get_lod_data(xMap)
+        tx, ty = np.broadcast_arrays(vmap(xMap, x), vmap(yMap, y))
+        pen = QPen(self._pen)
+        if self.selected:
+            pen.setWidthF(pen.widthF()+1)
+        painter.save()
+        for trace, color in enumerate(self.get_trace_colors()):
+            pen.setColor(color)
+            painter.setPen(pen)
+            points = np.column_stack((tx[trace], ty[trace]))
+            painter.drawPolyline(array_to_polygon(points))
+        painter.restore()
+
+    def get_trace_distances(self, px, py):
+        """
+        Return distances (canvas coordinates) between point (px, py) 
+        and each trace (NumPy array)
+        """
+        plot = self.plot()
+        xMap = plot.canvasMap(self.xAxis())
+        yMap = plot.canvasMap(self.yAxis())
+        x, y = self._x, self._y
+        if self.is_x_monotonic():
+            # Only segments surrounding the point abscissa are considered
+            xc = plot.invTransform(self.xAxis(), px)
+            i = x.searchsorted(xc)
+            segments = [slice(max(i-2, 0), min(i+2, x.size))]
+        else:
+            step = max(self.HIT_TEST_CHUNK_SIZE//y.shape[0], 2)
+            segments = [slice(i0, i0+step+1)
+                        for i0 in range(0, max(x.size-1, 1), step)]
+        dist = np.empty(y.shape[0])
+        dist.fill(np.inf)
+        for sl in segments:
+            tx, ty = vmap(xMap, x[sl]), vmap(yMap, y[:, sl])
+            if tx.size > 1:
+                d = seg_dist_array(px, py, tx[:-1], ty[:, :-1],
+                                   tx[1:], ty[:, 1:])
+            else:
+                d = np.hypot(tx-px, ty-py)
+            d[~np.isfinite(d)] = np.inf
+            dist = np.minimum(dist, d.min(axis=1))
+        return dist
+
+    def hit_test(self, pos):
+        """Calcul de la distance d'un point à une courbe
+        renvoie (dist, handle, inside) -- handle: index of the closest trace"""
+        if self.is_empty():
+            return maxsize, 0, False, None
+        dist = self.get_trace_distances(pos.x(), pos.y())
+        trace = dist.argmin()
+        if not np.isfinite(dist[trace]):
+            return maxsize, 0, False, None
+        return dist[trace], trace, False, None
+    
+    def get_closest_coordinates(self, x, y):
+        """Renvoie les coordonnées (x',y') du point le plus proche de (x,y)
+        (the closest trace is then used as coordinates label)"""
+        plot = self.plot()
+        xaxis, yaxis = self.xAxis(), self.yAxis()
+        px, py = plot.transform(xaxis, x), plot.transform(yaxis, y)
+        _d, trace, _i, _o = self.hit_test(QPointF(px, py))
+        self._closest_trace = trace
+        tx = vmap(plot.canvasMap(xaxis), self._x)
+        ty = vmap(plot.canvasMap(yaxis), self._y[trace])
+        dist = np.hypot(tx-px, ty-py)
+        dist[~np.isfinite(dist)] = np.inf
+        i = dist.argmin()
+        return self._x[i], self._y[trace, i]
+
+    def get_coordinates_label(self, xc, yc):
+        title = self.title().text()
+        if self._closest_trace is not None:
+            title = "%s [%d]" % (title, self._closest_trace)
+        return "%s:<br>x = %g<br>y = %g" % (title, xc, yc)
+
+    def move_local_point_to(self, handle, pos, ctrl=None):
+        return
+
+    def move_local_shape(self, old_pos, new_pos):
+        pass
+
+    def move_with_selection(self, delta_x, delta_y):
+        pass
+
+    def update_params(self):
+        self.curveparam.update_curve(self)
+        self.invalidate_plot()
+
+    def update_item_parameters(self):
+        self.curveparam.update_param(self)
+
+    def get_item_parameters(self, itemparams):
+        itemparams.add("CurveParam", self, self.curveparam)
+    
+    def set_item_parameters(self, itemparams):
+        update_dataset(self.curveparam, itemparams.get("CurveParam"),
+                       visible_only=True)
+        self.update_params()
+
+    def boundingRect(self):
+        return self.bounds
+
+assert_interfaces_valid(CurveCollectionItem)
+
+
 #===============================================================================
 # Plot Widget
 #===============================================================================
@@ -1345,7 +2515,7 @@ class CurvePlot(BasePlot):
           panning
     """
     DEFAULT_ITEM_TYPE = ICurveItemType
-    AUTOSCALE_TYPES = (CurveItem, PolygonMapItem)
+    AUTOSCALE_TYPES = (CurveItem, PolygonMapItem, CurveCollectionItem)
     
     #: Signal emitted by plot when plot axis has changed, e.g. when panning/zooming (arg: plot))
     SIG_PLOT_AXIS_CHANGED = Signal("PyQt_PyObject")
@@ -1619,26 +2789,28 @@ class CurvePlot(BasePlot):
         auto = self.autoReplot()
         self.setAutoReplot(False)
         # XXX implement the case when axes are synchronised
+        # Item bounds are retrieved only once (and cached by items), then 
+        # aggregated for each axis:
+        items_bounds = [(item, item.boundingRect()) for item in self.get_items()
+                        if isinstance(item, self.AUTOSCALE_TYPES)
+                        and not item.is_empty() and item.isVisible()]
         for axis_id in self.AXIS_IDS if axis_id is None else [axis_id]:
             vmin, vmax = None, None
             if not self.axisEnabled(axis_id):
                 continue
-            for item in self.get_items():
-                if isinstance(item, self.AUTOSCALE_TYPES) \
-                   and not item.is_empty() and item.isVisible():
-                    bounds = item.boundingRect()
-                    if axis_id == item.xAxis():
-                        xmin, xmax = bounds.left(), bounds.right()
-                        if vmin is None or xmin < vmin:
-                            vmin = xmin
-                        if vmax is None or xmax > vmax:
-                            vmax = xmax
-                    elif axis_id == item.yAxis():
-                        ymin, ymax = bounds.top(), bounds.bottom()
-                        if vmin is None or ymin < vmin:
-                            vmin = ymin
-                        if vmax is None or ymax > vmax:
-                            vmax = ymax
+            for item, bounds in items_bounds:
+                if axis_id == item.xAxis():
+                    xmin, xmax = bounds.left(), bounds.right()
+                    if vmin is None or xmin < vmin:
+                        vmin = xmin
+                    if vmax is None or xmax > vmax:
+                        vmax = xmax
+                elif axis_id == item.yAxis():
+                    ymin, ymax = bounds.top(), bounds.bottom()
+                    if vmin is None or ymin < vmin:
+                        vmin = ymin
+                    if vmax is None or ymax > vmax:
+                        vmax = ymax
             if vmin is None or vmax is None:
                 continue
             if vmin == vmax: # same behavior as MATLAB
@@ -6,7 +6,10 @@ Basic geometry functions
 # pylint: disable=C0103
 
 from numpy import (matrix, array, arccos, sign, cos, sin, linalg, vdot,
-                   pi, sqrt, fabs, arctan)
+                   pi, sqrt, fabs, arctan, asarray, frombuffer, float64)
+
+from guidata.qt.QtGui import QPolygonF
+from guidata.qt.QtCore import QPointF, QLineF
 
 
 #===============================================================================
@@ -69,6 +72,51 @@ def vector_angle(dx, dy):
         return sy*(pi*(sy-1)+acos)+pi*(1-sy**2)*(1-sx)*.5
 
 
+#===============================================================================
+# Conversion of NumPy arrays to Qt polygons
+#===============================================================================
+
+def array_to_polygon(points):
+    """
+    Return QPolygonF object from (N, 2) array *points*
+    
+    The pre-sized polygon is filled through its memory buffer (no Python call 
+    per point) when supported by Qt bindings (i.e. with PyQt)
+    """
+    points = asarray(points, dtype=float64).reshape(-1, 2)
+    size = points.shape[0]
+    polygon = QPolygonF(size)
+    if size == 0:
+        return polygon
+    try:
+        pointer = polygon.data()
+        pointer.setsize(2*size*points.itemsize)
+    except AttributeError:
+        # Polygon memory buffer is not accessible (e.g. with PySide)
+        return QPolygonF([QPointF(x, y) for x, y in points.tolist()])
+    frombuffer(pointer, float64)[:] = points.ravel()
+    return polygon
+
+def array_to_point_pairs(points):
+    """
+    Return line segments from (2N, 2) array *points* (N point pairs), to be 
+    drawn at once with `QPainter.drawLines`
+    
+    The point array is filled through its memory buffer when supported by Qt 
+    bindings (i.e. `sip.array` with PyQt5 >= 5.15), otherwise a list of 
+    QLineF objects is returned
+    """
+    points = asarray(points, dtype=float64).reshape(-1, 2)
+    try:
+        from PyQt5.sip import array as sip_array
+        pairs = sip_array(QPointF, points.shape[0])
+        frombuffer(pairs, float64)[:] = points.ravel()
+    except (ImportError, TypeError, ValueError):
+        # sip.array is not available or does not match Qt bindings
+        return [QLineF(*line) for line in points.reshape(-1, 4).tolist()]
+    return pairs
+
+
 #===============================================================================
 # Misc.
 #===============================================================================
@@ -36,6 +36,8 @@ Reference
 .. autoclass:: HistogramItem
    :members:
    :inherited-members:
+.. autoclass:: CumulativeHistogram
+   :members:
 .. autoclass:: ContrastAdjustment
    :members:
    :inherited-members:
@@ -45,6 +47,8 @@ Reference
 """
 
 import weakref
+import threading
+import traceback
 import numpy as np
 from guidata.qt.QtCore import Qt, Signal
 from guidata.qt.QtGui import QHBoxLayout, QVBoxLayout, QToolBar
@@ -62,7 +66,7 @@ from guiqwt.interfaces import (IBasePlotItem, IHistDataSource,
                                IVoiImageItemType, IPanel)
 from guiqwt.panels import PanelWidget, ID_CONTRAST
 from guiqwt.curve import CurveItem, CurvePlot
-from guiqwt.image import ImagePlot
+from guiqwt.image import ImagePlot, BaseImageItem
 from guiqwt.styles import HistogramParam, CurveParam
 from guiqwt.shapes import XRangeSelection
 from guiqwt.tools import (SelectTool, BasePlotMenuTool, SelectPointTool,
@@ -79,21 +83,96 @@ class HistDataSource(object):
     def __init__(self, data):
         self.data = data
 
-    def get_histogram(self, nbins):
-        """Returns the histogram computed for nbins bins"""
+    def get_histogram(self, nbins, approximate=False):
+        """Returns the histogram computed for nbins bins
+        (histogram is always exact: *approximate* is ignored)"""
         return np.histogram(self.data, nbins)
 
 assert_interfaces_valid(HistDataSource)
 
 
+class CumulativeHistogram(object):
+    """
+    Cumulative histogram, used to compute percentile-based clip levels 
+    (e.g. LUT range eliminating outliers): once built, each clip level 
+    is found with a binary search
+    
+    counts: histogram counts
+    edges: bin edges (one more element than *counts*)
+    vmax: maximum level (default: last bin edge)
+    
+    See :py:meth:`CumulativeHistogram.from_data` to build it from data.
+    """
+    INTEGER_MAX_RANGE = 1 << 16 # Max. range of integer data exact histograms
+    SAMPLE_SIZE = 1 << 20 # Sample size of huge data quantiles
+    MAX_QUANTILES = 1 << 16 # Max. number of quantiles kept from sample
+    CHUNK_SIZE = 1 << 22 # Data chunk size for integer data counting
+    
+    def __init__(self, counts, edges, vmax=None):
+        counts = np.concatenate((counts, [0]))
+        self.edges = np.asarray(edges)
+        self.vmax = self.edges[-1] if vmax is None else vmax
+        self._cumsum = np.cumsum(counts)
+        self._rcumsum = np.cumsum(np.flipud(counts))
+    
+    @classmethod
+    def from_data(cls, data, bins=256):
+        """
+        Return cumulative histogram of *data* (NumPy array):
+            * integer data: exact histogram (one bin per integer level, 
+              computed with `np.bincount`), unless data range exceeds 
+              `INTEGER_MAX_RANGE` or 4 times data size
+            * data bigger than 4 times `SAMPLE_SIZE`: quantiles estimated 
+              from a strided data subsample (at most `MAX_QUANTILES`)
+            * otherwise: histogram with *bins* bins (`np.histogram`)
+        
+        Histogram size is bounded whatever the data range, so that it may 
+        be cached with image data.
+        """
+        data = np.asarray(data)
+        if data.size and data.dtype.kind in 'biu':
+            vmin, vmax = int(data.min()), int(data.max())
+            if vmax-vmin < min(cls.INTEGER_MAX_RANGE, 4*data.size):
+                nlevels = vmax-vmin+1
+                counts = np.zeros(nlevels, dtype=np.int64)
+                flat = data.ravel()
+                for i0 in range(0, flat.size, cls.CHUNK_SIZE):
+                    chunk = flat[i0:i0+cls.CHUNK_SIZE].astype(np.int64)-vmin
+                    counts += np.bincount(chunk, minlength=nlevels)
+                return cls(counts, np.arange(vmin, vmax+2), vmax)
+        if data.size > 4*cls.SAMPLE_SIZE and data.dtype.kind in 'biuf':
+            step = int(np.ceil(np.sqrt(data.size/float(cls.SAMPLE_SIZE))))
+            if data.ndim == 2:
+                sample = data[::step, ::step].ravel()
+            else:
+                sample = data.ravel()[::step**2]
+            sample = np.sort(sample[np.isfinite(sample)])
+            if sample.size > cls.MAX_QUANTILES:
+                # Sorted sample is subsampled again (i.e. into quantiles):
+                step = int(np.ceil(sample.size/float(cls.MAX_QUANTILES)))
+                sample = sample[::step]
+            if sample.size:
+                # Each sample is a bin (quantiles are sample values):
+                edges = np.concatenate((sample, sample[-1:]))
+                return cls(np.ones(sample.size), edges)
+        counts, edges = np.histogram(data, bins)
+        return cls(counts, edges)
+    
+    def get_range(self, percent):
+        """Return levels (vmin, vmax) eliminating percent/2*N counts on each 
+        side of the histogram (where N is the total count number)"""
+        threshold = .5*percent/100*self._cumsum[-1]
+        i_bin_min = self._cumsum.searchsorted(threshold)
+        i_bin_max = -1-self._rcumsum.searchsorted(threshold)
+        return self.edges[i_bin_min], min(self.edges[i_bin_max], self.vmax)
+
 def hist_range_threshold(hist, bin_edges, percent):
-    hist = np.concatenate((hist, [0]))
-    threshold = .5*percent/100*hist.sum()
-    i_bin_min = np.cumsum(hist).searchsorted(threshold)
-    i_bin_max = -1-np.cumsum(np.flipud(hist)).searchsorted(threshold)
-    return bin_edges[i_bin_min], bin_edges[i_bin_max]
+    return CumulativeHistogram(hist, bin_edges).get_range(percent)
 
 def lut_range_threshold(item, bins, percent):
+    if isinstance(item, BaseImageItem):
+        # Cumulative histogram is cached by image item:
+        return item.get_cumulative_histogram(bins).get_range(percent)
     hist, bin_edges = item.get_histogram(bins)
     return hist_range_threshold(hist, bin_edges, percent)
 
@@ -110,6 +189,11 @@ class HistogramItem(CurveItem):
         self.source = None
         self.logscale = None
         self.old_logscale = None
+        # If True, histogram is estimated from a data subsample until exact 
+        # histogram is available (the latter being computed by the plot 
+        # widget, see LevelsHistogram.request_exact_histogram):
+        self.approximate = False
+        self._histogram = None
         if curveparam is None:
             curveparam = CurveParam(_("Curve"), icon='curve.png')
             curveparam.curvestyle = "Steps"
@@ -167,27 +251,34 @@ class HistogramItem(CurveItem):
         return self.bins
         
     def compute_histogram(self):
+        if self.approximate:
+            return self.get_hist_source().get_histogram(self.bins,
+                                                        approximate=True)
         return self.get_hist_source().get_histogram(self.bins)
         
     def update_histogram(self):
         if self.get_hist_source() is None:
             return
-        hist, bin_edges = self.compute_histogram()
+        res = self.compute_histogram()
+        if res is self._histogram and self.bins == self.old_bins\
+           and self.logscale == self.old_logscale:
+            # Same (cached) histogram: nothing to update
+            return
+        self._histogram = res
+        hist, bin_edges = res
         hist = np.concatenate((hist, [0]))
         if self.logscale:
             hist = np.log(hist+1)
 
         self.set_data(bin_edges, hist)
-        # Autoscale only if logscale/bins have changed
-        if self.bins != self.old_bins or self.logscale != self.old_logscale:
-            if self.plot():
-                self.plot().do_autoscale()
         self.old_bins = self.bins
         self.old_logscale = self.logscale
         
         plot = self.plot()
         if plot is not None:
             plot.do_autoscale(replot=True)
+            if self.approximate:
+                plot.request_exact_histogram(self)
 
     def update_params(self):
         self.histparam.update_hist(self)
@@ -211,11 +302,23 @@ class LevelsHistogram(CurvePlot):
     
     #: Signal emitted by LevelsHistogram when LUT range was changed
     SIG_VOI_CHANGED = Signal()
+    
+    # Signal emitted by the worker thread when an exact histogram is ready
+    _SIG_HISTOGRAM_READY = Signal("PyQt_PyObject")
 
     def __init__(self, parent=None):
         super(LevelsHistogram, self).__init__(parent=parent, title="",
                                               section="histogram")
         self.antialiased = False
+        
+        # Background mode: histograms are first estimated from a data 
+        # subsample (shown at once), exact histograms being then computed 
+        # in a worker thread
+        self.background_mode = True
+        self._hist_jobs = [] # Pending exact histograms: (source, nbins)
+        self._hist_worker = None
+        self._hist_lock = threading.Lock()
+        self._SIG_HISTOGRAM_READY.connect(self._exact_histogram_ready)
 
         # a dict of dict : plot -> selected items -> HistogramItem
         self._tracked_items = {}
@@ -290,6 +393,7 @@ class LevelsHistogram(CurvePlot):
         for item in items:
             if item not in known_items:
                 curve = HistogramItem(self.curveparam, self.histparam)
+                curve.approximate = self.background_mode
                 curve.set_hist_source(item)
                 self.add_item(curve, z=0)
                 known_items[item] = curve
@@ -318,6 +422,50 @@ class LevelsHistogram(CurvePlot):
             self.set_axis_limits("left", ymin, ymax)
             self.replot()
 
+    def request_exact_histogram(self, curve):
+        """Request exact histogram computation for *curve* (HistogramItem 
+        object showing an approximate histogram): histogram is computed 
+        in a worker thread (most recent requests first), then *curve* 
+        is updated"""
+        job = (curve.get_hist_source(), curve.get_bins())
+        if job[0] is None:
+            return
+        with self._hist_lock:
+            if job in self._hist_jobs:
+                self._hist_jobs.remove(job)
+            self._hist_jobs.append(job)
+            if self._hist_worker is None:
+                self._hist_worker = threading.Thread(
+                                        target=self._compute_exact_histograms)
+                self._hist_worker.daemon = True
+                self._hist_worker.start()
+    
+    def _compute_exact_histograms(self):
+        """Worker thread target"""
+        while True:
+            with self._hist_lock:
+                if not self._hist_jobs:
+                    self._hist_worker = None
+                    return
+                source, nbins = self._hist_jobs.pop()
+            try:
+                # Exact histogram is cached by source:
+                source.get_histogram(nbins)
+            except Exception:
+                traceback.print_exc()
+                continue
+            try:
+                self._SIG_HISTOGRAM_READY.emit(source)
+            except RuntimeError:
+                # Histogram widget has been deleted in the meantime
+                return
+    
+    def _exact_histogram_ready(self, source):
+        """Update histogram curves from exact histogram (GUI thread)"""
+        for item, curve in self.tracked_items_gen():
+            if item is source:
+                curve.update_histogram()
+
     def item_removed(self, item):
         for plot, items in list(self._tracked_items.items()):
             if item in items:
@@ -23,6 +23,7 @@ The `image` module provides image-related objects and functions:
     * :py:class:`guiqwt.image.ImageFilterItem`: rectangular filtering area
       that may be resized and moved onto the processed image
     * :py:func:`guiqwt.image.assemble_imageitems`
+    * :py:func:`guiqwt.image.export_imageitems`
     * :py:func:`guiqwt.image.get_plot_source_rect`
     * :py:func:`guiqwt.image.get_image_from_plot`
 
@@ -134,6 +135,8 @@ Reference
    :inherited-members:
 
 .. autofunction:: assemble_imageitems
+.. autofunction:: iter_imageitems_tiles
+.. autofunction:: export_imageitems
 .. autofunction:: get_plot_qrect
 .. autofunction:: get_image_from_plot
 """
@@ -162,8 +165,10 @@ from guiqwt.interfaces import (IBasePlotItem, IBaseImageItem, IHistDataSource,
                                IColormapImageItemType, IVoiImageItemType,
                                ISerializableType, ICSImageItemType,
                                IExportROIImageItemType, IStatsImageItemType)
-from guiqwt.curve import CurvePlot, CurveItem, PolygonMapItem
-from guiqwt.colormap import FULLRANGE, get_cmap, get_cmap_name
+from guiqwt.curve import (CurvePlot, CurveItem, PolygonMapItem,
+                          CurveCollectionItem)
+from guiqwt.colormap import (FULLRANGE, LUT_SIZE, get_cmap, get_cmap_name,
+                             get_colormap_table)
 from guiqwt.styles import (ImageParam, ImageAxesParam, TrImageParam,
                            RGBImageParam, MaskedImageParam, XYImageParam,
                            RawImageParam)
@@ -184,9 +189,10 @@ except ImportError:
                          "python setup.py build_ext --inplace -c mingw32" ), file=sys.stderr)
     raise
 
-LUT_SIZE = 1024
 LUT_MAX  = float(LUT_SIZE-1)
 
+EXPORT_TILE_SIZE = 1024
+
 def _nanmin(data):
     if isinstance(data, np.ma.MaskedArray):
         data = data.data
@@ -232,6 +238,7 @@ class BaseImageItem(QwtPlotItem):
     _can_rotate = False
     _readonly = False
     _private = False
+    HISTOGRAM_SAMPLE_SIZE = 262144 # Approximate histogram data sample size
 
     def __init__(self, data=None, param=None):
         super(BaseImageItem, self).__init__()
@@ -279,6 +286,7 @@ class BaseImageItem(QwtPlotItem):
         self._filename = None # The file this image comes from
 
         self.histogram_cache = None
+        self._data_version = 0 # Incremented each time image data changes
         if data is not None:
             self.set_data(data)
         self.imageparam.update_image(self)
@@ -300,6 +308,27 @@ class BaseImageItem(QwtPlotItem):
                 fname = other_try
         return fname
 
+    def __get_data(self):
+        if self._data_proxy is not None:
+            # Data is loaded lazily: reading it now
+            proxy, self._data_proxy = self._data_proxy, None
+            self._data = proxy.read()
+        return self._data
+
+    def __set_data(self, data):
+        self._data_proxy = None
+        self._data = data
+
+    data = property(__get_data, __set_data, doc="Image data (NumPy array)")
+
+    def get_data_shape(self):
+        """Return image data shape (None if there is no data), without reading
+        data when it is loaded lazily"""
+        if self._data_proxy is not None:
+            return self._data_proxy.shape
+        elif self._data is not None:
+            return self._data.shape
+
     def get_filter(self, filterobj, filterparam):
         """Provides a filter object over this image's content"""
         raise NotImplementedError
@@ -438,15 +467,12 @@ class BaseImageItem(QwtPlotItem):
         self.cmap = table.colorTable(FULLRANGE)
         cmap_a = self.lut[3]
         alpha = self.imageparam.alpha
-        alpha_mask = self.imageparam.alpha_mask
-        for i in range(LUT_SIZE):
-            if alpha_mask:
-                pix_alpha = alpha*(i/float(LUT_SIZE-1))
-            else:
-                pix_alpha = alpha
-            alpha_channel = np.uint32(255*pix_alpha+0.5).clip(0, 255) << 24
-            cmap_a[i] = np.uint32((table.rgb(FULLRANGE, i/LUT_MAX))
-                                  & 0xffffff) | alpha_channel
+        if self.imageparam.alpha_mask:
+            pix_alpha = alpha*np.linspace(0., 1., LUT_SIZE)
+        else:
+            pix_alpha = alpha*np.ones(LUT_SIZE)
+        alpha_channel = (255*pix_alpha+0.5).clip(0, 255).astype(np.uint32) << 24
+        cmap_a[:] = (get_colormap_table(table) & 0xffffff) | alpha_channel
         plot = self.plot()
         if plot:
             plot.update_colormap_axis(self)
@@ -611,7 +637,8 @@ class BaseImageItem(QwtPlotItem):
 
     def is_empty(self):
         """Return True if item data is empty"""
-        return self.data is None or self.data.size == 0
+        shape = self.get_data_shape()
+        return shape is None or np.prod(shape) == 0
 
     def set_selectable(self, state):
         """Set item selectable state"""
@@ -677,38 +704,82 @@ class BaseImageItem(QwtPlotItem):
     def can_sethistogram(self):
         return False
 
-    def get_histogram(self, nbins):
-        """interface de IHistDataSource"""
-        if self.data is None:
+    def get_histogram(self, nbins, approximate=False):
+        """
+        interface de IHistDataSource
+        
+        If *approximate* is True and exact histogram has not been computed 
+        yet, histogram is estimated from a strided subsample of data (counts 
+        being scaled to data size): see `HISTOGRAM_SAMPLE_SIZE`.
+        Exact and approximate histograms are cached per data version 
+        and number of bins.
+        """
+        # Data version is read before data (histogram may be computed 
+        # in a worker thread, see LevelsHistogram)
+        key = (self._data_version, nbins)
+        data = self.data
+        if data is None:
             return [0,], [0, 1]
-        if self.histogram_cache is None \
-           or nbins != self.histogram_cache[0].shape[0]:
-            #from guidata.utils import tic, toc
-            if True:
-                #tic("histo1")
-                res = np.histogram(self.data, nbins)
-                #toc("histo1")
-            else:
-                #TODO: _histogram is faster, but caching is buggy
-                # in this version
-                #tic("histo2")
-                _min = _nanmin(self.data)
-                _max = _nanmax(self.data)
-                if self.data.dtype in (np.float64, np.float32):
-                    bins = np.unique(np.array(np.linspace(_min, _max, nbins+1),
-                                              dtype=self.data.dtype))
+        cache = self.histogram_cache
+        if cache is None:
+            cache = self.histogram_cache = {}
+        if key in cache:
+            return cache[key]
+        if approximate and data.size > 4*self.HISTOGRAM_SAMPLE_SIZE:
+            akey = key+('approximate',)
+            if akey not in cache:
+                step = int(np.ceil(np.sqrt(data.size/
+                                           float(self.HISTOGRAM_SAMPLE_SIZE))))
+                if data.ndim == 2:
+                    sample = data[::step, ::step]
                 else:
-                    bins = np.arange(_min, _max+2,
-                                     dtype=self.data.dtype)
-                res2 = np.zeros((bins.size+1,), np.uint32)
-                _histogram(self.data.flatten(), bins, res2)
-                #toc("histo2")
-                res = res2[1:-1], bins
-            self.histogram_cache = res
+                    sample = data.ravel()[::step**2]
+                hist, bins = np.histogram(sample, nbins)
+                cache[akey] = hist*(float(data.size)/sample.size), bins
+            return cache[akey]
+        #from guidata.utils import tic, toc
+        if True:
+            #tic("histo1")
+            res = np.histogram(data, nbins)
+            #toc("histo1")
         else:
-            res = self.histogram_cache
+            #TODO: _histogram is faster, but caching is buggy
+            # in this version
+            #tic("histo2")
+            _min = _nanmin(data)
+            _max = _nanmax(data)
+            if data.dtype in (np.float64, np.float32):
+                bins = np.unique(np.array(np.linspace(_min, _max, nbins+1),
+                                          dtype=data.dtype))
+            else:
+                bins = np.arange(_min, _max+2,
+                                 dtype=data.dtype)
+            res2 = np.zeros((bins.size+1,), np.uint32)
+            _histogram(data.flatten(), bins, res2)
+            #toc("histo2")
+            res = res2[1:-1], bins
+        cache[key] = res
         return res
 
+    def get_cumulative_histogram(self, nbins):
+        """
+        Return cumulative histogram of image data 
+        (:py:class:`guiqwt.histogram.CumulativeHistogram` object, used 
+        to compute percentile-based LUT ranges), cached per data version 
+        and number of bins
+        """
+        from guiqwt.histogram import CumulativeHistogram
+        key = (self._data_version, nbins, 'cumulative')
+        data = self.data
+        if data is None:
+            return CumulativeHistogram([0,], [0, 1])
+        cache = self.histogram_cache
+        if cache is None:
+            cache = self.histogram_cache = {}
+        if key not in cache:
+            cache[key] = CumulativeHistogram.from_data(data, nbins)
+        return cache[key]
+
     def __process_cross_section(self, ydata, apply_lut):
         if apply_lut:
             a, b, bg, cmap = self.lut
@@ -764,6 +835,45 @@ class BaseImageItem(QwtPlotItem):
         return (self.get_y_values(iy0, iy1),
                 self.__process_cross_section(ydata, apply_lut))
 
+    def get_plot_values(self, x, y, apply_lut=False,
+                        apply_interpolation=False):
+        """
+        Return image levels sampled at plot coordinates `x`, `y` (arrays)
+        
+        Image pixels are sampled directly, with the same conventions as the
+        `export_roi` method (nearest pixel or bilinear interpolation, the 
+        latter being used for all interpolation modes other than 'nearest' 
+        if `apply_interpolation` is True): this is the fast way to extract 
+        a line profile without assembling an image.
+        Return NaN for coordinates outside image.
+        """
+        x, y = np.broadcast_arrays(np.asarray(x, dtype=float),
+                                   np.asarray(y, dtype=float))
+        xpix, ypix = self.get_pixel_coordinates(x, y)
+        xpix, ypix = np.asarray(xpix, float), np.asarray(ypix, float)
+        data = self.data
+        if isinstance(data, np.ma.MaskedArray):
+            data = data.data
+        ni, nj = data.shape[:2]
+        values = np.empty(x.shape, dtype=float)
+        values.fill(np.nan)
+        inside = (xpix >= 0) & (xpix < nj) & (ypix >= 0) & (ypix < ni)
+        xpix, ypix = xpix[inside], ypix[inside]
+        ix, iy = np.floor(xpix).astype(int), np.floor(ypix).astype(int)
+        if apply_interpolation and self.interpolate[0] != INTERP_NEAREST:
+            ix1, iy1 = np.minimum(ix+1, nj-1), np.minimum(iy+1, ni-1)
+            a, b = xpix-ix, ypix-iy
+            v0 = (1-a)*data[iy, ix]+a*data[iy, ix1]
+            v1 = (1-a)*data[iy1, ix]+a*data[iy1, ix1]
+            values[inside] = (1-b)*v0+b*v1
+        else:
+            values[inside] = data[iy, ix]
+        if apply_lut:
+            a, b, _bg, _cmap = self.lut
+            values *= a
+            values += b
+        return values
+
 assert_interfaces_valid(BaseImageItem)
 
 
@@ -780,6 +890,7 @@ class RawImageItem(BaseImageItem):
     """
     __implements__ = (IBasePlotItem, IBaseImageItem, IHistDataSource,
                       IVoiImageItemType, ISerializableType)
+    _can_load_lazily = True # Data may be loaded lazily (see `deserialize_lazy`)
     #---- BaseImageItem API ---------------------------------------------------
     def get_default_param(self):
         """Return instance of the default imageparam DataSet"""
@@ -789,7 +900,7 @@ class RawImageItem(BaseImageItem):
     def __reduce__(self):
         fname = self.get_filename()
         if fname is None:
-            fn_or_data = self.data
+            fn_or_data = io.array_for_pickle(self.data)
         else:
             fn_or_data = fname
         state = self.imageparam, self.get_lut_range(), fn_or_data, self.z()
@@ -815,7 +926,7 @@ class RawImageItem(BaseImageItem):
         data = None if load_from_fname else self.data
         writer.write(load_from_fname, group_name='load_from_fname')
         writer.write(fname, group_name='fname')
-        writer.write(data, group_name='Zdata')
+        io.write_hdf5_array(writer, 'Zdata', data)
         writer.write(self.get_lut_range(), group_name='lut_range')
         writer.write(self.z(), group_name='z')
         self.imageparam.update_param(self)
@@ -823,14 +934,27 @@ class RawImageItem(BaseImageItem):
     
     def deserialize(self, reader):
         """Deserialize object from HDF5 reader"""
+        self._deserialize(reader, lazy=False)
+    
+    def deserialize_lazy(self, reader):
+        """Deserialize object from HDF5 reader, image data being read from 
+        file only when needed (see :py:meth:`set_data_proxy`)"""
+        self._deserialize(reader, lazy=True)
+    
+    def _deserialize(self, reader, lazy):
+        """Deserialize object from HDF5 reader
+        (if `lazy` is True, image data is read only when needed)"""
         lut_range = reader.read(group_name='lut_range')
         if reader.read(group_name='load_from_fname'):
             self.set_filename(reader.read(group_name='fname',
                                           func=reader.read_unicode))
             self.load_data()
         else:
-            data = reader.read(group_name='Zdata', func=reader.read_array)
-            self.set_data(data)
+            data = io.read_hdf5_array(reader, 'Zdata', lazy=lazy)
+            if isinstance(data, io.HDF5ArrayProxy):
+                self.set_data_proxy(data, lut_range)
+            else:
+                self.set_data(data)
         self.set_lut_range(lut_range)
         self.setZ(reader.read('z'))
         self.imageparam = self.get_default_param()
@@ -843,7 +967,8 @@ class RawImageItem(BaseImageItem):
         Load data from *filename* and eventually apply specified lut_range
         *filename* has been set using method 'set_filename'
         """
-        data = io.imread(self.get_filename(), to_grayscale=True)
+        data = io.imread_cached(self.get_filename(), to_grayscale=True,
+                                lazy=True)
         self.set_data(data, lut_range=lut_range)
 
     def set_data(self, data, lut_range=None):
@@ -860,14 +985,34 @@ class RawImageItem(BaseImageItem):
 
         self.data = data
         self.histogram_cache = None
+        self._data_version += 1
         self.update_bounds()
         self.update_border()
         self.set_lut_range([_min, _max])
 
+    def set_data_proxy(self, proxy, lut_range):
+        """
+        Set Image item data proxy: data is read only when needed (e.g. when
+        image is drawn for the first time)
+        
+            * proxy: object with `shape` and `dtype` attributes and a `read`
+              method returning the 2D NumPy array
+              (e.g. :py:class:`guiqwt.io.HDF5ArrayProxy` instance)
+            * lut_range: LUT range -- tuple (levelmin, levelmax)
+        """
+        self.data = None
+        self._data_proxy = proxy
+        self.histogram_cache = None
+        self._data_version += 1
+        self.update_bounds()
+        self.update_border()
+        self.set_lut_range(lut_range)
+
     def update_bounds(self):
-        if self.data is None:
+        shape = self.get_data_shape()
+        if shape is None:
             return
-        self.bounds = QRectF(0, 0, self.data.shape[1], self.data.shape[0])
+        self.bounds = QRectF(0, 0, shape[1], shape[0])
 
     #---- IBasePlotItem API ---------------------------------------------------
     def types(self):
@@ -927,7 +1072,7 @@ class ImageItem(RawImageItem):
     def __reduce__(self):
         fname = self.get_filename()
         if fname is None:
-            fn_or_data = self.data
+            fn_or_data = io.array_for_pickle(self.data)
         else:
             fn_or_data = fname
         (xmin, xmax), (ymin, ymax) = self.get_xdata(), self.get_ydata()
@@ -959,9 +1104,10 @@ class ImageItem(RawImageItem):
         writer.write(ymin, group_name='ymin')
         writer.write(ymax, group_name='ymax')
     
-    def deserialize(self, reader):
-        """Deserialize object from HDF5 reader"""
-        super(ImageItem, self).deserialize(reader)
+    def _deserialize(self, reader, lazy):
+        """Deserialize object from HDF5 reader
+        (if `lazy` is True, image data is read only when needed)"""
+        super(ImageItem, self)._deserialize(reader, lazy)
         for attr in ('xmin', 'xmax', 'ymin', 'ymax'):
             # Note: do not be tempted to write the symetric code in `serialize`
             # because calling `get_xdata` and `get_ydata` is necessary
@@ -974,7 +1120,7 @@ class ImageItem(RawImageItem):
         if xmin is None:
             xmin = 0.
         if xmax is None:
-            xmax = self.data.shape[1]
+            xmax = self.get_data_shape()[1]
         return xmin, xmax
 
     def get_ydata(self):
@@ -983,7 +1129,7 @@ class ImageItem(RawImageItem):
         if ymin is None:
             ymin = 0.
         if ymax is None:
-            ymax = self.data.shape[0]
+            ymax = self.get_data_shape()[0]
         return ymin, ymax
 
     def set_xdata(self, xmin=None, xmax=None):
@@ -993,7 +1139,7 @@ class ImageItem(RawImageItem):
         self.ymin, self.ymax = ymin, ymax
 
     def update_bounds(self):
-        if self.data is None:
+        if self.get_data_shape() is None:
             return
         (xmin, xmax), (ymin, ymax) = self.get_xdata(), self.get_ydata()
         self.bounds = QRectF(QPointF(xmin, ymin), QPointF(xmax, ymax))
@@ -1124,6 +1270,7 @@ class QuadGridItem(RawImageItem):
 
         self.data = data
         self.histogram_cache = None
+        self._data_version += 1
         if X is not None:
             assert Y is not None
             self.X = X
@@ -1166,6 +1313,7 @@ class TrImageItem(RawImageItem):
     _can_resize = True
     _can_rotate = True
     _can_move = True
+    _can_load_lazily = False
     def __init__(self, data=None, param=None):
         self.tr = np.eye(3, dtype=float)
         self.itr = np.eye(3, dtype=float)
@@ -1253,8 +1401,10 @@ class TrImageItem(RawImageItem):
 
     def get_pixel_coordinates(self, xplot, yplot):
         """Return (image) pixel coordinates (from plot coordinates)"""
-        v = self.tr*colvector(xplot, yplot)
-        xpixel, ypixel, _ = v[:, 0]
+        # Written without `colvector` to support coordinate arrays
+        (xx, xy, x0), (yx, yy, y0) = self.tr.A[:2]
+        xpixel = xx*xplot+xy*yplot+x0
+        ypixel = yx*xplot+yy*yplot+y0
         return xpixel, ypixel
 
     def get_plot_coordinates(self, xpixel, ypixel):
@@ -1388,6 +1538,23 @@ class TrImageItem(RawImageItem):
 assert_interfaces_valid(TrImageItem)
 
 
+def _get_export_src_rect(src_qrect, destw, desth):
+    """Return source rectangle coordinates (list) used to export `src_qrect`
+    area to a `destw` x `desth` destination image"""
+    src_rect = list(src_qrect.getCoords())
+    # The source QRect is generally coming from a rectangle shape which is 
+    # adjusted to fit a given ROI on the image. So the rectangular area is 
+    # aligned with image pixel edges: to avoid any rounding error, we reduce
+    # the rectangle area size by one half of a pixel, so that the area is now 
+    # aligned with the center of image pixels.
+    pixel_width = src_qrect.width()/float(destw)
+    pixel_height = src_qrect.height()/float(desth)
+    src_rect[0] += .5*pixel_width
+    src_rect[1] += .5*pixel_height
+    src_rect[2] -= .5*pixel_width
+    src_rect[3] -= .5*pixel_height
+    return src_rect
+
 def assemble_imageitems(items, src_qrect, destw, desth, align=None,
                         add_images=False, apply_lut=False,
                         apply_interpolation=False,
@@ -1416,19 +1583,7 @@ def assemble_imageitems(items, src_qrect, destw, desth, align=None,
         dst_image = output
 
     dst_rect = (0, 0, aligned_destw, aligned_desth)
-    
-    src_rect = list(src_qrect.getCoords())
-    # The source QRect is generally coming from a rectangle shape which is 
-    # adjusted to fit a given ROI on the image. So the rectangular area is 
-    # aligned with image pixel edges: to avoid any rounding error, we reduce
-    # the rectangle area size by one half of a pixel, so that the area is now 
-    # aligned with the center of image pixels.
-    pixel_width = src_qrect.width()/float(destw)
-    pixel_height = src_qrect.height()/float(desth)
-    src_rect[0] += .5*pixel_width
-    src_rect[1] += .5*pixel_height
-    src_rect[2] -= .5*pixel_width
-    src_rect[3] -= .5*pixel_height
+    src_rect = _get_export_src_rect(src_qrect, destw, desth)
 
     for it in sorted(items, key=lambda obj: -obj.z()):
         if it.isVisible() and src_qrect.intersects(it.boundingRect()):
@@ -1442,6 +1597,97 @@ def assemble_imageitems(items, src_qrect, destw, desth, align=None,
                 output += dst_image
     return output
 
+def iter_imageitems_tiles(items, src_qrect, destw, desth,
+                          tile_size=EXPORT_TILE_SIZE, add_images=False,
+                          apply_lut=False, apply_interpolation=False,
+                          original_resolution=False):
+    """
+    Assemble together image items in qrect (`QRectF` object), tile by tile:
+    this is a generator yielding (x0, y0, tile) tuples where (x0, y0) is the
+    top-left corner of the `tile` array (float32, at most `tile_size` x 
+    `tile_size`) in the `destw` x `desth` destination image.
+    
+    Tiles are yielded in row-major order and the result is the same as 
+    :py:func:`guiqwt.image.assemble_imageitems` but peak memory usage is 
+    bounded by the tile size instead of the destination image size.
+    
+    .. warning::
+
+        Does not support `XYImageItem` objects
+    """
+    destw, desth = int(destw), int(desth)
+    sx0, sy0, sx1, sy1 = _get_export_src_rect(src_qrect, destw, desth)
+    # Destination pixel size in plot coordinates: for all export routines,
+    # the source rectangle is mapped onto the whole destination array
+    pdx = (sx1-sx0)/float(destw)
+    pdy = (sy1-sy0)/float(desth)
+    items = [it for it in sorted(items, key=lambda obj: -obj.z())
+             if it.isVisible() and src_qrect.intersects(it.boundingRect())]
+    for y0 in range(0, desth, tile_size):
+        th = min(tile_size, desth-y0)
+        for x0 in range(0, destw, tile_size):
+            tw = min(tile_size, destw-x0)
+            tile = np.zeros((th, tw), np.float32)
+            if add_images:
+                dst_image = np.empty_like(tile)
+            else:
+                dst_image = tile
+            src_rect = (sx0+x0*pdx, sy0+y0*pdy,
+                        sx0+(x0+tw)*pdx, sy0+(y0+th)*pdy)
+            tile_qrect = QRectF(QPointF(src_rect[0]-.5*pdx,
+                                        src_rect[1]-.5*pdy),
+                                QPointF(src_rect[2]+.5*pdx,
+                                        src_rect[3]+.5*pdy)).normalized()
+            for it in items:
+                if not tile_qrect.intersects(it.boundingRect()):
+                    continue
+                if add_images:
+                    dst_image.fill(0)
+                it.export_roi(src_rect=src_rect, dst_rect=(0, 0, tw, th),
+                              dst_image=dst_image, apply_lut=apply_lut,
+                              apply_interpolation=apply_interpolation,
+                              original_resolution=original_resolution)
+                if add_images:
+                    tile += dst_image
+            yield x0, y0, tile
+
+def export_imageitems(fname, items, src_qrect, destw, desth, dtype=None,
+                      norm_range=False, tile_size=EXPORT_TILE_SIZE,
+                      add_images=False, apply_lut=False,
+                      apply_interpolation=False, original_resolution=False):
+    """
+    Assemble together image items in qrect (`QRectF` object) and save the
+    resulting `destw` x `desth` image to file `fname` (see 
+    :py:func:`guiqwt.io.imwrite_tiles` for supported file types), tile by tile,
+    without ever allocating the whole destination image in memory
+    
+    dtype: destination data type (default: float32)
+    norm_range: scale levels to `dtype` maximum range (this requires a first 
+    pass on all tiles to compute the destination image data range)
+    """
+    if dtype is None:
+        dtype = np.float32
+    dtype = np.dtype(dtype)
+    kwargs = dict(tile_size=tile_size, add_images=add_images,
+                  apply_lut=apply_lut, apply_interpolation=apply_interpolation,
+                  original_resolution=original_resolution)
+    if norm_range:
+        dmin, dmax = None, None
+        for _x0, _y0, tile in iter_imageitems_tiles(items, src_qrect,
+                                                    destw, desth, **kwargs):
+            tmin, tmax = tile.min(), tile.max()
+            dmin = tmin if dmin is None else min(dmin, tmin)
+            dmax = tmax if dmax is None else max(dmax, tmax)
+        def convert(tile):
+            return io.scale_data_to_dtype(tile, dtype, dmin=dmin, dmax=dmax)
+    else:
+        def convert(tile):
+            return np.array(tile, dtype)
+    tiles = ((x0, y0, convert(tile)) for x0, y0, tile
+             in iter_imageitems_tiles(items, src_qrect, destw, desth, **kwargs))
+    io.imwrite_tiles(fname, tiles, (int(desth), int(destw)), dtype,
+                     tile_size=tile_size)
+
 def get_plot_qrect(plot, p0, p1):
     """
     Return `QRectF` rectangle object in plot coordinates
@@ -1573,6 +1819,7 @@ class XYImageItem(RawImageItem):
           (:py:class:`guiqwt.styles.XYImageParam` instance)
     """
     __implements__ = (IBasePlotItem, IBaseImageItem, ISerializableType)
+    _can_load_lazily = False
     def __init__(self, x=None, y=None, data=None, param=None):
         # if x and y are not increasing arrays, sort them and data accordingly
         if not np.all(np.diff(x) >= 0):
@@ -1598,7 +1845,7 @@ class XYImageItem(RawImageItem):
     def __reduce__(self):
         fname = self.get_filename()
         if fname is None:
-            fn_or_data = self.data
+            fn_or_data = io.array_for_pickle(self.data)
         else:
             fn_or_data = fname
         state = (self.imageparam, self.get_lut_range(),
@@ -1717,6 +1964,7 @@ class RGBImageItem(ImageItem):
           (:py:class:`guiqwt.styles.RGBImageParam` instance)
     """
     __implements__ = (IBasePlotItem, IBaseImageItem, ISerializableType)
+    _can_load_lazily = False
     def __init__(self, data=None, param=None):
         self.orig_data = None
         super(RGBImageItem, self).__init__(data, param)
@@ -1762,7 +2010,7 @@ class RGBImageItem(ImageItem):
         Load data from *filename*
         *filename* has been set using method 'set_filename'
         """
-        data = io.imread(self.get_filename(), to_grayscale=False)
+        data = io.imread_cached(self.get_filename(), to_grayscale=False)
         self.set_data(data)
 
     def set_data(self, data):
@@ -1829,6 +2077,7 @@ class MaskedImageItem(ImageItem):
     """
     __implements__ = (IBasePlotItem, IBaseImageItem, IHistDataSource,
                       IVoiImageItemType)
+    _can_load_lazily = False
     def __init__(self, data=None, mask=None, param=None):
         self.orig_data = None
         self._mask = mask
@@ -1845,16 +2094,24 @@ class MaskedImageItem(ImageItem):
     def __reduce__(self):
         fname = self.get_filename()
         if fname is None:
-            fn_or_data = self.data
+            fn_or_data = io.array_for_pickle(self.data)
         else:
             fn_or_data = fname
+        mask = None
+        if isinstance(fn_or_data, np.ma.MaskedArray):
+            # Pickling data and mask as plain arrays (out-of-band buffers)
+            fn_or_data, mask = fn_or_data.data, np.ma.getmaskarray(fn_or_data)
         state = (self.imageparam, self.get_lut_range(), fn_or_data, self.z(),
-                 self.get_mask_filename(), self.get_masked_areas())
+                 self.get_mask_filename(), self.get_masked_areas(), mask)
         res = ( self.__class__, (), state )
         return res
 
     def __setstate__(self, state):
-        param, lut_range, fn_or_data, z, mask_fname, old_masked_areas = state
+        if len(state) == 6:
+            # Compatibility with old format
+            state = state+(None,)
+        (param, lut_range, fn_or_data, z, mask_fname, old_masked_areas,
+         mask) = state
         if old_masked_areas and isinstance(old_masked_areas[0], MaskedArea):
             masked_areas = old_masked_areas
         else:
@@ -1870,6 +2127,8 @@ class MaskedImageItem(ImageItem):
             self.load_data(lut_range)
         elif fn_or_data is not None: # should happen only with previous API
             self.set_data(fn_or_data, lut_range=lut_range)
+            if mask is not None:
+                self.set_mask(mask)
         self.setZ(z)
         self.imageparam.update_image(self)
         if mask_fname is not None:
@@ -1929,7 +2188,7 @@ class MaskedImageItem(ImageItem):
         return self._mask_filename
 
     def load_mask_data(self):
-        data = io.imread(self.get_mask_filename(), to_grayscale=True)
+        data = io.imread_cached(self.get_mask_filename(), to_grayscale=True)
         self.set_mask(data)
         self._mask_changed()
 
@@ -2370,7 +2629,7 @@ class Histogram2DItem(BaseImageItem):
     def can_sethistogram(self):
         return True
 
-    def get_histogram(self, nbins):
+    def get_histogram(self, nbins, approximate=False):
         """interface de IHistDataSource"""
         if self.data is None:
             return [0,], [0, 1]
@@ -2388,6 +2647,12 @@ class Histogram2DItem(BaseImageItem):
         res = res2[1:-1], bins
         return res
 
+    def get_cumulative_histogram(self, nbins):
+        """Return cumulative histogram of image data (histogram data being 
+        computed again at each redraw, result is not cached)"""
+        from guiqwt.histogram import CumulativeHistogram
+        return CumulativeHistogram(*self.get_histogram(nbins))
+
 
 assert_interfaces_valid(Histogram2DItem)
 
@@ -2411,7 +2676,8 @@ class ImagePlot(CurvePlot):
         * lock_aspect_ratio: locking aspect ratio (bool)
     """
     DEFAULT_ITEM_TYPE = IImageItemType
-    AUTOSCALE_TYPES = (CurveItem, BaseImageItem, PolygonMapItem)
+    AUTOSCALE_TYPES = (CurveItem, BaseImageItem, PolygonMapItem,
+                       CurveCollectionItem)
     AXIS_CONF_OPTIONS = ("image_axis", "color_axis", "image_axis", None)
     def __init__(self, parent=None,
                  title=None, xlabel=None, ylabel=None, zlabel=None,
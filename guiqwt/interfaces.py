@@ -40,6 +40,11 @@ class ICurveItemType(IItemType):
     """A curve"""
     pass
 
+class ICurveCollectionItemType(IItemType):
+    """A curve collection (traces sharing the same X data: Y data is a 2D 
+    array, so curve tools working on (x, y) data do not apply)"""
+    pass
+
 class IImageItemType(IItemType):
     """An image"""
     pass
@@ -267,9 +272,11 @@ class IBaseImageItem(object):
         return self._can_sethistogram
 
 class IHistDataSource(object):
-    def get_histogram(self, nbins):
+    def get_histogram(self, nbins, approximate=False):
         # this raises NameError but it's here to show what this method
         # should return
+        # (approximate: if True, histogram may be estimated from a subsample 
+        # of data -- exact histogram is returned if already available)
         return numpy.histogram(data, nbins)
         
         
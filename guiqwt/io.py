@@ -14,23 +14,63 @@ guiqwt.io
 The `io` module provides input/output helper functions:
     * :py:func:`guiqwt.io.imread`: load an image (.png, .tiff, 
       .dicom, etc.) and return its data as a NumPy array
+    * :py:func:`guiqwt.io.imread_many`: load images in parallel (generator)
+    * :py:func:`guiqwt.io.imread_info`: return image shape and data type 
+      without reading image data
+    * :py:func:`guiqwt.io.imread_raw`: load (or memory-map) raw binary 
+      image data
+    * :py:func:`guiqwt.io.imread_cached`: load an image, sharing decoded 
+      data with other callers (LRU cache)
     * :py:func:`guiqwt.io.imwrite`: save an array to an image file
+    * :py:func:`guiqwt.io.imwrite_tiles`: save an image to file, tile by tile
+    * :py:func:`guiqwt.io.index_dicom_series`: index DICOM series of a 
+      directory (reading file headers only)
+    * :py:func:`guiqwt.io.imread_series`: load images of a DICOM series
+    * :py:func:`guiqwt.io.read_text_array`: delimited text file reader
+    * :py:func:`guiqwt.io.write_text_array`: delimited text file writer
     * :py:func:`guiqwt.io.load_items`: load plot items from HDF5
     * :py:func:`guiqwt.io.save_items`: save plot items to HDF5
+    * :py:func:`guiqwt.io.write_hdf5_array`: save an array to HDF5 
+      (chunked and compressed dataset)
+    * :py:func:`guiqwt.io.read_hdf5_array`: load an array from HDF5 
+      (optionally as a lazy :py:class:`guiqwt.io.HDF5ArrayProxy` object)
+    * :py:func:`guiqwt.io.dumps_items`: pickle plot items with out-of-band 
+      array buffers
+    * :py:func:`guiqwt.io.loads_items`: unpickle plot items from out-of-band 
+      array buffers
 
 Reference
 ~~~~~~~~~
 
 .. autofunction:: imread
+.. autofunction:: imread_many
+.. autofunction:: imread_info
+.. autofunction:: imread_raw
+.. autofunction:: imread_cached
 .. autofunction:: imwrite
+.. autofunction:: imwrite_tiles
+.. autofunction:: index_dicom_series
+.. autofunction:: imread_series
+.. autofunction:: read_text_array
+.. autofunction:: write_text_array
 .. autofunction:: load_items
 .. autofunction:: save_items
+.. autofunction:: write_hdf5_array
+.. autofunction:: read_hdf5_array
+.. autoclass:: HDF5ArrayProxy
+   :members:
+.. autofunction:: dumps_items
+.. autofunction:: loads_items
 """
 
 from __future__ import print_function
 
 import sys
+import os
 import re
+import warnings
+import threading
+import collections
 import os.path as osp
 import numpy as np
 
@@ -40,23 +80,29 @@ from guidata.py3compat import is_text_string, to_text_string
 from guiqwt.config import _
 
     
-def scale_data_to_dtype(data, dtype):
+def scale_data_to_dtype(data, dtype, dmin=None, dmax=None):
     """Scale array `data` to fit datatype `dtype` dynamic range
     
+    `dmin` and `dmax` (optional) are the data range bounds to be mapped on 
+    the datatype range (default: `data` minimum and maximum values), e.g. when
+    scaling an image tile by tile
+    
     WARNING: modifies data in place"""
     info = np.iinfo(dtype)
-    dmin = data.min()
-    dmax = data.max()
+    if dmin is None:
+        dmin = data.min()
+    if dmax is None:
+        dmax = data.max()
     data -= dmin
     data *= float(info.max-info.min)/(dmax-dmin)
     data += float(info.min)
     return np.array(data, dtype)
         
 def eliminate_outliers(data, percent=2., bins=256):
-    """Eliminate data histogram outliers"""
-    hist, bin_edges = np.histogram(data, bins)
-    from guiqwt.histogram import hist_range_threshold
-    vmin, vmax = hist_range_threshold(hist, bin_edges, percent)
+    """Eliminate data histogram outliers
+    (see :py:meth:`guiqwt.histogram.CumulativeHistogram.from_data`)"""
+    from guiqwt.histogram import CumulativeHistogram
+    vmin, vmax = CumulativeHistogram.from_data(data, bins).get_range(percent)
     return data.clip(vmin, vmax)
 
 
@@ -67,17 +113,24 @@ class FileType(object):
     """Filetype object:
         * `name` : description of filetype,
         * `read_func`, `write_func` : I/O callbacks,
+        * `lazy_read_func`: read callback returning a memory-mapped array 
+        (optional),
+        * `probe_func`: callback returning image shape and data type without 
+        reading image data (optional),
         * `extensions`: filename extensions (with a dot!) or filenames,
         (list, tuple or space-separated string)
         * `data_types`: supported data types"""        
     def __init__(self, name, extensions, read_func=None, write_func=None,
-                 data_types=None, requires_template=False):
+                 data_types=None, requires_template=False,
+                 lazy_read_func=None, probe_func=None):
         self.name = name
         if is_text_string(extensions):
             extensions = extensions.split()
         self.extensions = [osp.splitext(' '+ext)[1] for ext in extensions]
         self.read_func = read_func
         self.write_func = write_func
+        self.lazy_read_func = lazy_read_func
+        self.probe_func = probe_func
         self.data_types = data_types
         self.requires_template = requires_template
     
@@ -122,7 +175,8 @@ class ImageIOHandler(object):
         return filters
     
     def add(self, name, extensions, read_func=None, write_func=None,
-            import_func=None, data_types=None, requires_template=None):
+            import_func=None, data_types=None, requires_template=None,
+            lazy_read_func=None, probe_func=None):
         if import_func is not None:
             try:
                 import_func()
@@ -131,7 +185,8 @@ class ImageIOHandler(object):
         assert read_func is not None or write_func is not None
         ftype = FileType(name, extensions, read_func=read_func,
                          write_func=write_func, data_types=data_types,
-                         requires_template=requires_template)
+                         requires_template=requires_template,
+                         lazy_read_func=lazy_read_func, probe_func=probe_func)
         self.filetypes.append(ftype)
     
     def _get_filetype(self, ext):
@@ -150,6 +205,20 @@ class ImageIOHandler(object):
         else:
             return ftype.read_func
     
+    def get_lazyreadfunc(self, ext):
+        """Return lazy read function associated to file extension `ext`
+        (read function if file type does not support lazy reading)"""
+        ftype = self._get_filetype(ext)
+        if ftype.lazy_read_func is None:
+            return self.get_readfunc(ext)
+        else:
+            return ftype.lazy_read_func
+    
+    def get_probefunc(self, ext):
+        """Return probe function associated to file extension `ext`
+        (None if file type does not support probing)"""
+        return self._get_filetype(ext).probe_func
+    
     def get_writefunc(self, ext):
         """Return read function associated to file extension `ext`"""
         ftype = self._get_filetype(ext)
@@ -214,6 +283,87 @@ def _imread_pil(filename, to_grayscale=False):
     except SystemError:
         return np.array(img.getdata(), dtype=np.dtype(dtype)).reshape(shape)
 
+# PIL raw modes of uncompressed images which may be memory-mapped:
+PIL_RAW_DTYPES = {
+                  "L": ('|u1', None),
+                  "I;16": ('<u2', None),
+                  "I;16B": ('>u2', None),
+                  "I;16S": ('<i2', None),
+                  "I;32S": ('<i4', None),
+                  "F;32F": ('<f4', None),
+                  "RGB": ('|u1', 3),
+                  "RGBA": ('|u1', 4),
+                  }
+
+def _get_pil_memmap_info(img):
+    """Return (dtype, shape, offset) if PIL image `img` pixel data is stored 
+    uncompressed and contiguous in file (i.e. may be memory-mapped), 
+    None otherwise"""
+    tiles = getattr(img, 'tile', None)
+    if not tiles:
+        return
+    rawmode = tiles[0][3][0] if tiles[0][3] else None
+    if rawmode not in PIL_RAW_DTYPES:
+        return
+    dtype, extra = PIL_RAW_DTYPES[rawmode]
+    dtype = np.dtype(dtype)
+    # Memory-mapped array must be the same as the one read by `_imread_pil`:
+    if img.mode not in DTYPES or DTYPES[img.mode][1] != extra\
+       or np.dtype(DTYPES[img.mode][0]) != dtype or not dtype.isnative:
+        return
+    width, height = img.size
+    shape = (height, width)
+    if extra is not None:
+        shape += (extra,)
+    row_size = width*dtype.itemsize*(extra or 1)
+    offset = tiles[0][2]
+    for decoder, (x0, y0, x1, y1), tile_offset, args in tiles:
+        # Tiles must be raw strips, stored one after the other:
+        if decoder != 'raw' or args[0] != rawmode or x0 != 0 or x1 != width\
+           or tile_offset != offset+y0*row_size\
+           or (len(args) > 1 and args[1] not in (0, row_size))\
+           or (len(args) > 2 and args[2] != 1):
+            return
+    if tiles[-1][1][3] != height:
+        return
+    return dtype, shape, offset
+
+def _imread_pil_lazy(filename, to_grayscale=False):
+    """Open image with PIL and return a NumPy array: memory-mapped array 
+    (copy-on-write) if image is uncompressed (e.g. raw TIFF), 
+    array read by `_imread_pil` otherwise"""
+    import PIL.Image
+    img = PIL.Image.open(filename)
+    info = _get_pil_memmap_info(img)
+    if hasattr(img, 'close'):
+        img.close()
+    if info is None:
+        return _imread_pil(filename, to_grayscale=to_grayscale)
+    dtype, shape, offset = info
+    return np.memmap(filename, dtype=dtype, mode='c', offset=offset,
+                     shape=shape)
+
+def _probe_pil(filename):
+    """Return image shape and data type without decoding pixel data 
+    (same results as `_imread_pil`)"""
+    import PIL.Image
+    img = PIL.Image.open(filename)
+    mode = img.mode
+    if mode in ("CMYK", "YCbCr"):
+        mode = "RGB"
+    elif "A" in mode or (mode == "P" and "transparency" in img.info):
+        mode = "RGBA"
+    elif mode == "P":
+        mode = "RGB"
+    try:
+        dtype, extra = DTYPES[mode]
+    except KeyError:
+        raise RuntimeError("%s mode is not supported" % mode)
+    shape = (img.size[1], img.size[0])
+    if extra is not None:
+        shape += (extra,)
+    return shape, np.dtype(dtype)
+
 def _imwrite_pil(filename, arr):
     """Write `arr` NumPy array to `filename` using PIL"""
     import PIL.Image
@@ -241,64 +391,188 @@ def _imwrite_pil(filename, arr):
 #==============================================================================
 def _import_dcm():
     """DICOM Import function (checking for required libraries):
-    DICOM support requires library `pydicom`"""
-    import logging
-    logger = logging.getLogger("pydicom")
-    logger.setLevel(logging.CRITICAL)
+    DICOM support requires library `pydicom`
+    
+    The library is not imported here (it is imported on first use, see 
+    `_get_dicomio`) to avoid slowing down `guiqwt.io` import"""
     try:
-        # pydicom 1.0
-        from pydicom import dicomio  # analysis:ignore
+        from importlib.util import find_spec
     except ImportError:
-        # pydicom 0.9
-        import dicom as dicomio  # analysis:ignore
-    logger.setLevel(logging.WARNING)
+        # Python 2
+        from pkgutil import find_loader as find_spec
+    if find_spec("pydicom") is None and find_spec("dicom") is None:
+        raise ImportError("DICOM support requires library `pydicom`")
 
-def _imread_dcm(filename):
-    """Open DICOM image with pydicom and return a NumPy array"""
+def _get_dicomio():
+    """Import and return pydicom's `dicomio` module"""
+    import logging
+    logger = logging.getLogger("pydicom")
+    logger.setLevel(logging.CRITICAL)
     try:
         # pydicom 1.0
         from pydicom import dicomio
     except ImportError:
         # pydicom 0.9
         import dicom as dicomio
-    dcm = dicomio.read_file(filename, force=True)
-    # **********************************************************************
-    # The following is necessary until pydicom numpy support is improved:
-    # (after that, a simple: 'arr = dcm.PixelArray' will work the same)
+    logger.setLevel(logging.WARNING)
+    return dicomio
+
+def _get_dcm_dtype(dcm):
+    """Return NumPy data type of DICOM structure `dcm` pixel data"""
     format_str = '%sint%s' % (('u', '')[dcm.PixelRepresentation],
                               dcm.BitsAllocated)
     try:
-        dtype = np.dtype(format_str)
+        return np.dtype(format_str)
     except TypeError:
         raise TypeError("Data type not understood by NumPy: "
                         "PixelRepresentation=%d, BitsAllocated=%d" % (
                         dcm.PixelRepresentation, dcm.BitsAllocated))
-    arr = np.fromstring(dcm.PixelData, dtype)
+
+def _get_dcm_file_dtype(dcm):
+    """Return NumPy data type of DICOM structure `dcm` pixel data, as stored 
+    in file (i.e. with explicit byte order)"""
     try:
         # pydicom 0.9.3:
         dcm_is_little_endian = dcm.isLittleEndian
     except AttributeError:
         # pydicom 0.9.4:
         dcm_is_little_endian = dcm.is_little_endian
-    if dcm_is_little_endian != (sys.byteorder == 'little'):
-        arr.byteswap(True)
+    return _get_dcm_dtype(dcm).newbyteorder('<' if dcm_is_little_endian
+                                            else '>')
+
+def _get_dcm_shape(dcm):
+    """Return shape of DICOM structure `dcm` pixel data array"""
+    shape = (dcm.Rows, dcm.Columns)
     if hasattr(dcm, 'NumberofFrames') and dcm.NumberofFrames > 1:
-        if dcm.SamplesperPixel > 1:
-            arr = arr.reshape(dcm.SamplesperPixel, dcm.NumberofFrames,
-                              dcm.Rows, dcm.Columns)
-        else:
-            arr = arr.reshape(dcm.NumberofFrames, dcm.Rows, dcm.Columns)
+        shape = (dcm.NumberofFrames,)+shape
+    if dcm.SamplesperPixel > 1:
+        shape = (dcm.SamplesperPixel,)+shape
+    return shape
+
+# Transfer syntaxes of uncompressed pixel data (implicit VR little endian, 
+# explicit VR little endian and explicit VR big endian):
+DCM_RAW_TRANSFER_SYNTAXES = ('1.2.840.10008.1.2', '1.2.840.10008.1.2.1',
+                             '1.2.840.10008.1.2.2')
+
+# Explicit VRs which have a 4-byte value length (preceded by 2 reserved bytes)
+DCM_LONG_VRS = (b'OB', b'OD', b'OF', b'OL', b'OW', b'OV', b'SQ', b'UC', b'UN',
+                b'UR', b'UT')
+
+def _get_dcm_encoding(dcm):
+    """Return the encoding of DICOM structure `dcm` data set, as found by 
+    pydicom when reading it: tuple (implicit_vr, little_endian), or None if 
+    unknown"""
+    encoding = getattr(dcm, 'original_encoding', None) # pydicom >= 3.0
+    if encoding is None:
+        for attrs in (('is_implicit_VR', 'is_little_endian'), # pydicom 0.9.4+
+                      ('isImplicitVR', 'isLittleEndian')): # pydicom 0.9.3
+            encoding = tuple(getattr(dcm, attr, None) for attr in attrs)
+            if None not in encoding:
+                break
+    if encoding is not None and None not in encoding:
+        return tuple(bool(value) for value in encoding)
+
+def _read_dcm_header(filename):
+    """Read DICOM file header (without pixel data) and return a tuple 
+    (dcm, offset), where `dcm` is the DICOM structure and `offset` is the 
+    position of uncompressed pixel data in file (None if pixel data is 
+    compressed or could not be located)"""
+    dicomio = _get_dicomio()
+    with open(filename, 'rb') as fd:
+        dcm = dicomio.read_file(fd, force=True, stop_before_pixels=True)
+        # pydicom rewinds file to the start of the pixel data element:
+        header = fd.read(12)
+        offset = fd.tell()
+    syntax = getattr(getattr(dcm, 'file_meta', None), 'TransferSyntaxUID',
+                     None)
+    if syntax is None:
+        # No file meta information (or no transfer syntax in it): the data 
+        # set encoding has been guessed by pydicom
+        encoding = _get_dcm_encoding(dcm)
+        if encoding is None:
+            return dcm, None
+        implicit_vr, little_endian = encoding
+    elif syntax in DCM_RAW_TRANSFER_SYNTAXES:
+        implicit_vr = syntax == DCM_RAW_TRANSFER_SYNTAXES[0]
+        little_endian = syntax != DCM_RAW_TRANSFER_SYNTAXES[2]
     else:
-        if dcm.SamplesperPixel > 1:
-            if dcm.BitsAllocated == 8:
-                arr = arr.reshape(dcm.SamplesperPixel, dcm.Rows, dcm.Columns)
-            else:
-                raise NotImplementedError("This code only handles "
-                            "SamplesPerPixel > 1 if Bits Allocated = 8")
-        else:
-            arr = arr.reshape(dcm.Rows, dcm.Columns)
-    # **********************************************************************
-    return arr
+        return dcm, None
+    if len(header) < 8:
+        return dcm, None
+    order = '<' if little_endian else '>'
+    group, element = np.frombuffer(header[:4], dtype=order+'u2')
+    if (group, element) != (0x7fe0, 0x0010):
+        return dcm, None
+    if implicit_vr:
+        # Implicit VR: tag, value length (4 bytes)
+        length = np.frombuffer(header[4:8], dtype=order+'u4')[0]
+        offset -= 4
+    elif header[4:6] in DCM_LONG_VRS:
+        # Explicit VR: tag, VR, reserved (2 bytes), value length (4 bytes)
+        length = np.frombuffer(header[8:12], dtype=order+'u4')[0]
+    else:
+        # Explicit VR: tag, VR, value length (2 bytes)
+        length = np.frombuffer(header[6:8], dtype=order+'u2')[0]
+        offset -= 4
+    shape = _get_dcm_shape(dcm)
+    if length == 0xFFFFFFFF or\
+       length < int(np.prod(shape))*_get_dcm_dtype(dcm).itemsize:
+        # Undefined length: encapsulated (compressed) pixel data
+        return dcm, None
+    return dcm, offset
+
+def _check_dcm_shape(dcm):
+    """Return shape of DICOM structure `dcm` pixel data array, checking that 
+    it is supported by `_imread_dcm`"""
+    if dcm.SamplesperPixel > 1 and dcm.BitsAllocated != 8\
+       and not (hasattr(dcm, 'NumberofFrames') and dcm.NumberofFrames > 1):
+        raise NotImplementedError("This code only handles "
+                                  "SamplesPerPixel > 1 if Bits Allocated = 8")
+    return _get_dcm_shape(dcm)
+
+def _imread_dcm(filename):
+    """Open DICOM image with pydicom and return a NumPy array
+    
+    Uncompressed pixel data is read directly from file into the array 
+    (pixel data is not loaded in the DICOM structure first)"""
+    dcm, offset = _read_dcm_header(filename)
+    shape = _check_dcm_shape(dcm)
+    dtype = _get_dcm_file_dtype(dcm)
+    if offset is None:
+        dicomio = _get_dicomio()
+        dcm = dicomio.read_file(filename, force=True)
+        arr = np.frombuffer(dcm.PixelData, dtype, count=int(np.prod(shape)))
+        arr = arr.copy()
+    else:
+        with open(filename, 'rb') as fd:
+            fd.seek(offset)
+            arr = np.fromfile(fd, dtype, count=int(np.prod(shape)))
+    if not dtype.isnative:
+        # Swapping bytes in place (no additional memory is allocated):
+        arr = arr.byteswap(True).view(dtype.newbyteorder('='))
+    return arr.reshape(shape)
+
+def _imread_dcm_lazy(filename):
+    """Open DICOM image with pydicom and return a memory-mapped array 
+    (copy-on-write) if pixel data is uncompressed and stored in native byte 
+    order, array read by `_imread_dcm` otherwise
+    
+    Frames of multi-frame images (e.g. cine files) are then read from disk 
+    only when accessed (e.g. `arr[index]`)"""
+    dcm, offset = _read_dcm_header(filename)
+    shape = _check_dcm_shape(dcm)
+    dtype = _get_dcm_file_dtype(dcm)
+    if offset is None or not dtype.isnative:
+        return _imread_dcm(filename)
+    return np.memmap(filename, dtype=dtype, mode='c', offset=offset,
+                     shape=shape)
+
+def _probe_dcm(filename):
+    """Return DICOM image shape and data type without reading pixel data
+    (same results as `_imread_dcm`)"""
+    dicomio = _get_dicomio()
+    dcm = dicomio.read_file(filename, force=True, stop_before_pixels=True)
+    return _get_dcm_shape(dcm), _get_dcm_dtype(dcm)
 
 def _imwrite_dcm(filename, arr, template=None):
     """Save a numpy array `arr` into a DICOM image file `filename`
@@ -327,17 +601,175 @@ def _imwrite_dcm(filename, arr, template=None):
 
 
 #==============================================================================
-# Text files Private I/O functions
+# NumPy and raw binary files Private I/O functions
 #==============================================================================
+def _imread_npy_lazy(filename):
+    """Return memory-mapped array (copy-on-write) from NumPy file"""
+    return np.load(filename, mmap_mode='c')
+
+def _probe_npy(filename):
+    """Return NumPy file array shape and data type (only header is read)"""
+    arr = np.load(filename, mmap_mode='r')
+    return arr.shape, arr.dtype
+
+def imread_raw(fname, shape, dtype, offset=0, order='C', lazy=True):
+    """Return a NumPy array from raw binary file `fname`: image data of 
+    shape `shape` and data type `dtype` starting at byte `offset`, stored 
+    in row-major (`order`='C') or column-major (`order`='F') order.
+    
+    If `lazy` is True, array is memory-mapped (copy-on-write: modifying 
+    the array does not change the file)"""
+    dtype = np.dtype(dtype)
+    if lazy:
+        return np.memmap(fname, dtype=dtype, mode='c', offset=offset,
+                         shape=tuple(shape), order=order)
+    count = int(np.prod(shape))
+    with open(fname, 'rb') as fd:
+        fd.seek(offset)
+        arr = np.fromfile(fd, dtype=dtype, count=count)
+    if arr.size != count:
+        raise IOError("Raw binary file is too small: %s" % fname)
+    return arr.reshape(shape, order=order)
+
+
+#==============================================================================
+# Text files I/O functions
+#==============================================================================
+TXT_DELIMITERS = ('\t', ',', ';')
+TXT_CHUNK_SIZE = 1 << 24 # Text data chunk size (bytes), for chunked parsing
+# np.loadtxt is implemented in C since NumPy 1.23 (pure Python before):
+NUMPY_C_LOADTXT = tuple(int(v) for v in np.__version__.split('.')[:2])\
+                  >= (1, 23)
+
+def _sniff_delimiter(lines):
+    """Return delimiter of delimited text data `lines` (list of bytes):
+    one of `TXT_DELIMITERS` if all lines contain the same number of this 
+    delimiter, None otherwise (i.e. whitespace-separated values)"""
+    lines = [line for line in lines if line.strip()]
+    for delimiter in TXT_DELIMITERS:
+        counts = set([line.count(delimiter.encode()) for line in lines])
+        if len(counts) == 1 and counts.pop() > 0:
+            return delimiter
+
+def _read_text_head(fd):
+    """Return the first complete lines (list of bytes) of text file object 
+    `fd`, and rewind it"""
+    head = fd.read(65536)
+    if fd.read(1):
+        # Ignoring last line which may be incomplete:
+        head = head[:head.rfind(b'\n')+1]
+    fd.seek(0)
+    return head.splitlines()
+
+def read_text_array(fname, delimiter=None):
+    """Return a NumPy array from delimited text file `fname` (same result as 
+    `np.loadtxt`)
+    
+    If `delimiter` is None, it is guessed from the first lines of the file 
+    (tabulation, comma, semicolon or whitespace)
+    
+    Values are parsed by `np.loadtxt` with NumPy >= 1.23; with older NumPy 
+    versions (pure Python `np.loadtxt`), they are parsed chunk by chunk into 
+    a preallocated array, which is faster"""
+    if delimiter is None:
+        with open(fname, 'rb') as fd:
+            delimiter = _sniff_delimiter(_read_text_head(fd)[:20])
+    if not NUMPY_C_LOADTXT:
+        arr = _read_text_chunks(fname, delimiter)
+        if arr is not None:
+            return arr
+    return np.loadtxt(fname, delimiter=delimiter)
+
+def _read_text_chunks(fname, delimiter):
+    """Return a NumPy array from delimited text file `fname`, parsed chunk by 
+    chunk into a preallocated array, or None if the file can't be parsed 
+    this way (comments, missing values, irregular rows, ...)"""
+    delim = None if delimiter is None else delimiter.encode()
+    with open(fname, 'rb') as fd:
+        data_lines = [line for line in _read_text_head(fd) if line.strip()]
+        ncols = len(data_lines[0].split(delim)) if data_lines else 0
+        # Upper bound of row number (exact if there is no blank line):
+        nrows = 1
+        for chunk in iter(lambda: fd.read(TXT_CHUNK_SIZE), b''):
+            nrows += chunk.count(b'\n')
+        fd.seek(0)
+        out = np.empty(nrows*ncols, dtype=float)
+        pos = 0
+        remainder = b''
+        for chunk in iter(lambda: fd.read(TXT_CHUNK_SIZE), b''):
+            chunk = remainder+chunk
+            end = chunk.rfind(b'\n')+1
+            chunk, remainder = chunk[:end], chunk[end:]
+            pos = _parse_text_chunk(chunk, delim, ncols, out, pos)
+            if pos is None:
+                return
+        pos = _parse_text_chunk(remainder, delim, ncols, out, pos)
+    if pos is not None:
+        return np.squeeze(out[:pos].reshape(-1, max(ncols, 1)))
+
+def _check_text_columns(chunk, delim, ncols):
+    """Return True if all non-blank lines of text data `chunk` contain 
+    exactly `ncols` values (values are counted from the positions where 
+    separator runs end, without splitting lines)"""
+    buf = np.frombuffer(chunk, dtype=np.uint8)
+    is_sep = np.zeros(256, dtype=bool)
+    is_sep[list(bytearray(b' \t\r\n\v\f'))] = True
+    if delim is not None:
+        is_sep[ord(delim)] = True
+    is_sep = is_sep[buf]
+    starts = np.flatnonzero(is_sep[:-1] & ~is_sep[1:])+1
+    if buf.size and not is_sep[0]:
+        starts = np.concatenate(([0], starts))
+    newlines = np.flatnonzero(buf == ord(b'\n'))
+    counts = np.bincount(newlines.searchsorted(starts),
+                         minlength=newlines.size+1)
+    return bool(np.all((counts == 0) | (counts == ncols)))
+
+def _parse_text_chunk(chunk, delim, ncols, out, pos):
+    """Parse text data `chunk` (complete lines) and store values in `out` 
+    array, starting at `pos`: return next position, or None if chunk could 
+    not be parsed"""
+    if b'#' in chunk:
+        return
+    nlines = len([line for line in chunk.splitlines() if line.strip()])
+    if not nlines:
+        return pos
+    if delim is not None:
+        chunk = chunk.replace(delim, b' ')
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            values = np.fromstring(chunk, dtype=float, sep=' ')
+    except (ValueError, DeprecationWarning):
+        return
+    if values.size != nlines*ncols\
+       or not _check_text_columns(chunk, delim, ncols):
+        # Irregular rows (number of columns changed)
+        return
+    out[pos:pos+values.size] = values
+    return pos+values.size
+
+def write_text_array(fname, arr, fmt='%.18e', delimiter=' '):
+    """Write 1D or 2D NumPy array `arr` to text file `fname` (same result as 
+    `np.savetxt`): rows are formatted by chunks of values with a single 
+    operation (faster than `np.savetxt` for integer formats, on par with it 
+    for floating point formats)"""
+    arr = np.asarray(arr)
+    if arr.ndim == 1:
+        arr = arr.reshape(-1, 1)
+    nrows, ncols = arr.shape
+    row_fmt = delimiter.join([fmt]*ncols)+'\n'
+    # Number of rows per chunk (~ 1 million values):
+    chunk_rows = max(1, (1 << 20)//max(ncols, 1))
+    with open(fname, 'wb') as fd:
+        for i0 in range(0, nrows, chunk_rows):
+            chunk = arr[i0:i0+chunk_rows]
+            text = (row_fmt*len(chunk)) % tuple(chunk.ravel().tolist())
+            fd.write(text.encode('latin-1'))
+
 def _imread_txt(filename):
     """Open text file image and return a NumPy array"""
-    for delimiter in ('\t', ',', ' ', ';'):
-        try:
-            return np.loadtxt(filename, delimiter=delimiter)
-        except ValueError:
-            continue
-    else:
-        raise
+    return read_text_array(filename)
 
 def _imwrite_txt(filename, arr):
     """Write `arr` NumPy array to text file `filename`"""
@@ -348,9 +780,9 @@ def _imwrite_txt(filename, arr):
         fmt = '%.18e'
     ext = osp.splitext(filename)[1]
     if ext.lower() in (".txt", ".asc", ""):
-        np.savetxt(filename, arr, fmt=fmt)
+        write_text_array(filename, arr, fmt=fmt)
     elif ext.lower() == ".csv":
-        np.savetxt(filename, arr, fmt=fmt, delimiter=',')
+        write_text_array(filename, arr, fmt=fmt, delimiter=',')
 
 
 #==============================================================================
@@ -358,18 +790,21 @@ def _imwrite_txt(filename, arr):
 #==============================================================================
 iohandler.add(_("PNG files"), '*.png',
               read_func=_imread_pil, write_func=_imwrite_pil,
-              data_types=(np.uint8, np.uint16))
+              probe_func=_probe_pil, data_types=(np.uint8, np.uint16))
 iohandler.add(_("TIFF files"), '*.tif *.tiff',
-              read_func=_imread_pil, write_func=_imwrite_pil)
+              read_func=_imread_pil, write_func=_imwrite_pil,
+              lazy_read_func=_imread_pil_lazy, probe_func=_probe_pil)
 iohandler.add(_("8-bit images"), '*.jpg *.gif',
               read_func=_imread_pil, write_func=_imwrite_pil,
-              data_types=(np.uint8,))
+              probe_func=_probe_pil, data_types=(np.uint8,))
 iohandler.add(_("NumPy arrays"), '*.npy',
-              read_func=np.load, write_func=np.save)
+              read_func=np.load, write_func=np.save,
+              lazy_read_func=_imread_npy_lazy, probe_func=_probe_npy)
 iohandler.add(_("Text files"), '*.txt *.csv *.asc',
               read_func=_imread_txt, write_func=_imwrite_txt)
 iohandler.add(_("DICOM files"), '*.dcm', read_func=_imread_dcm,
               write_func=_imwrite_dcm, import_func=_import_dcm,
+              lazy_read_func=_imread_dcm_lazy, probe_func=_probe_dcm,
               data_types=(np.int8, np.uint8, np.int16, np.uint16),
               requires_template=True)
 
@@ -377,24 +812,160 @@ iohandler.add(_("DICOM files"), '*.dcm', read_func=_imread_dcm,
 #==============================================================================
 # Generic image read/write functions
 #==============================================================================
-def imread(fname, ext=None, to_grayscale=False):
+def imread(fname, ext=None, to_grayscale=False, lazy=False):
     """Return a NumPy array from an image filename `fname`.
     
     If `to_grayscale` is True, convert RGB images to grayscale
     The `ext` (optional) argument is a string that specifies the file extension
     which defines the input format: when not specified, the input format is 
-    guessed from filename."""
+    guessed from filename.
+    If `lazy` is True, image data is memory-mapped when the file format 
+    allows it (NumPy .npy files, uncompressed TIFF and DICOM images): data is 
+    then read from disk on demand, without loading the whole file in memory 
+    (the array is copy-on-write: modifying it does not change the file)"""
     if not is_text_string(fname):
         fname = to_text_string(fname) # in case filename is a QString instance
     if ext is None:
         _base, ext = osp.splitext(fname)
-    arr = iohandler.get_readfunc(ext)(fname)
+    if lazy:
+        arr = iohandler.get_lazyreadfunc(ext)(fname)
+    else:
+        arr = iohandler.get_readfunc(ext)(fname)
     if to_grayscale and arr.ndim == 3:
         # Converting to grayscale
         return arr[..., :4].mean(axis=2)
     else:
         return arr
 
+def _imread_job(args):
+    """Read image: `imread_many` job (module-level function, so that it may 
+    be pickled and sent to worker processes)"""
+    fname, ext, to_grayscale = args
+    return imread(fname, ext=ext, to_grayscale=to_grayscale)
+
+def imread_many(fnames, workers=None, ext=None, to_grayscale=False,
+                out=None, processes=False):
+    """Yield NumPy arrays read from image filenames `fnames`, in order, 
+    images being decoded in parallel by `workers` threads (default: number 
+    of CPUs), or processes if `processes` is True: arrays are yielded as soon 
+    as they are available, so that they may be displayed while other images 
+    are still being read (at most 2*`workers` images are read in advance).
+    
+    If `out` is not None, it must be a preallocated array of shape 
+    (len(fnames), height, width) (see `imread_info`): each image is copied 
+    to `out[index]`, which is yielded instead.
+    
+    The `ext` and `to_grayscale` arguments are passed to `imread`: when 
+    reading an image fails, the exception is raised by the generator."""
+    import collections
+    import multiprocessing
+    from multiprocessing.pool import ThreadPool
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    if processes:
+        pool = multiprocessing.Pool(workers)
+    else:
+        pool = ThreadPool(workers)
+    pending = collections.deque()
+    def next_image(index):
+        arr = pending.popleft().get()
+        if out is None:
+            return arr
+        out[index] = arr
+        return out[index]
+    index = 0
+    try:
+        for fname in fnames:
+            if not is_text_string(fname):
+                fname = to_text_string(fname)
+            pending.append(pool.apply_async(_imread_job,
+                                            ((fname, ext, to_grayscale),)))
+            if len(pending) >= 2*workers:
+                yield next_image(index)
+                index += 1
+        while pending:
+            yield next_image(index)
+            index += 1
+    finally:
+        pool.terminate()
+
+def imread_info(fname, ext=None):
+    """Return image shape and data type (tuple) from an image filename `fname`
+    without decoding image data, when the file format allows it (only the 
+    file header is read): otherwise, image data is read.
+    
+    The `ext` (optional) argument is a string that specifies the file extension
+    which defines the input format: when not specified, the input format is 
+    guessed from filename."""
+    if not is_text_string(fname):
+        fname = to_text_string(fname) # in case filename is a QString instance
+    if ext is None:
+        _base, ext = osp.splitext(fname)
+    probe = iohandler.get_probefunc(ext)
+    if probe is None:
+        arr = imread(fname, ext=ext, lazy=True)
+        return arr.shape, arr.dtype
+    return probe(fname)
+
+class ImageCache(object):
+    """Decoded images cache (least recently used images are discarded when 
+    cached arrays size exceeds `max_bytes`)"""
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._arrays = collections.OrderedDict()
+        self._lock = threading.Lock()
+    
+    def __len__(self):
+        return len(self._arrays)
+    
+    def get(self, key):
+        """Return cached array associated to `key` (None if not cached)"""
+        with self._lock:
+            arr = self._arrays.pop(key, None)
+            if arr is not None:
+                self._arrays[key] = arr # Most recently used
+            return arr
+    
+    def add(self, key, arr):
+        """Add array `arr` to cache, associated to `key`"""
+        with self._lock:
+            old = self._arrays.pop(key, None)
+            if old is not None:
+                self.nbytes -= old.nbytes
+            if arr.nbytes > self.max_bytes:
+                return
+            self._arrays[key] = arr
+            self.nbytes += arr.nbytes
+            while self.nbytes > self.max_bytes:
+                _key, old = self._arrays.popitem(last=False)
+                self.nbytes -= old.nbytes
+    
+    def clear(self):
+        """Remove all arrays from cache"""
+        with self._lock:
+            self._arrays.clear()
+            self.nbytes = 0
+
+IMAGE_CACHE = ImageCache(max_bytes=512*1024**2)
+
+def imread_cached(fname, to_grayscale=False, lazy=False):
+    """Return a read-only NumPy array from an image filename `fname` (see 
+    `imread`), shared with other callers reading the same file: decoded 
+    arrays are kept in a process-wide cache (`IMAGE_CACHE`), the file being 
+    decoded again only if it has been modified"""
+    if not is_text_string(fname):
+        fname = to_text_string(fname) # in case filename is a QString instance
+    fname = osp.abspath(fname)
+    stat = os.stat(fname)
+    key = (fname, stat.st_mtime, stat.st_size, to_grayscale)
+    arr = IMAGE_CACHE.get(key)
+    if arr is None:
+        arr = imread(fname, to_grayscale=to_grayscale, lazy=lazy)
+        arr.flags.writeable = False
+        IMAGE_CACHE.add(key, arr)
+    return arr
+
 def imwrite(fname, arr, ext=None, dtype=None, max_range=None, **kwargs):
     """Save a NumPy array to an image filename `fname`.
     
@@ -414,6 +985,185 @@ def imwrite(fname, arr, ext=None, dtype=None, max_range=None, **kwargs):
     iohandler.get_writefunc(ext)(fname, arr, **kwargs)
 
 
+#==============================================================================
+# Tiled image writing
+#==============================================================================
+def _imwrite_tiles_npy(filename, tiles, shape, dtype, tile_size):
+    """Write tiles to a memory-mapped NumPy array file"""
+    arr = np.lib.format.open_memmap(filename, mode='w+', dtype=dtype,
+                                    shape=shape)
+    try:
+        for x0, y0, tile in tiles:
+            th, tw = tile.shape[:2]
+            arr[y0:y0+th, x0:x0+tw] = tile
+        arr.flush()
+    finally:
+        del arr
+
+def _imwrite_tiles_tif(filename, tiles, shape, dtype, tile_size):
+    """Write tiles to a tiled TIFF file (requires `tifffile`)"""
+    import tifffile
+    imwrite_func = getattr(tifffile, 'imwrite', None)
+    if imwrite_func is None:
+        # tifffile < 2018.10.18
+        imwrite_func = tifffile.imsave
+    def padded_tiles():
+        for _x0, _y0, tile in tiles:
+            th, tw = tile.shape[:2]
+            if (th, tw) != (tile_size, tile_size):
+                padded = np.zeros((tile_size, tile_size), dtype)
+                padded[:th, :tw] = tile
+                tile = padded
+            yield tile
+    imwrite_func(filename, padded_tiles(), shape=shape, dtype=dtype,
+                 tile=(tile_size, tile_size))
+
+TILED_WRITERS = {'.npy': _imwrite_tiles_npy,
+                 '.tif': _imwrite_tiles_tif,
+                 '.tiff': _imwrite_tiles_tif}
+
+def imwrite_tiles(fname, tiles, shape, dtype, tile_size, ext=None):
+    """Save an image to filename `fname`, tile by tile, without allocating the
+    whole image in memory.
+    
+    `tiles` is an iterable of (x0, y0, tile) tuples where (x0, y0) is the 
+    top-left corner of the `tile` array in the image of shape `shape` and 
+    data type `dtype`: tiles are expected in row-major order and have at most
+    `tile_size` rows and columns.
+    The `ext` (optional) argument is a string that specifies the file extension
+    which defines the output format: when not specified, the output format is 
+    guessed from filename. Supported formats are NumPy arrays (.npy, written 
+    through a memory-mapped array) and TIFF files (.tif, .tiff, tiled TIFF 
+    written with `tifffile`, tile size must then be a multiple of 16)."""
+    if not is_text_string(fname):
+        fname = to_text_string(fname) # in case filename is a QString instance
+    if ext is None:
+        _base, ext = osp.splitext(fname)
+    try:
+        write_func = TILED_WRITERS[ext.lower()]
+    except KeyError:
+        raise RuntimeError("Unsupported file type (tiled write): '%s'" % ext)
+    write_func(fname, tiles, shape, np.dtype(dtype), tile_size)
+
+def supports_tiled_write(fname):
+    """Return True if image file `fname` may be written tile by tile
+    (see :py:func:`guiqwt.io.imwrite_tiles`)"""
+    ext = osp.splitext(fname)[1].lower()
+    if ext in ('.tif', '.tiff'):
+        try:
+            import tifffile  # analysis:ignore
+        except ImportError:
+            return False
+    return ext in TILED_WRITERS
+
+
+#==============================================================================
+# DICOM series index
+#==============================================================================
+DCM_INDEX_FILENAME = "guiqwt_dicom_index.json"
+DCM_INDEX_VERSION = 2
+
+def _index_dcm_file(filename):
+    """Read DICOM file `filename` header (pixel data is not read) and return 
+    its series index entry (dictionary), or None if file is not a DICOM image
+    (`index_dicom_series` job)"""
+    dicomio = _get_dicomio()
+    try:
+        dcm = dicomio.read_file(filename, force=True, stop_before_pixels=True)
+        shape, dtype = _get_dcm_shape(dcm), _get_dcm_dtype(dcm)
+    except Exception:
+        return
+    spacing = getattr(dcm, 'PixelSpacing', None)
+    if spacing is not None:
+        spacing = [float(value) for value in spacing]
+    stat = os.stat(filename)
+    return dict(filename=osp.basename(filename), dicom=True,
+                mtime=stat.st_mtime, size=stat.st_size,
+                series=to_text_string(getattr(dcm, 'SeriesInstanceUID', '')),
+                description=to_text_string(getattr(dcm, 'SeriesDescription',
+                                                   '')),
+                instance=int(getattr(dcm, 'InstanceNumber', None) or 0),
+                shape=list(shape), dtype=dtype.str, spacing=spacing)
+
+def index_dicom_series(dirname, workers=None, save=True):
+    """Return the index of DICOM series found in directory `dirname`: 
+    dictionary (series instance UID: list of images) where images are 
+    dictionaries (keys: 'filename', 'series', 'description', 'instance', 
+    'shape', 'dtype', 'spacing') sorted by instance number.
+    
+    Only file headers are read (not pixel data), by `workers` threads in 
+    parallel (default: number of CPUs). If `save` is True, the index is saved 
+    in the directory (file `guiqwt_dicom_index.json`): when indexing the same 
+    directory again, only new or modified files are read.
+    
+    Pixel data may then be read with `imread_series`."""
+    import json
+    import multiprocessing
+    from multiprocessing.pool import ThreadPool
+    if not is_text_string(dirname):
+        dirname = to_text_string(dirname)
+    index_fname = osp.join(dirname, DCM_INDEX_FILENAME)
+    cached = {}
+    try:
+        with open(index_fname, 'r') as fd:
+            contents = json.load(fd)
+        if contents.get('version') == DCM_INDEX_VERSION:
+            cached = contents['files']
+    except (IOError, OSError, ValueError, KeyError):
+        pass
+    entries, to_read = {}, []
+    for name in sorted(os.listdir(dirname)):
+        fname = osp.join(dirname, name)
+        if name == DCM_INDEX_FILENAME or not osp.isfile(fname):
+            continue
+        entry = cached.get(name)
+        stat = os.stat(fname)
+        if entry is not None and (entry['mtime'], entry['size'])\
+           == (stat.st_mtime, stat.st_size):
+            entries[name] = entry
+        else:
+            to_read.append((fname, stat))
+    if to_read:
+        if workers is None:
+            workers = multiprocessing.cpu_count()
+        pool = ThreadPool(workers)
+        try:
+            fnames = [fname for fname, _stat in to_read]
+            for (fname, stat), entry in zip(to_read,
+                                            pool.map(_index_dcm_file, fnames)):
+                if entry is None:
+                    # Non-DICOM files are indexed too, so that they are not 
+                    # read again next time (unless they are modified):
+                    entry = dict(mtime=stat.st_mtime, size=stat.st_size,
+                                 dicom=False)
+                entries[osp.basename(fname)] = entry
+        finally:
+            pool.terminate()
+        if save:
+            try:
+                with open(index_fname, 'w') as fd:
+                    json.dump(dict(version=DCM_INDEX_VERSION,
+                                   files=entries), fd)
+            except (IOError, OSError):
+                # Read-only directory
+                pass
+    series = {}
+    for entry in entries.values():
+        if entry['dicom']:
+            entry = dict(entry, filename=osp.join(dirname, entry['filename']))
+            series.setdefault(entry['series'], []).append(entry)
+    for images in series.values():
+        images.sort(key=lambda entry: (entry['instance'], entry['filename']))
+    return series
+
+def imread_series(images, workers=None, out=None):
+    """Yield NumPy arrays read from DICOM series `images` (list of images 
+    from the index returned by `index_dicom_series`), in instance number 
+    order: pixel data is read on demand, see `imread_many`"""
+    return imread_many([entry['filename'] for entry in images],
+                       workers=workers, ext='.dcm', out=out)
+
+
 #==============================================================================
 # Deprecated functions
 #==============================================================================
@@ -438,6 +1188,71 @@ def array_to_imagefile(arr, filename, mode=None, max_range=False):
 # guiqwt plot items I/O
 #==============================================================================
 
+# HDF5 array datasets compression (None, 'gzip' or 'lzf') and chunk size:
+HDF5_COMPRESSION = 'gzip'
+HDF5_COMPRESSION_LEVEL = 4
+HDF5_CHUNK_SIZE = 256
+
+class HDF5ArrayProxy(object):
+    """HDF5 array dataset proxy: data is read from file `filename` 
+    (dataset `path`) only when calling the `read` method"""
+    def __init__(self, filename, path, shape, dtype):
+        self.filename = filename
+        self.path = path
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+    
+    @property
+    def ndim(self):
+        return len(self.shape)
+    
+    @property
+    def size(self):
+        return int(np.prod(self.shape))
+    
+    def read(self):
+        """Read and return array data"""
+        import h5py
+        with h5py.File(self.filename, 'r') as h5file:
+            return h5file[self.path][...]
+    
+    def __array__(self, dtype=None):
+        return self.read() if dtype is None else self.read().astype(dtype)
+
+def write_hdf5_array(writer, group_name, arr):
+    """Write NumPy array `arr` to HDF5 writer (:py:class:`guidata.hdf5io.
+    HDF5Writer` object) in group `group_name`: the dataset is chunked (tiles 
+    of `HDF5_CHUNK_SIZE` pixels for images) and compressed 
+    (see `HDF5_COMPRESSION`)"""
+    if arr is None or not isinstance(arr, np.ndarray) or arr.size == 0\
+       or isinstance(arr, np.ma.MaskedArray) or arr.dtype.hasobject:
+        writer.write(arr, group_name=group_name)
+        return
+    if arr.ndim == 2:
+        chunks = tuple([min(size, HDF5_CHUNK_SIZE) for size in arr.shape])
+    else:
+        chunks = True
+    level = HDF5_COMPRESSION_LEVEL if HDF5_COMPRESSION == 'gzip' else None
+    with writer.group(group_name):
+        group = writer.get_parent_group()
+        group.create_dataset(writer.option[-1], data=arr, chunks=chunks,
+                             compression=HDF5_COMPRESSION,
+                             compression_opts=level,
+                             shuffle=HDF5_COMPRESSION is not None)
+
+def read_hdf5_array(reader, group_name, lazy=False):
+    """Read NumPy array from HDF5 reader (:py:class:`guidata.hdf5io.
+    HDF5Reader` object) in group `group_name`: if `lazy` is True, return a 
+    :py:class:`guiqwt.io.HDF5ArrayProxy` object instead (array data is then 
+    read only on demand, even after the file has been closed)"""
+    if lazy:
+        with reader.group(group_name):
+            dset = reader.get_parent_group().get(reader.option[-1])
+            if dset is not None and getattr(dset, 'shape', None):
+                return HDF5ArrayProxy(dset.file.filename, dset.name,
+                                      dset.shape, dset.dtype)
+    return reader.read(group_name=group_name, func=reader.read_array)
+
 SERIALIZABLE_ITEMS = []
 ITEM_MODULES = {}
 
@@ -449,7 +1264,8 @@ def register_serializable_items(modname, classnames):
 
 # Curves
 register_serializable_items('guiqwt.curve',
-       ['CurveItem', 'PolygonMapItem', 'ErrorBarCurveItem'])
+       ['CurveItem', 'PolygonMapItem', 'ErrorBarCurveItem',
+        'CurveCollectionItem', 'StreamingCurveItem'])
 # Images
 register_serializable_items('guiqwt.image',
        ['RawImageItem', 'ImageItem', 'TrImageItem', 'XYImageItem',
@@ -488,8 +1304,16 @@ def save_item(writer, group_name, item):
             with writer.group('item_class_name'):
                 writer.write_str(item_name_from_object(item))
 
-def load_item(reader, group_name):
-    """Load plot item from HDF5 group"""
+def _deserialize_item(item, reader, lazy):
+    """Deserialize plot item from HDF5 reader, loading image data lazily if 
+    `lazy` is True and if item supports it"""
+    if lazy and getattr(item, '_can_load_lazily', False):
+        item.deserialize_lazy(reader)
+    else:
+        item.deserialize(reader)
+
+def load_item(reader, group_name, lazy=False):
+    """Load plot item from HDF5 group (see `load_items` for `lazy`)"""
     with reader.group(group_name):
         with reader.group('item_class_name'):
             try:
@@ -499,7 +1323,7 @@ def load_item(reader, group_name):
                 return
         klass = item_class_from_name(klass_name)
         item = klass()
-        item.deserialize(reader)
+        _deserialize_item(item, reader, lazy)
     return item
 
 def save_items(writer, items):
@@ -520,9 +1344,12 @@ def save_items(writer, items):
     with writer.group('plot_items'):
         writer.write_sequence(names)
 
-def load_items(reader):
+def load_items(reader, lazy=False):
     """Load items from HDF5 file:
-        * reader: :py:class:`guidata.hdf5io.HDF5Reader` object"""
+        * reader: :py:class:`guidata.hdf5io.HDF5Reader` object
+        * lazy: if True, image data is read from file only when needed 
+          (e.g. when image is drawn for the first time), the HDF5 file may 
+          then be closed but must not be removed"""
     with reader.group('plot_items'):
         names = reader.read_sequence()
     items = []
@@ -532,11 +1359,57 @@ def load_items(reader):
         klass = item_class_from_name(klass_name)
         item = klass()
         with reader.group(name):
-            item.deserialize(reader)
+            _deserialize_item(item, reader, lazy)
         items.append(item)
     return items
 
 
+#==============================================================================
+# Pickle I/O (out-of-band buffers)
+#==============================================================================
+# Pickle protocol 5 (Python >= 3.8) writes array data directly from memory
+# (None: default protocol)
+if sys.version_info >= (3, 8):
+    PICKLE_PROTOCOL = 5
+else:
+    PICKLE_PROTOCOL = None
+
+def array_for_pickle(arr):
+    """Return NumPy array `arr` as a plain NumPy array view (no copy) if it is 
+    an instance of a NumPy array subclass (e.g. memory-mapped array), so that 
+    its data may be pickled as a protocol 5 out-of-band buffer (`arr` is 
+    returned unchanged otherwise, e.g. masked arrays or None)"""
+    if isinstance(arr, np.ndarray) and not isinstance(arr, np.ma.MaskedArray):
+        return arr.view(np.ndarray)
+    return arr
+
+def dumps_items(items):
+    """Pickle plot items `items` and return a tuple (data, buffers), where 
+    `buffers` is the list of out-of-band buffers (:py:class:`pickle.
+    PickleBuffer` objects) holding item arrays data: these buffers are not 
+    copied and may be transferred separately (e.g. through shared memory) 
+    or written directly to file.
+    
+    Out-of-band buffers require Python >= 3.8: otherwise, `buffers` is empty 
+    (arrays data is then included in `data`)"""
+    import pickle
+    buffers = []
+    if sys.version_info >= (3, 8):
+        data = pickle.dumps(items, protocol=5, buffer_callback=buffers.append)
+    else:
+        data = pickle.dumps(items, protocol=pickle.HIGHEST_PROTOCOL)
+    return data, buffers
+
+def loads_items(data, buffers=None):
+    """Unpickle and return plot items from `data` and out-of-band `buffers` 
+    (see `dumps_items`): item arrays are not copied, they share memory with 
+    buffers (arrays are read-only if buffers are read-only)"""
+    import pickle
+    if buffers:
+        return pickle.loads(data, buffers=buffers)
+    return pickle.loads(data)
+
+
 if __name__ == '__main__':
     # Test if items can all be constructed from their Python module
     for name in SERIALIZABLE_ITEMS:
@@ -46,16 +46,18 @@ Reference
    :inherited-members:
 """
 
+import numpy as np
+
 from guidata.qt.QtGui import QPen, QColor, QTextDocument
 from guidata.qt.QtCore import QRectF, QPointF
 
 from guidata.utils import assert_interfaces_valid, update_dataset
-from guidata.py3compat import to_text_string
+from guidata.py3compat import to_text_string, is_text_string
 
 # Local imports
 from guiqwt.transitional import QwtPlotItem
 from guiqwt.config import CONF, _
-from guiqwt.curve import CurveItem
+from guiqwt.curve import CurveItem, CurveRangeStats
 from guiqwt.interfaces import IBasePlotItem, IShapeItemType, ISerializableType
 from guiqwt.styles import LabelParam
 
@@ -529,7 +531,12 @@ class RangeComputation(ObjectInfo):
     curve: CurveItem object
     xrangeselection: XRangeSelection object
     function: input arguments are x, y arrays (extraction of arrays 
-    corresponding to the xrangeselection X-axis range)"""
+    corresponding to the xrangeselection X-axis range), or name of a 
+    statistic computed in constant time from cached cumulative sums (see 
+    :py:class:`guiqwt.curve.CurveRangeStats`: 'xrange', 'yrange', 'mean', 
+    'std', 'trapz' or 'integral')
+    
+    Text is computed again only when range or curve data has changed."""
     def __init__(self, label, curve, xrangeselection, function=None):
         self.label = to_text_string(label)
         self.curve = curve
@@ -537,28 +544,48 @@ class RangeComputation(ObjectInfo):
         if function is None:
             function = lambda x, dx: (x, dx)
         self.func = function
+        self._text = None # Cached text: (key, text)
         
     def set_curve(self, curve):
         self.curve = curve
+        self._text = None
 
     def get_text(self):
         x0, x1 = self.range.get_range()
+        get_version = getattr(self.curve, "get_data_version", None)
+        key = None
+        if get_version is not None:
+            key = (x0, x1, get_version())
+            if self._text is not None and self._text[0] == key:
+                return self._text[1]
         data = self.curve.get_data()
         X = data[0]
         i0 = X.searchsorted(x0)
         i1 = X.searchsorted(x1)
         if i0 > i1:
             i0, i1 = i1, i0
-        vectors = []
-        for vector in data:
-            if vector is None:
-                vectors.append(None)
-            elif i0 == i1:
-                import numpy as np
-                vectors.append(np.array([np.NaN]))
+        if is_text_string(self.func):
+            if i0 == i1:
+                stats, i0, i1 = CurveRangeStats([np.NaN], [np.NaN]), 0, 1
+            elif hasattr(self.curve, "get_range_stats"):
+                stats = self.curve.get_range_stats()
             else:
-                vectors.append(vector[i0:i1])
-        return self.label % self.func(*vectors)
+                stats = CurveRangeStats(*data[:2])
+            res = stats.compute(self.func, i0, i1)
+        else:
+            vectors = []
+            for vector in data:
+                if vector is None:
+                    vectors.append(None)
+                elif i0 == i1:
+                    vectors.append(np.array([np.NaN]))
+                else:
+                    vectors.append(vector[i0:i1])
+            res = self.func(*vectors)
+        text = self.label % res
+        if key is not None:
+            self._text = key, text
+        return text
 
 class RangeComputation2d(ObjectInfo):
     def __init__(self, label, image, rect, function):
@@ -597,4 +624,7 @@ class DataInfoLabel(LabelItem):
             text = []
         for info in self.infos:
             text.append(info.get_text())
-        self.set_text( "<br/>".join(text) )
+        text = "<br/>".join(text)
+        if text != self.text_string:
+            # Avoid updating text document layout when nothing has changed
+            self.set_text(text)
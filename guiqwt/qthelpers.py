@@ -127,10 +127,13 @@ def exec_images_open_dialog(parent, basedir='', app_name=None,
                                 io.iohandler.get_filters('load', dtype=dtype))
     sys.stdin, sys.stdout, sys.stderr = saved_in, saved_out, saved_err
     filenames = [to_text_string(fname) for fname in list(filenames)]
+    # Images are read in parallel, in the background:
+    images = io.imread_many(filenames, to_grayscale=to_grayscale)
     for filename in filenames:
         try:
-            data = io.imread(filename, to_grayscale=to_grayscale)
+            data = next(images)
         except Exception as msg:
+            images.close()
             import traceback
             traceback.print_exc()
             QMessageBox.critical(parent,
@@ -90,7 +90,7 @@ from guiqwt.interfaces import IBasePlotItem, IShapeItemType, ISerializableType
 from guiqwt.styles import (MarkerParam, ShapeParam, RangeShapeParam,
                            AxesShapeParam, MARKERSTYLES)
 from guiqwt.geometry import (vector_norm, vector_projection, vector_rotation,
-                             compute_center)
+                             compute_center, array_to_polygon)
 from guiqwt.baseplot import canvas_to_axes
 
 
@@ -612,18 +612,14 @@ class PolygonShape(AbstractShape):
         
     def get_bounding_rect_coords(self):
         """Return bounding rectangle coordinates (in plot coordinates)"""
-        poly = QPolygonF()
-        shape_points = self.points[:-self.ADDITIONNAL_POINTS]
-        for i in range(shape_points.shape[0]):
-            poly.append(QPointF(shape_points[i, 0], shape_points[i, 1]))
+        npts = max(self.points.shape[0]-self.ADDITIONNAL_POINTS, 0)
+        poly = array_to_polygon(self.points[:npts])
         return poly.boundingRect().getCoords()
         
     def transform_points(self, xMap, yMap):
-        points = QPolygonF()
-        for i in range(self.points.shape[0]):
-            points.append(QPointF(xMap.transform(self.points[i, 0]),
-                                  yMap.transform(self.points[i, 1])))
-        return points
+        points = np.column_stack((xMap.transform(self.points[:, 0]),
+                                  yMap.transform(self.points[:, 1])))
+        return array_to_polygon(points)
     
     def get_reference_point(self):
         if self.points.size:
@@ -683,18 +679,16 @@ class PolygonShape(AbstractShape):
         dist = maxsize
         handle = -1
         Cx, Cy = pos.x(), pos.y()
-        poly = QPolygonF()
         pts = self.points
-        for i in range(pts.shape[0]):
-            # On calcule la distance dans le repère du canvas
-            px = plot.transform(ax, pts[i, 0])
-            py = plot.transform(ay, pts[i, 1])
-            if i < pts.shape[0]-self.ADDITIONNAL_POINTS:
-                poly.append(QPointF(px, py))
-            d = (Cx-px)**2 + (Cy-py)**2
-            if d < dist:
-                dist = d
-                handle = i
+        # On calcule la distance dans le repère du canvas
+        cpts = np.column_stack((plot.transform(ax, pts[:, 0]),
+                                plot.transform(ay, pts[:, 1])))
+        npts = max(pts.shape[0]-self.ADDITIONNAL_POINTS, 0)
+        poly = array_to_polygon(cpts[:npts])
+        if pts.shape[0]:
+            dists = (Cx-cpts[:, 0])**2 + (Cy-cpts[:, 1])**2
+            handle = int(dists.argmin())
+            dist = dists[handle]
         inside = poly.containsPoint(QPointF(Cx, Cy), Qt.OddEvenFill)
         return sqrt(dist), handle, inside, None
 
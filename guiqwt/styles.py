@@ -948,7 +948,10 @@ class ErrorBarParam(DataSet):
 # ===================================================
 # Image parameters
 # ===================================================
-def _create_choices():
+def _create_choices(*args):
+    """Return colormap choices: this function is passed to `ImageChoiceItem` 
+    instead of the list itself, so that colormaps are only enumerated when 
+    choices are needed (i.e. not when importing this module)"""
     choices = []
     for cmap_name in get_colormap_list():
         choices.append((cmap_name, cmap_name, build_icon_from_cmap_name))
@@ -963,7 +966,7 @@ class BaseImageParam(DataSet):
     alpha = FloatItem(_("Global alpha"), default=1.0, min=0, max=1,
                       help=_("Global alpha value"))
     _hide_colormap = False
-    colormap = ImageChoiceItem(_("Colormap"), _create_choices(), default="jet"
+    colormap = ImageChoiceItem(_("Colormap"), _create_choices, default="jet"
                                ).set_prop("display",
                                       hide=GetAttrProp("_hide_colormap"))
     
@@ -1023,7 +1026,7 @@ class QuadGridParam(DataSet):
     alpha = FloatItem(_("Global alpha"), default=1.0, min=0, max=1,
                       help=_("Global alpha value"))
     _hide_colormap = False
-    colormap = ImageChoiceItem(_("Colormap"), _create_choices(), default="jet"
+    colormap = ImageChoiceItem(_("Colormap"), _create_choices, default="jet"
                                ).set_prop("display",
                                       hide=GetAttrProp("_hide_colormap"))
     
@@ -1120,7 +1123,7 @@ class ImageParam(RawImageParam):
         if image.is_empty():
             shape = (0, 0)
         else:
-            shape = image.data.shape
+            shape = image.get_data_shape()
         self.xmax = image.xmax
         if self.xmax is None:
             self.xmax = float(shape[1])
@@ -19,6 +19,7 @@ from guidata.qt.QtGui import QApplication
 
 from guiqwt.plot import CurveWindow, ImageWindow
 from guiqwt.builder import make
+from guiqwt.curve import PolygonMapItem
 
 
 class BaseBM(object):
@@ -92,6 +93,34 @@ class ErrorBarBM(CurveBM):
         else:
             return x, y, x/100., x/20.
 
+def make_polygonmap(points, offsets, colors):
+    item = PolygonMapItem()
+    item.set_data(points, offsets, colors)
+    return item
+
+class PolygonMapBM(BaseBM):
+    MAKE_FUNC = staticmethod(make_polygonmap)
+    WIN_CLASS = CurveWindow
+    
+    def __init__(self, name, nsamples, npolygons=1000, **options):
+        super(PolygonMapBM, self).__init__(name, nsamples, **options)
+        self.npolygons = npolygons
+    
+    def compute_data(self):
+        nseg = int(self.nsamples/self.npolygons)
+        th = np.linspace(0, 2*np.pi, nseg)
+        centers = np.random.rand(self.npolygons, 2)*10
+        points = np.empty((self.npolygons, nseg, 2), float)
+        points[..., 0] = centers[:, :1]+.5*np.cos(th)
+        points[..., 1] = centers[:, 1:]+.5*np.sin(th)
+        offsets = np.zeros((self.npolygons, 2), np.int32)
+        offsets[:, 0] = np.arange(self.npolygons)
+        offsets[:, 1] = np.arange(self.npolygons)*nseg
+        colors = np.zeros((self.npolygons, 2), np.uint32)
+        colors[:, 0] = 0xff000000
+        colors[:, 1] = 0x8000ff00
+        return points.reshape(-1, 2), offsets, colors
+
 class ImageBM(BaseBM):
     MAKE_FUNC = make.image
     WIN_CLASS = ImageWindow
@@ -137,6 +166,7 @@ def run():
     close = True
     for benchmark in (
           CurveBM('Simple curve', 5e6),
+          CurveBM('Simple curve (level-of-detail mode)', 5e6, lod=True),
           CurveBM('Curve with markers', 2e5,
                   marker="Ellipse", markersize=10),
           CurveBM('Curve with sticks', 1e6,
@@ -145,6 +175,7 @@ def run():
           ErrorBarBM('Error bar curve (horizontal and vertical bars)', 1e4,
                      dx=True),
           HistogramBM('Simple histogram', 1e6, bins=1e5),
+          PolygonMapBM('Polygon map', 1e6),
           PColorBM('Polar pcolor', 1e3),
           ImageBM('Simple image', 7e3, interpolation='antialiasing'),
                      ):
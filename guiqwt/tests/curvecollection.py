@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2009-2011 CEA
+# Pierre Raybaut
+# Licensed under the terms of the CECILL License
+# (see guiqwt/__init__.py for details)
+
+"""Curve collection test (many traces sharing the same X data)"""
+
+SHOW = True # Show test in GUI-based test launcher
+
+import numpy as np
+
+from guiqwt.plot import CurveDialog
+from guiqwt.curve import CurveCollectionItem
+from guiqwt.styles import CurveParam
+
+def test():
+    """Test"""
+    # -- Create QApplication
+    import guidata
+    _app = guidata.qapplication()
+    # --
+    x = np.linspace(0, 10, 100000)
+    phases = np.linspace(0, np.pi, 200)[:, np.newaxis]
+    y = np.sin(x+phases)+.05*np.random.randn(phases.size, x.size)
+    win = CurveDialog(edit=False, toolbar=True,
+                      wintitle="Curve collection (200 traces x 100000 points)")
+    plot = win.get_plot()
+    param = CurveParam(title="Traces", icon='curve.png')
+    item = CurveCollectionItem(param, cmap_name="jet")
+    item.set_data(x, y)
+    plot.add_item(item)
+    win.show()
+    win.exec_()
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2009-2010 CEA
+# Pierre Raybaut
+# Licensed under the terms of the CECILL License
+# (see guiqwt/__init__.py for details)
+
+"""Empty curves test: curves without data (e.g. cross section or contrast 
+adjustment panels before an image is shown) must not break plot autoscale"""
+
+SHOW = False # Show test in GUI-based test launcher
+
+from guiqwt.plot import CurveDialog
+from guiqwt.curve import CurveItem, ErrorBarCurveItem
+from guiqwt.builder import make
+
+def test():
+    """Test"""
+    # -- Create QApplication
+    import guidata
+    _app = guidata.qapplication()
+    # --
+    win = CurveDialog(edit=False, toolbar=True, wintitle="Empty curves test")
+    plot = win.get_plot()
+    items = [CurveItem(), ErrorBarCurveItem(), make.curve([], [])]
+    for item in items:
+        assert item.boundingRect().isEmpty()
+        plot.add_item(item)
+    plot.do_autoscale()
+    plot.replot()
+    print("Empty curves: OK")
+
+if __name__ == "__main__":
+    test()
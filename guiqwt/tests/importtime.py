@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2009-2010 CEA
+# Pierre Raybaut
+# Licensed under the terms of the CECILL License
+# (see guiqwt/__init__.py for details)
+
+"""guiqwt import time budget test (requires Python >= 3.7)"""
+
+from __future__ import print_function
+
+SHOW = False # Show test in GUI-based test launcher
+
+import sys
+import subprocess
+
+MODULE = "guiqwt.plot"
+IMPORT_TIME_BUDGET = 1.5 # Maximum cumulative import time of MODULE (s)
+
+# Modules which are loaded on first use, and not when importing MODULE:
+LAZY_MODULES = ("guiqwt._cm", "guiqwt.histogram", "guiqwt.cross_section",
+                "guiqwt.builder", "guiqwt.widgets", "scipy", "PIL", "pydicom",
+                "dicom")
+
+def get_import_times(modname):
+    """Import module `modname` in a new Python interpreter and return a
+    dictionary: module name --> cumulative import time (in seconds),
+    as reported by `python -X importtime`"""
+    proc = subprocess.Popen([sys.executable, "-X", "importtime", "-c",
+                             "import %s" % modname],
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    _out, err = proc.communicate()
+    err = err.decode("utf-8", "replace")
+    if proc.returncode:
+        raise RuntimeError("Unable to import %s:\n%s" % (modname, err))
+    times = {}
+    for line in err.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        try:
+            times[name.strip()] = int(cumulative_us)*1e-6
+        except ValueError:
+            # Header line
+            continue
+    return times
+
+def test():
+    """Test"""
+    if sys.version_info < (3, 7):
+        print("Skipping test: `python -X importtime` requires Python >= 3.7")
+        return
+    times = get_import_times(MODULE)
+    for name in sorted(times, key=times.get, reverse=True)[:15]:
+        print("%8.1f ms  %s" % (times[name]*1e3, name))
+    for lazy_name in LAZY_MODULES:
+        imported = [name for name in times
+                    if name == lazy_name or name.startswith(lazy_name+".")]
+        assert not imported,\
+               "%s should not be imported by %s" % (lazy_name, MODULE)
+    total = times[MODULE]
+    assert total < IMPORT_TIME_BUDGET,\
+           "Importing %s took %.2f s (budget: %.2f s)" % (MODULE, total,
+                                                          IMPORT_TIME_BUDGET)
+    print("Importing %s: %.1f ms (budget: %.1f ms)" % (MODULE, total*1e3,
+                                                       IMPORT_TIME_BUDGET*1e3))
+
+if __name__ == "__main__":
+    test()
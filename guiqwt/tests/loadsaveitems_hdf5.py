@@ -19,9 +19,10 @@ from guiqwt.tests.loadsaveitems_pickle import IOTest
 
 class HDF5Test(IOTest):
     FNAME = "loadsavecanvas.h5"
+    LAZY = False
     def restore_items(self):
         reader = HDF5Reader(self.FNAME)
-        self.plot.deserialize(reader)
+        self.plot.deserialize(reader, lazy=self.LAZY)
         reader.close()
     
     def save_items(self):
@@ -29,9 +30,14 @@ class HDF5Test(IOTest):
         self.plot.serialize(writer)
         writer.close()
 
+class LazyHDF5Test(HDF5Test):
+    # Image data is read from file only when images are drawn:
+    LAZY = True
+
 
 if __name__ == "__main__":
     import guidata
     _app = guidata.qapplication()
-    test = HDF5Test()
-    test.run()
+    for klass in (HDF5Test, LazyHDF5Test):
+        test = klass()
+        test.run()
@@ -23,6 +23,7 @@ import numpy as np
 from guiqwt.plot import ImageDialog
 from guiqwt.builder import make
 from guiqwt.shapes import PolygonShape, Axes
+from guiqwt.curve import StreamingCurveItem
 from guiqwt.tools import LoadItemsTool, SaveItemsTool, ImageMaskTool
 
 
@@ -30,7 +31,11 @@ def build_items():
     x = np.linspace(-10, 10, 200)
     y = np.sin(np.sin(np.sin(x)))
     filename = osp.join(osp.dirname(__file__), "brain.png")
+    # Streaming curve: capacity (150) is smaller than default one
+    streaming = StreamingCurveItem(capacity=150)
+    streaming.set_data(x, np.cos(x))
     items = [ 
+              streaming,
               make.curve(x, y, color="b"),
               make.image(filename=filename),
               make.trimage(filename=filename),
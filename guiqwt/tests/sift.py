@@ -709,18 +709,12 @@ class SignalFT(ObjectFT):
             os.chdir(osp.dirname(filename))
             signal = SignalParam()
             signal.title = filename
+            from guiqwt import io
             try:
                 if osp.splitext(filename)[1] == ".npy":
                     xydata =np.load(filename)
                 else:
-                    for delimiter in ('\t', ',', ' ', ';'):
-                        try:
-                            xydata = np.loadtxt(filename, delimiter=delimiter)
-                            break
-                        except ValueError:
-                            continue
-                    else:
-                        raise
+                    xydata = io.read_text_array(filename)
                 assert len(xydata.shape) in (1, 2), "Data not supported"
             except Exception as msg:
                 import traceback
@@ -756,8 +750,9 @@ class SignalFT(ObjectFT):
             filename = to_text_string(filename)
             os.chdir(osp.dirname(filename))
             obj = self.objects[row]
+            from guiqwt import io
             try:
-                np.savetxt(filename, obj.xydata, delimiter=',')
+                io.write_text_array(filename, obj.xydata, delimiter=',')
             except Exception as msg:
                 import traceback
                 traceback.print_exc()
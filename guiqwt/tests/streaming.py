@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2009-2011 CEA
+# Pierre Raybaut
+# Licensed under the terms of the CECILL License
+# (see guiqwt/__init__.py for details)
+
+"""Streaming curve test (oscilloscope-like display)"""
+
+SHOW = True # Show test in GUI-based test launcher
+
+import numpy as np
+
+from guidata.qt.QtCore import QTimer
+
+from guiqwt.plot import CurveDialog
+from guiqwt.curve import StreamingCurveItem
+from guiqwt.styles import CurveParam
+
+def test():
+    """Test"""
+    # -- Create QApplication
+    import guidata
+    _app = guidata.qapplication()
+    # --
+    win = CurveDialog(edit=False, toolbar=True,
+                      wintitle="Streaming curve (50 Hz refresh)")
+    plot = win.get_plot()
+    param = CurveParam(title="Signal", icon='curve.png')
+    param.line.color = "#0000ff"
+    item = StreamingCurveItem(capacity=20000, curveparam=param)
+    item.update_params()
+    item.set_autoscroll(True)
+    plot.add_item(item)
+    plot.set_axis_limits("left", -1.5, 1.5)
+    
+    state = {'t0': 0.}
+    def add_samples():
+        t = state['t0']+np.arange(200)*1e-4
+        state['t0'] = t[-1]+1e-4
+        item.append(t, np.sin(2*np.pi*5*t)+.1*np.random.randn(t.size))
+        plot.replot()
+    timer = QTimer(win)
+    timer.timeout.connect(add_samples)
+    timer.start(20)
+    
+    win.show()
+    win.exec_()
+
+if __name__ == "__main__":
+    test()
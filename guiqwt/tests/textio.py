@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2009-2010 CEA
+# Pierre Raybaut
+# Licensed under the terms of the CECILL License
+# (see guiqwt/__init__.py for details)
+
+"""Text array I/O test: comparing io.read_text_array with np.loadtxt"""
+
+from __future__ import print_function
+
+SHOW = False # Show test in GUI-based test launcher
+
+import os
+import tempfile
+import numpy as np
+
+from guiqwt.io import read_text_array, write_text_array, _read_text_chunks
+
+# Text data (with delimiter) expected to be parsed as np.loadtxt does:
+VALID_DATA = (("1 2\n3 4\n\n5 6\n", None),
+              ("1\t2\n3\t4", '\t'),
+              ("1,2\r\n3,4\r\n", ','),
+              ("# Comment\n1 2\n3 4\n", None))
+# Irregular rows: np.loadtxt raises "number of columns changed"
+RAGGED_DATA = ("1 2\n3 4 5\n6\n", "1,2\n3,4,5\n6\n", "1,,2\n3,4,5\n")
+
+def read_text(text, func, **kwargs):
+    """Write `text` to a temporary file and read it with `func`"""
+    fd, fname = tempfile.mkstemp(suffix=".txt")
+    try:
+        with os.fdopen(fd, 'wb') as fobj:
+            fobj.write(text.encode('ascii'))
+        return func(fname, **kwargs)
+    finally:
+        os.remove(fname)
+
+def test():
+    """Test"""
+    for text, delimiter in VALID_DATA:
+        assert np.array_equal(read_text(text, read_text_array),
+                              read_text(text, np.loadtxt,
+                                        delimiter=delimiter)), repr(text)
+    for text in RAGGED_DATA:
+        try:
+            arr = read_text(text, read_text_array)
+        except ValueError:
+            continue
+        raise AssertionError("Ragged rows %r were read as:\n%r" % (text, arr))
+    # Chunked parser (used with NumPy < 1.23): returns None when it can't 
+    # parse data exactly as np.loadtxt does
+    for text, delimiter in VALID_DATA:
+        arr = read_text(text, _read_text_chunks, delimiter=delimiter)
+        assert arr is None or np.array_equal(arr, read_text(text, np.loadtxt,
+                                        delimiter=delimiter)), repr(text)
+    for text in RAGGED_DATA:
+        delimiter = ',' if ',' in text else None
+        assert read_text(text, _read_text_chunks,
+                         delimiter=delimiter) is None, repr(text)
+    arr = np.random.rand(1000, 3)
+    fd, fname = tempfile.mkstemp(suffix=".txt")
+    os.close(fd)
+    try:
+        write_text_array(fname, arr)
+        assert np.array_equal(read_text_array(fname), arr)
+    finally:
+        os.remove(fname)
+    print("Text array I/O: OK")
+
+if __name__ == "__main__":
+    test()
@@ -280,7 +280,7 @@ from guiqwt.annotations import (AnnotatedRectangle, AnnotatedCircle,
 from guiqwt.colormap import get_colormap_list, get_cmap, build_icon_from_cmap
 from guiqwt.interfaces import (IColormapImageItemType, IPlotManager,
                                IVoiImageItemType, IStatsImageItemType,
-                               ICurveItemType)
+                               ICurveItemType, IExportROIImageItemType)
 from guiqwt.panels import ID_XCS, ID_YCS, ID_OCS, ID_ITEMLIST, ID_CONTRAST
 
 
@@ -1209,14 +1209,12 @@ class SignalStatsTool(BaseCursorTool):
             from guiqwt.builder import make
             self.label = make.computations(self.shape, "TL",
               [
-               (curve, "%g &lt; x &lt; %g", 
-                lambda *args: (args[0].min(), args[0].max())),
-               (curve, "%g &lt; y &lt; %g", 
-                lambda *args: (args[1].min(), args[1].max())),
-               (curve, "&lt;y&gt;=%g", lambda *args: args[1].mean()),
-               (curve, "σ(y)=%g", lambda *args: args[1].std()),
-               (curve, "∑(y)=%g", lambda *args: np.trapz(args[1])),
-               (curve, "∫ydx=%g", lambda *args: np.trapz(args[1], args[0])),
+               (curve, "%g &lt; x &lt; %g", "xrange"),
+               (curve, "%g &lt; y &lt; %g", "yrange"),
+               (curve, "&lt;y&gt;=%g", "mean"),
+               (curve, "σ(y)=%g", "std"),
+               (curve, "∑(y)=%g", "trapz"),
+               (curve, "∫ydx=%g", "integral"),
               ])
             self.label.attach(plot)
             self.label.setZ(plot.get_max_z()+1)
@@ -1530,6 +1528,10 @@ class CopyToClipboardTool(CommandTool):
         plot.copy_to_clipboard()
 
 
+# Snapshots larger than this (in pixels) are exported tile by tile to TIFF
+# files (NumPy arrays are always exported tile by tile)
+SNAPSHOT_TILED_MIN_PIXELS = 8192**2
+
 def save_snapshot(plot, p0, p1, new_size=None):
     """
     Save rectangular plot area
@@ -1537,7 +1539,7 @@ def save_snapshot(plot, p0, p1, new_size=None):
     new_size: destination image size (tuple: (width, height))
     """
     from guiqwt.image import (get_image_from_plot, get_plot_qrect,
-                              get_items_in_rectangle,
+                              get_items_in_rectangle, export_imageitems,
                               compute_trimageitems_original_size)
     from guiqwt import io
     items = get_items_in_rectangle(plot, p0, p1)
@@ -1584,17 +1586,37 @@ def save_snapshot(plot, p0, p1, new_size=None):
     else:
         destw, desth = dlg.width, dlg.height
     
+    dtype = None
+    for item in items:
+        if dtype is None or item.data.dtype.itemsize > dtype.itemsize:
+            dtype = item.data.dtype
+
+    fname, _f = getsavefilename(plot,  _("Save as"), _('untitled'),
+                   io.iohandler.get_filters('save', dtype, template=True))
+    _base, ext = osp.splitext(fname)
+    if not fname:
+        return
+
+    if io.supports_tiled_write(fname) and (ext.lower() == ".npy" or
+                                   destw*desth > SNAPSHOT_TILED_MIN_PIXELS):
+        # Large snapshots are rendered and written tile by tile: peak memory
+        # usage is then bounded by the tile size
+        export_items = plot.get_items(item_type=IExportROIImageItemType)
+        export_imageitems(fname, export_items, get_plot_qrect(plot, p0, p1),
+                          destw, desth,
+                          dtype=dtype, norm_range=param.norm_range,
+                          add_images=param.add_images,
+                          apply_lut=param.apply_contrast,
+                          apply_interpolation=param.apply_interpolation,
+                          original_resolution=dlg.keep_original_size)
+        return
+
     try:
         data = get_image_from_plot(plot, p0, p1, destw=destw, desth=desth,
                                add_images=param.add_images,
                                apply_lut=param.apply_contrast,
                                apply_interpolation=param.apply_interpolation,
                                original_resolution=dlg.keep_original_size)
-    
-        dtype = None
-        for item in items:
-            if dtype is None or item.data.dtype.itemsize > dtype.itemsize:
-                dtype = item.data.dtype
         if param.norm_range:
             data = io.scale_data_to_dtype(data, dtype=dtype)
         else:
@@ -1612,13 +1634,8 @@ def save_snapshot(plot, p0, p1, new_size=None):
             break
     else:
         model_fname = None
-    fname, _f = getsavefilename(plot,  _("Save as"), _('untitled'),
-                   io.iohandler.get_filters('save', data.dtype, template=True))
-    _base, ext = osp.splitext(fname)
     options = {}
-    if not fname:
-        return
-    elif ext.lower() == ".png":
+    if ext.lower() == ".png":
         options.update(dict(dtype=np.uint8, max_range=True))
     elif ext.lower() == ".dcm":
         try:
@@ -1911,8 +1928,9 @@ def export_curve_data(item):
         title += (' (%s)' % item.curveparam.label)
     fname, _f = getsavefilename(plot, title, "", _("Text file")+" (*.txt)")
     if fname:
+        from guiqwt import io
         try:
-            np.savetxt(to_text_string(fname), data, delimiter=',')
+            io.write_text_array(to_text_string(fname), data, delimiter=',')
         except RuntimeError as error:
             QMessageBox.critical(plot, _("Export"),
                                  _("Unable to export item data.")+\
@@ -419,9 +419,14 @@ static bool scale_src_dst_interp(Params& p, PixelScale& pixel_scale, Interp& int
 
     Array2D<ST> src(p.p_src);
     Array2D<DT> dst(p.p_dst);
-    
+
+    /* Arguments have all been parsed at this point and the arrays are kept
+       alive by the caller's argument tuple: the kernel itself does not
+       touch any Python object, so other threads may run meanwhile */
+    Py_BEGIN_ALLOW_THREADS
     _scale_rgb(dst, src, pixel_scale, p.trans,
 	       p.dx1, p.dy1, p.dx2, p.dy2, interp);
+    Py_END_ALLOW_THREADS
     return true;
 }
 
@@ -713,6 +718,154 @@ static PyObject *py_scale_rect(PyObject *self, PyObject *args)
 
 
 
+/* Averaged section:
+   walks the destination grid (width x height, through a linear transform of
+   the source image) row by row and computes the NaN-aware mean of each row,
+   without storing the resampled image
+*/
+class AverageSection {
+public:
+    AverageSection(PyArrayObject *_src, PyArrayObject *_res,
+		   PyArrayObject *_mask, LinearTransform& _tr,
+		   int _width, int _interpolation):p_src(_src), p_res(_res),
+						   p_mask(_mask), tr(_tr),
+						   width(_width),
+						   interpolation(_interpolation) {
+    }
+
+    template<class T> void run() {
+	if (interpolation==INTERP_LINEAR) {
+	    LinearInterpolation<T, LinearTransform> interp;
+	    compute<T>(interp);
+	} else {
+	    NearestInterpolation<T, LinearTransform> interp;
+	    compute<T>(interp);
+	}
+    }
+
+    bool is_masked(const Array2D<npy_bool>& mask,
+		   const LinearTransform::point& p) const {
+	int nx = p.ix();
+	int ny = p.iy();
+	if (mask.value(nx, ny)) return true;
+	if (interpolation!=INTERP_LINEAR) return false;
+	// Linear interpolation: neighbour pixels are also involved
+	int nx1 = nx<mask.nj-1 ? nx+1 : nx;
+	int ny1 = ny<mask.ni-1 ? ny+1 : ny;
+	return mask.value(nx1, ny) || mask.value(nx, ny1) ||
+	    mask.value(nx1, ny1);
+    }
+
+    template<class T, class Interpolation>
+    void compute(Interpolation& interpolate) {
+	Array2D<T> src(p_src);
+	Array1D<npy_float64> res(p_res);
+	Array2D<npy_bool> mask;
+	if (p_mask) mask = Array2D<npy_bool>(p_mask);
+	int i, j, count;
+	double sum;
+	T val;
+	int round = fegetround();
+	LinearTransform::point p, p0;
+
+	fesetround(FE_TOWARDZERO);
+	tr.set(p0, 0, 0);
+	for(i=0;i<res.ni;++i) {
+	    p = p0;
+	    sum = 0.;
+	    count = 0;
+	    for(j=0;j<width;++j) {
+		if (p.inside() && !(p_mask && is_masked(mask, p))) {
+		    val = interpolate(src, tr, p);
+		    if (!isnan((double) val)) {
+			sum += val;
+			++count;
+		    }
+		}
+		tr.incx(p);
+	    }
+	    res.value(i) = count ? sum/count : Py_NAN;
+	    tr.incy(p0);
+	}
+	fesetround(round);
+    }
+    PyArrayObject *p_src, *p_res, *p_mask;
+    LinearTransform& tr;
+    int width, interpolation;
+};
+
+/* Input data :
+
+   SRC, TR, DST, WIDTH, INTERPOLATION [, MASK]
+
+   SRC : PyArrayObject (source image)
+   TR : transformation matrix (destination to source pixel coordinates)
+   DST : PyArrayObject (float64, 1-D): averaged section (its size is the
+         destination grid height)
+   WIDTH : destination grid width (number of averaged samples per row)
+   INTERPOLATION : INTERP_NEAREST or INTERP_LINEAR
+   MASK : PyArrayObject (bool, same shape as SRC): masked pixels are ignored
+*/
+static PyObject *py_average_section(PyObject *self, PyObject *args)
+{
+    PyArrayObject *p_src=0, *p_tr=0, *p_dst=0, *p_mask=0;
+    int width, interpolation;
+
+    if (!PyArg_ParseTuple(args, "OOOii|O:_average_section",
+			  &p_src, &p_tr, &p_dst, &width, &interpolation,
+			  &p_mask)) {
+	return NULL;
+    }
+    if ((PyObject*)p_mask==Py_None) p_mask=0;
+    if (!check_array_2d("src", p_src, -1) ||
+	!check_dispatch_type("src", p_src) ||
+	!check_transform(p_tr)) {
+	return NULL;
+    }
+    if (!PyArray_Check(p_dst) || p_dst->nd!=1 ||
+	PyArray_TYPE(p_dst)!=NPY_FLOAT64) {
+	PyErr_SetString(PyExc_TypeError, "dst must be a 1-D float64 array");
+	return NULL;
+    }
+    if (p_mask) {
+	if (!check_array_2d("mask", p_mask, NPY_BOOL)) {
+	    return NULL;
+	}
+	if (PyArray_DIM(p_mask, 0)!=PyArray_DIM(p_src, 0) ||
+	    PyArray_DIM(p_mask, 1)!=PyArray_DIM(p_src, 1)) {
+	    PyErr_SetString(PyExc_ValueError, "mask and src shapes differ");
+	    return NULL;
+	}
+    }
+    if (interpolation!=INTERP_NEAREST && interpolation!=INTERP_LINEAR) {
+	PyErr_SetString(PyExc_ValueError, "Unsupported interpolation type");
+	return NULL;
+    }
+
+    int ni = PyArray_DIM(p_src, 0);
+    int nj = PyArray_DIM(p_src, 1);
+    Array2D<double>  tr(p_tr);
+    LinearTransform trans(nj, ni,
+			  tr.value(2,0), tr.value(2,1),  // x0, y0
+			  tr.value(0,0), tr.value(1,0),  // xx, xy
+			  tr.value(0,1), tr.value(1,1)  // yx, yy
+	);
+    AverageSection section(p_src, p_dst, p_mask, trans, width, interpolation);
+    /* Hold our own references on the arrays while the GIL is released */
+    Py_INCREF(p_src);
+    Py_INCREF(p_dst);
+    Py_XINCREF(p_mask);
+    Py_BEGIN_ALLOW_THREADS
+    dispatch_array(PyArray_TYPE(p_src), section);
+    Py_END_ALLOW_THREADS
+    Py_DECREF(p_src);
+    Py_DECREF(p_dst);
+    Py_XDECREF(p_mask);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+
 class Histogram {
 public:
     Histogram(PyArrayObject *_data, PyArrayObject *_bins,
@@ -775,6 +928,8 @@ static PyMethodDef _meths[] = {
      "Linear rescale of source to destination parallel to axes"},
     {"_scale_quads",  py_scale_quads, METH_VARARGS,
      "Linear rescale of a structured grid to destination parallel to axes"},
+    {"_average_section",  py_average_section, METH_VARARGS,
+     "Averaged section of source through a linear transformation"},
     {"_histogram", py_histogram, METH_VARARGS,
      "Compute histogram of 1d data"},
     {"_line_test", py_vert_line, METH_VARARGS,